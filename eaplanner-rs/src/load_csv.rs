@@ -128,3 +128,21 @@ pub fn load_schedule(path: &Path) -> Schedule {
 
     schedule
 }
+
+pub fn load_chromosomes(filepath: &Path) -> Vec<Vec<f32>> {
+    let mut chromosomes = Vec::new();
+    let mut rdr = csv::ReaderBuilder::new()
+        .has_headers(false)
+        .from_path(filepath)
+        .unwrap();
+
+    for result in rdr.records() {
+        let record = result.unwrap();
+        let chromosome = record
+            .iter()
+            .map(|s| s.parse::<f32>().unwrap())
+            .collect::<Vec<f32>>();
+        chromosomes.push(chromosome);
+    }
+    chromosomes
+}
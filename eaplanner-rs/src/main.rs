@@ -55,6 +55,12 @@ struct Args {
     #[clap(long, default_value = "./")]
     save_path: String,
 
+    // evaluate the chromosomes in this csv instead of running an algorithm
+    #[clap(long)]
+    evaluate: Option<String>,
+    #[clap(long, default_value = "scores.csv")]
+    scores_path: String,
+
     // pso hyperparameters
     #[clap(long, default_value_t = -2.0)]
     smin: f32,
@@ -93,6 +99,16 @@ fn main() {
     println!("Starting penalty: {}", start_penalty);
     println!("Starting makespan: {}", start_makespan);
 
+    if let Some(chromosomes_path) = &args.evaluate {
+        let mut interpreter = AbsoluteScheduleInterpreter::new(schedule);
+        evaluate(
+            &mut interpreter,
+            Path::new(chromosomes_path),
+            Path::new(&args.scores_path),
+        );
+        return;
+    }
+
     let interpreter = Box::new(AbsoluteScheduleInterpreter::new(schedule));
 
     let mut optimizer: Box<dyn Algorithm>;
@@ -138,6 +154,32 @@ fn main() {
     );
 }
 
+fn evaluate(interpreter: &mut dyn Interpreter, chromosomes_path: &Path, scores_path: &Path) {
+    let chromosomes = load_csv::load_chromosomes(chromosomes_path);
+
+    // only the evaluations are timed, not loading and writing
+    let now = std::time::Instant::now();
+    let scores = chromosomes
+        .iter()
+        .map(|chromosome| {
+            interpreter.interpret(chromosome);
+            interpreter.get_scores()
+        })
+        .collect::<Vec<Vec<i32>>>();
+    let elapsed = now.elapsed();
+
+    let mut wtr = csv::Writer::from_path(scores_path).unwrap();
+    wtr.write_record(["penalty", "makespan"]).unwrap();
+    for score in scores.iter() {
+        wtr.write_record(score.iter().map(|s| s.to_string()))
+            .unwrap();
+    }
+    wtr.flush().unwrap();
+
+    println!("Evaluations: {}", scores.len());
+    println!("Evaluation seconds: {}", elapsed.as_secs_f64());
+}
+
 fn get_shc(
     args: Args,
     interpreter: Box<dyn Interpreter>,
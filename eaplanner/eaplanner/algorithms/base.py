@@ -1,22 +1,30 @@
 import csv
+import hashlib
 import json
+import os
 import pickle
 import shutil
 from abc import abstractmethod
 from datetime import datetime
-from functools import partial
 from pathlib import Path
-from time import sleep
+from time import monotonic, perf_counter_ns, process_time, sleep
+from typing import Any, Sequence
 
 import numpy as np
 import numpy.typing as npt
-import pandas as pd
-from deap import tools
+from deap import creator, tools
 from deap.base import Toolbox
 from deap.tools import HallOfFame
 
+from eaplanner.algorithms.hooks import Hook, Progress
+from eaplanner.algorithms.termination import Termination
 from eaplanner.interpreter import ScheduleInterpreterBase
+from eaplanner.logbook import Logbook
+from eaplanner.manifest import MANIFEST_PATH, RunManifest
+from eaplanner.memory import MemoryProfiler
+from eaplanner.timing import PhaseTimer
 from eaplanner.utils import pareto_rank, rank_lexicographic
+from eaplanner.writer import BackgroundWriter, SynchronousWriter
 
 # Type hint that denotes a numpy array containing floats
 Individual = npt.NDArray[np.float64]
@@ -34,18 +42,66 @@ class AlgorithmBase:
         save: bool = False,
         save_population: bool = False,
         folder: str | None = None,
+        checkpoint_every: int | None = None,
+        checkpoint_interval: float | None = None,
+        resume_from: str | Path | None = None,
+        background_io: bool = True,
+        manifest: str | Path | None = MANIFEST_PATH,
+        logbook_format: str = "csv",
+        task: str | None = None,
+        termination: Sequence[Termination] = (),
+        rng: np.random.Generator | np.random.SeedSequence | int | None = None,
+        hooks: Sequence[Hook] = (),
+        memory_every: int | None = None,
     ):
         self.toolbox = toolbox
         self.interpreter = interpreter
         self.max_evaluations = max_evaluations
+        # every random draw of the run comes from this generator, share the
+        # same generator with the operators registered in the toolbox. Threads
+        # of a parallel map draw from it in no fixed order, a run is only
+        # reproduced when the map is not parallel
+        self.rng = np.random.default_rng(rng)
         self.interpreter.repair_pct = repair_pct
+        self.interpreter.rng = self.rng
         self.halloffame = halloffame
         self.verbose = verbose
         self.save_population = save_population
-
-        self.stats = self.statistics()
-
-        if save:
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.resume_from = Path(resume_from) if resume_from is not None else None
+        self.background_io = background_io
+        self.manifest = Path(manifest) if manifest is not None else None
+        self.logbook_format = logbook_format
+        self.task = task
+        self.termination = list(termination)
+        self.stop_reason: str | None = None
+        # views for the hooks are only made when there are hooks
+        self.hooks = list(hooks)
+        self._hook_stop: str | None = None
+        self._best_wvalues: tuple[float, ...] | None = None
+        self.memory = MemoryProfiler(memory_every) if memory_every else None
+        # set by the island model to exchange individuals with other islands
+        self.migration = None
+        self._writer = SynchronousWriter()
+
+        self.gen = 0
+        self.current_evals = 0
+        self._last_checkpoint = monotonic()
+
+        # instance and timing information for the manifest
+        self.run_info: dict[str, Any] = {}
+        self._wall_time = 0.0
+        self._cpu_time = 0.0
+        self._run_started = monotonic()
+        self._cpu_started = process_time()
+        self.timer = PhaseTimer()
+
+        if self.resume_from is not None:
+            # Continue writing into the folder of the interrupted run
+            self.folder = self.resume_from
+            self.instance_name = self.folder.parent.name
+        elif save:
             # Create a unique folder for the results
             while True:
                 runtime = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -65,45 +121,242 @@ class AlgorithmBase:
         else:
             self.folder = None
 
-        self._current_patience = 0
+        if self.resume_from is None:
+            self.instance_name = folder
 
     def create_population(self, n: int) -> list[Individual]:
         return self.toolbox.population(n)  # type: ignore
 
-    @staticmethod
-    def statistics():
-        stats = tools.Statistics(lambda ind: ind.fitness.values)  # type: ignore
-        stats.register("avg", partial(np.mean, axis=0))
-        stats.register("std", partial(np.std, axis=0))
-        stats.register("min", partial(np.min, axis=0))
-        stats.register("max", partial(np.max, axis=0))
+    def run(self):
+        self._start_run()
 
-        return stats
+        try:
+            if self.resume_from is not None:
+                population = self._load_checkpoint()
+            else:
+                population = self._initialize()
 
-    def run(self):
+            if self.hooks:
+                self._notify_start(population)
+
+            population = self._run_evolution_loop(population)
+            self._finish_run(population)
+        except BaseException:
+            # a write that failed because of the run's error should not hide it
+            self._close_run(raise_errors=False)
+            raise
+
+        self._close_run()
+
+        return population, self.logbook
+
+    def _start_run(self):
+        self._run_started = monotonic()
+        self._cpu_started = process_time()
+
+        if self.background_io:
+            self._writer = BackgroundWriter()
+
+        if self.memory is not None:
+            self.memory.start()
+
+    def _finish_run(self, population: list[Individual]):
+        if self._checkpoints_enabled:
+            self._save_checkpoint(population)
+
+        if self.hooks:
+            self._notify_finish(population)
+
+        self._merge_populations()
+        self._save_logbook()
+        self._save_solution()
+        self._save_manifest()
+
+    def _close_run(self, raise_errors: bool = True):
+        # all results are on disk once run returns
+        try:
+            self._writer.close(raise_errors)
+        finally:
+            self._writer = SynchronousWriter()
+
+            if self.memory is not None:
+                self.memory.stop()
+
+    def _initialize(self) -> list[Individual]:
+        population = self._create_initial_population()
+        invalid_ind = self._evaluate(population)
+        self._end_initialization(population, len(invalid_ind))
+
+        return population
+
+    def _create_initial_population(self) -> list[Individual]:
+        self.run_info = self._describe_instance()
+        self.run_info["task"] = self.task
         self._save_instance()
 
-        self.logbook = tools.Logbook()
-        self.logbook.header = ["gen", "nevals"] + self.stats.fields  # type: ignore
+        self.logbook = Logbook(
+            self.interpreter.score_names, extra=("time", *self.timer.columns)
+        )
 
+        start = perf_counter_ns()
         population = self._create_population()
-        invalid_ind = self._evaluate(population)
+        self.timer.stop("variation", start)
+
+        return population
 
-        evals = len(invalid_ind)
+    def _end_initialization(self, population: list[Individual], evals: int):
         self.current_evals = evals
         self._update_halloffame(population)
-        self._update_logbook(population, 0, evals)
         self._save_population(0, population)
+        self._update_logbook(population, 0, evals)
+        self._sample_memory(population)
 
-        population = self._run_evolution_loop(population)
+    def _run_evolution_loop(self, population: list[Individual]) -> list[Individual]:
+        while self.current_evals < self.max_evaluations:
+            if self._should_stop(population):
+                break
 
-        self._merge_populations()
-        self._save_logbook()
-        self._save_solution()
+            self.gen += 1
 
-        return population, self.logbook
+            start = perf_counter_ns()
+            offspring = self._vary(population)
+            self.timer.stop("variation", start)
+            invalid_ind = self._evaluate(offspring)
+            start = perf_counter_ns()
+            population = self._replace(population, offspring)
+            self.timer.stop("selection", start)
+
+            self._end_generation(population, offspring, len(invalid_ind))
+
+            if self.migration is not None:
+                self.migration.migrate(self, population)
+        else:
+            self.stop_reason = "max_evaluations"
+
+        return population
+
+    def _should_stop(self, population: list[Individual]) -> bool:
+        if self._hook_stop is not None:
+            self.stop_reason = self._hook_stop
+            return True
+
+        for criterion in self.termination:
+            if criterion.should_stop(self, population):
+                self.stop_reason = criterion.reason
+                return True
+
+        return False
+
+    def _end_generation(
+        self, population: list[Individual], offspring: list[Individual], evals: int
+    ):
+        self.current_evals += evals
+        self._update_halloffame(offspring)
+        self._save_population(self.gen, population)
+        self._update_logbook(population, self.gen, evals)
+
+        # checkpoints include the logbook, so their time is in the next record
+        self._checkpoint(population)
+        self._sample_memory(population)
+
+        if self.hooks:
+            self._notify_generation(population)
+
+    def _sample_memory(self, population: list[Individual]):
+        if self.memory is None or not self.memory.due(self.gen):
+            return
+
+        row, sites = self.memory.sample(self, population)
+        if self.folder:
+            self._writer.submit(MemoryProfiler.write, self.folder, row, sites)
+
+    def _progress(self, individuals: list[Individual]) -> Progress:
+        fitness = np.array([ind.fitness.values for ind in individuals])  # type: ignore
+        fitness.flags.writeable = False
+        best = None
+        if self.halloffame:
+            best = self.halloffame[0].fitness.values  # type: ignore
+
+        return Progress(
+            algorithm=self.__class__.__name__,
+            instance=self.instance_name,
+            gen=self.gen,
+            evaluations=self.current_evals,
+            max_evaluations=self.max_evaluations,
+            wall_time=self.wall_time,
+            cpu_time=self.cpu_time,
+            score_names=self.interpreter.score_names,
+            fitness=fitness,
+            phase_times=self.timer.summary(),
+            best=best,
+            stop_reason=self.stop_reason,
+        )
+
+    def _best_individual_wvalues(self, population: list[Individual]):
+        if self.halloffame:
+            return tuple(self.halloffame[0].fitness.wvalues)  # type: ignore
+
+        return max(tuple(ind.fitness.wvalues) for ind in population)  # type: ignore
+
+    def _notify_start(self, population: list[Individual]):
+        self._best_wvalues = self._best_individual_wvalues(population)
+        progress = self._progress(population)
+        for hook in self.hooks:
+            hook.on_start(progress)
+
+    def _notify_evaluated(self, individuals: list[Individual]):
+        # evaluations are counted at the end of the generation
+        progress = self._progress(individuals)
+        for hook in self.hooks:
+            hook.on_evaluate_batch(progress)
+
+    def _notify_generation(self, population: list[Individual]):
+        progress = self._progress(population)
+
+        best = self._best_individual_wvalues(population)
+        if self._best_wvalues is None or best > self._best_wvalues:
+            self._best_wvalues = best
+            for hook in self.hooks:
+                hook.on_improvement(progress)
+
+        for hook in self.hooks:
+            if hook.on_generation(progress) and self._hook_stop is None:
+                self._hook_stop = hook.reason
+
+    def _notify_finish(self, population: list[Individual]):
+        progress = self._progress(population)
+        for hook in self.hooks:
+            hook.on_finish(progress)
+
+    def _describe_instance(self) -> dict[str, Any]:
+        schedule = self.interpreter.schedule
+        groups = schedule.get_constraint_per_group()
+        scores = self.interpreter.get_scores()
+
+        return {
+            "instance": self.instance_name,
+            "instance_hash": hashlib.sha256(pickle.dumps(schedule)).hexdigest(),
+            "assignments": len(schedule.assignments),
+            "constraints": len(schedule.constraints),
+            "relation_constraints": len(groups["RelationConstraint"]),
+            "resource_constraints": len(groups["ResourceConstraint"]),
+            "date_constraints": len(groups["DateConstraint"]),
+            **{f"original_{s}": v for s, v in zip(self.interpreter.score_names, scores)},
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    @property
+    def wall_time(self) -> float:
+        return self._wall_time + monotonic() - self._run_started
+
+    @property
+    def cpu_time(self) -> float:
+        return self._cpu_time + process_time() - self._cpu_started
 
     def _evaluate(self, population: list[Individual]):
+        start = perf_counter_ns()
+        repair_ns = self.interpreter.repair_ns
+
         # Evaluate the individuals with an invalid fitness
         invalid_ind = [ind for ind in population if not ind.fitness.valid]  # type: ignore
         results = self.toolbox.map(self.toolbox.evaluate, invalid_ind)  # type: ignore
@@ -111,6 +364,14 @@ class AlgorithmBase:
             ind.fitness.values = fit  # type: ignore
             ind[:] = chromosone
 
+        # repairs in worker processes are not seen and count as evaluation
+        repair_ns = self.interpreter.repair_ns - repair_ns
+        self.timer.add("repair", repair_ns)
+        self.timer.add("evaluation", perf_counter_ns() - start - repair_ns)
+
+        if self.hooks and invalid_ind:
+            self._notify_evaluated(invalid_ind)
+
         return invalid_ind
 
     def _sort_lexicographically(self, population: list[Individual]) -> list[Individual]:
@@ -136,20 +397,39 @@ class AlgorithmBase:
 
     def _update_halloffame(self, population: list[Individual]):
         if self.halloffame is not None:
+            start = perf_counter_ns()
             self.halloffame.update(population)
+            self.timer.stop("halloffame", start)
 
     def _update_logbook(self, population: list[Individual], gen: int, n_evals: int):
+        start = perf_counter_ns()
         record = self._compile_stats(population)
-        self.logbook.record(gen=gen, nevals=n_evals, **record)
+        self.timer.stop("stats", start)
+        self.logbook.record(
+            gen=gen, nevals=n_evals, time=self.wall_time, **record, **self.timer.lap()
+        )
 
         if self.verbose:
-            print(self.logbook.stream)
+            self._writer.submit(print, self.logbook.stream)
 
     def _compile_stats(self, population: list[Individual]):
-        return self.stats.compile(population)
+        fitness = np.array([ind.fitness.values for ind in population])  # type: ignore
+
+        return {
+            "avg": fitness.mean(axis=0),
+            "min": fitness.min(axis=0),
+            "max": fitness.max(axis=0),
+            "std": fitness.std(axis=0),
+        }
 
     def _population_files_gen(self):
+        import pandas as pd
+
         if self.folder:
+            # a resumed run merges its new generations with the earlier ones
+            if (self.folder / "population.feather").exists():
+                yield pd.read_feather(self.folder / "population.feather")
+
             population_files = (self.folder / "population").glob("*.csv")
             for file in population_files:
                 df = pd.read_csv(file)
@@ -158,25 +438,24 @@ class AlgorithmBase:
 
     def _merge_populations(self, delete: bool = True):
         if self.folder and self.save_population:
+            self._writer.submit(self._write_merged_populations, delete)
+
+    def _write_merged_populations(self, delete: bool):
+        import pandas as pd
+
+        if self.folder:
             population = pd.concat(self._population_files_gen()).sort_values(by="gen")
             population.reset_index(drop=True).to_feather(
                 self.folder / "population.feather"
             )
 
-            if delete:
+            if delete and (self.folder / "population").exists():
                 shutil.rmtree(self.folder / "population")
 
     def _save_logbook(self):
         if self.folder:
-            df = pd.DataFrame(self.logbook)
-            score_names = self.interpreter.score_names
-
-            for stat in ["avg", "min", "max", "std"]:
-                for i, score_name in enumerate(score_names):
-                    df[f"{stat}_{score_name}"] = df[stat].apply(lambda x: x[i])
-
-            df.drop(columns=["avg", "min", "max", "std"], inplace=True)
-            df.to_csv(self.folder / "logbook.csv", index=False)
+            path = self.folder / f"logbook.{self.logbook_format}"
+            self._writer.submit(self.logbook.save, path)
 
     def _save_solution(self):
         if self.folder and self.halloffame:
@@ -184,33 +463,245 @@ class AlgorithmBase:
             scores = {
                 s: v for s, v in zip(self.interpreter.score_names, best.fitness.values)  # type: ignore
             }
-            solution = {"individual": best.tolist(), "scores": scores}
+            original_scores = {
+                s: self.run_info[f"original_{s}"]
+                for s in self.interpreter.score_names
+                if f"original_{s}" in self.run_info
+            }
+            solution = {
+                "individual": best.tolist(),
+                "scores": scores,
+                "original_scores": original_scores,
+                "task": self.task,
+                "stop_reason": self.stop_reason,
+                "phase_times": self.timer.summary(),
+            }
+
+            self._writer.submit(self._write_json, self.folder / "solution.json", solution)
+
+    def _save_manifest(self):
+        if self.folder is None or self.manifest is None:
+            return
+
+        record = {
+            **self.run_info,
+            "folder": self.folder,
+            "algorithm": self.__class__.__name__,
+            "parameters": {**self.params(), **self.toolbox_params()},
+            "evaluations": self.current_evals,
+            "generations": self.gen,
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "stop_reason": self.stop_reason,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+        }
+        if self.halloffame:
+            best = self.halloffame[0]
+            for s, v in zip(self.interpreter.score_names, best.fitness.values):  # type: ignore
+                record[f"solution_{s}"] = v
+
+        self._writer.submit(self._write_manifest, self.manifest, record)
 
-            with (self.folder / "solution.json").open("w") as f:
-                json.dump(solution, f, indent=4)
+    @staticmethod
+    def _write_manifest(path: Path, record: dict[str, Any]):
+        RunManifest(path).append(record)
+
+    @staticmethod
+    def _write_json(path: Path, data: dict):
+        with path.open("w") as f:
+            json.dump(data, f, indent=4)
 
     def _save_population(self, gen: int, population: list[Individual]):
         if self.folder and self.save_population:
-            pop_dir = self.folder / "population"
-            pop_dir.mkdir(parents=True, exist_ok=True)
-
-            with open(pop_dir / f"{gen}.csv", mode="w+", newline="") as csv_file:
-                fieldnames = [f"gene_{i}" for i in range(len(population[0]))]
-                fieldnames.extend([f"score_{s}" for s in self.interpreter.score_names])
-                writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-                writer.writeheader()
-                for ind in population:
-                    row = {f"gene_{i}": gene for i, gene in enumerate(ind)}
-                    row.update({f"score_{s}": score for s, score in zip(self.interpreter.score_names, ind.fitness.values)})  # type: ignore
-                    writer.writerow(row)
+            start = perf_counter_ns()
+            # copies, the population keeps changing while the writer is busy
+            genes = np.array(population)
+            fitness = np.array([ind.fitness.values for ind in population])  # type: ignore
+
+            self._writer.submit(
+                self._write_population,
+                self.folder / "population" / f"{gen}.csv",
+                genes,
+                fitness,
+                self.interpreter.score_names,
+            )
+            self.timer.stop("saving", start)
+
+    @staticmethod
+    def _write_population(
+        path: Path, genes: np.ndarray, fitness: np.ndarray, score_names: tuple[str, ...]
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path, mode="w+", newline="") as csv_file:
+            fieldnames = [f"gene_{i}" for i in range(genes.shape[1])]
+            fieldnames.extend([f"score_{s}" for s in score_names])
+            writer = csv.writer(csv_file)
+            writer.writerow(fieldnames)
+            for ind, scores in zip(genes.tolist(), fitness.tolist()):
+                writer.writerow(ind + scores)
 
     def _save_instance(self):
         if self.folder and self.interpreter:
-            with (self.folder / "instance.pkl").open("wb") as f:
-                pickle.dump(self.interpreter, f)
+            # pickled right away, interpreting individuals changes the schedule
+            self._writer.submit(
+                self._write_bytes,
+                self.folder / "instance.pkl",
+                pickle.dumps(self.interpreter),
+            )
+
+    @staticmethod
+    def _write_bytes(path: Path, data: bytes):
+        # Write to a temporary file first so that a kill during writing never
+        # leaves a truncated file behind
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    @property
+    def _checkpoints_enabled(self):
+        return self.folder is not None and (
+            self.checkpoint_every is not None or self.checkpoint_interval is not None
+        )
+
+    @property
+    def checkpoint_path(self) -> Path | None:
+        if self.folder is None:
+            return None
+
+        return self.folder / "checkpoint.pkl"
+
+    def _checkpoint(self, population: list[Individual]):
+        if not self._checkpoints_enabled:
+            return
+
+        due = self.checkpoint_every is not None and self.gen % self.checkpoint_every == 0
+        due |= (
+            self.checkpoint_interval is not None
+            and monotonic() - self._last_checkpoint >= self.checkpoint_interval
+        )
+
+        if due:
+            start = perf_counter_ns()
+            self._save_checkpoint(population)
+            self.timer.stop("saving", start)
+
+    def _save_checkpoint(self, population: list[Individual]):
+        path = self.checkpoint_path
+        if path is None:
+            return
+
+        state = pickle.dumps(self._get_state(population))
+        self._writer.submit(self._write_bytes, path, state)
+
+        self._last_checkpoint = monotonic()
+
+    def _load_checkpoint(self) -> list[Individual]:
+        path = self.checkpoint_path
+        if path is None or not path.exists():
+            raise FileNotFoundError(f"No checkpoint found in {self.resume_from}")
+
+        state = pickle.loads(path.read_bytes())
+
+        if state["repr"] != repr(self):
+            raise ValueError(
+                f"Checkpoint was created by {state['repr']}, cannot resume with {self!r}"
+            )
+
+        population = self._individuals_from_state(state["population"])
+        self._set_state(state, population)
+
+        return population
+
+    def _get_state(self, population: list[Individual]) -> dict:
+        state = {
+            "repr": repr(self),
+            "gen": self.gen,
+            "current_evals": self.current_evals,
+            "population": self._individuals_to_state(population),
+            "halloffame": None,
+            "logbook": self.logbook,
+            "select": None,
+            "rng_state": self.rng.bit_generator.state,
+            "run_info": self.run_info,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "termination": [c.get_state() for c in self.termination],
+            "phase_times": dict(self.timer.total),
+        }
+
+        if self.halloffame is not None:
+            state["halloffame"] = self._individuals_to_state(self.halloffame.items)
+
+        # selNSGA3WithMemory keeps its ideal and nadir points between calls, the
+        # generator it may draw from is the one of the run
+        select = getattr(getattr(self.toolbox, "select", None), "func", None)
+        if isinstance(select, tools.selNSGA3WithMemory):
+            state["select"] = {k: v for k, v in vars(select).items() if k != "rng"}
+
+        return state
+
+    def _set_state(self, state: dict, population: list[Individual]):
+        self.gen = state["gen"]
+        self.current_evals = state["current_evals"]
+        self.logbook = state["logbook"]
+        self.run_info = state["run_info"]
+        # a resumed run keeps the task of the interrupted run unless given again
+        self.task = self.task or self.run_info.get("task")
+        self.run_info["task"] = self.task
+        self._wall_time = state["wall_time"]
+        for criterion, criterion_state in zip(
+            self.termination, state.get("termination", [])
+        ):
+            criterion.set_state(criterion_state)
+        self._cpu_time = state["cpu_time"]
+        self.timer.total.update(state.get("phase_times", {}))
+        self._run_started = monotonic()
+        self._cpu_started = process_time()
+
+        if self.halloffame is not None and state["halloffame"] is not None:
+            self.halloffame.clear()
+            for ind in self._individuals_from_state(state["halloffame"]):
+                self.halloffame.insert(ind)
+
+        if state["select"] is not None:
+            vars(self.toolbox.select.func).update(state["select"])  # type: ignore
+
+        if "rng_state" in state:
+            self.rng.bit_generator.state = state["rng_state"]
+
+    @staticmethod
+    def _individuals_to_state(individuals: list[Individual]) -> dict:
+        return {
+            "class": type(individuals[0]).__name__ if individuals else None,
+            "genes": np.array(individuals),
+            # kept as tuples to restore the exact value types of the fitness
+            "fitness": [ind.fitness.values for ind in individuals],  # type: ignore
+        }
+
+    @staticmethod
+    def _individuals_from_state(state: dict) -> list[Individual]:
+        if state["class"] is None:
+            return []
+
+        cls = getattr(creator, state["class"])
+        individuals = []
+        for genes, fitness in zip(state["genes"], state["fitness"]):
+            ind = cls(genes)
+            if fitness:
+                ind.fitness.values = fitness
+            individuals.append(ind)
+
+        return individuals
 
     @abstractmethod
-    def _run_evolution_loop(self, population: list[Individual]) -> list[Individual]:
+    def _vary(self, population: list[Individual]) -> list[Individual]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _replace(
+        self, population: list[Individual], offspring: list[Individual]
+    ) -> list[Individual]:
         raise NotImplementedError
 
     @abstractmethod
@@ -218,20 +709,28 @@ class AlgorithmBase:
         raise NotImplementedError
 
     @abstractmethod
-    def __repr__(self) -> str:
+    def params(self) -> dict[str, Any]:
         raise NotImplementedError
 
-    def repr_toolbox(self) -> str:
-        strings = [f"repair_pct={self.interpreter.repair_pct}"]
+    def toolbox_params(self) -> dict[str, Any]:
+        params: dict[str, Any] = {"repair_pct": self.interpreter.repair_pct}
+        # the generator of the run is shared by the operators, it is not a parameter
         if hasattr(self.toolbox, "mate"):
             mate = self.toolbox.mate.keywords  # type: ignore
-            strings.append(", ".join([f"mate_{k}={v}" for k, v in mate.items()]))
+            params.update({f"mate_{k}": v for k, v in mate.items() if k != "rng"})
 
         if hasattr(self.toolbox, "mutate"):
             mutate = self.toolbox.mutate.keywords  # type: ignore
-            strings.append(", ".join([f"mutate_{k}={v}" for k, v in mutate.items()]))
+            params.update({f"mutate_{k}": v for k, v in mutate.items() if k != "rng"})
+
+        return params
 
-        return ", ".join(strings)
+    def repr_toolbox(self) -> str:
+        return ", ".join(f"{k}={v}" for k, v in self.toolbox_params().items())
+
+    def __repr__(self) -> str:
+        params = ", ".join(f"{k}={v}" for k, v in self.params().items())
+        return f"{self.__class__.__name__}({params}, {self.repr_toolbox()})"
 
 
 def check_individual(func):
@@ -0,0 +1,131 @@
+from time import perf_counter_ns
+
+import numpy as np
+
+from eaplanner.algorithms.base import AlgorithmBase, Individual
+from eaplanner.compiled import BatchEvaluator
+from eaplanner.interpreter import AbsoluteScheduleInterpreter
+from eaplanner.logbook import Logbook
+
+
+class BatchRunner:
+    """Runs one algorithm per instance in a single process.
+
+    The algorithms take their generations in turns and the offspring of all
+    of them is scored in one call to a `BatchEvaluator`, which pays off for
+    many small instances where a single evaluation is mostly overhead. Every
+    algorithm still writes its own folder, logbook, solution and manifest
+    record, as if it was run on its own.
+
+    The batch evaluator does not repair constraints, so every interpreter
+    must have `repair_pct=0`, and it scores genes as absolute starts and
+    durations.
+    """
+
+    def __init__(self, algorithms: list[AlgorithmBase]):
+        for algorithm in algorithms:
+            if not isinstance(algorithm.interpreter, AbsoluteScheduleInterpreter):
+                raise ValueError(
+                    "Batch evaluation decodes absolute genes, use the absolute "
+                    "interpreter"
+                )
+            if algorithm.interpreter.repair_pct > 0:
+                raise ValueError(
+                    "Batch evaluation does not repair constraints, use repair_pct=0"
+                )
+
+        self.algorithms = algorithms
+        self.evaluator = BatchEvaluator.from_schedules(
+            [a.interpreter.schedule for a in algorithms]
+        )
+
+    def _evaluate(self, populations: dict[int, list[Individual]]) -> dict[int, int]:
+        start = perf_counter_ns()
+        invalid = {
+            k: [ind for ind in population if not ind.fitness.valid]  # type: ignore
+            for k, population in populations.items()
+        }
+        groups = [
+            (k, np.array(inds, dtype=np.float64)) for k, inds in invalid.items() if inds
+        ]
+        results = self.evaluator.evaluate_groups(groups)
+
+        for (k, _), (scores, chromosomes) in zip(groups, results):
+            for ind, fit, chromosome in zip(invalid[k], scores, chromosomes):
+                ind.fitness.values = tuple(fit.tolist())  # type: ignore
+                ind[:] = chromosome
+
+        # the time of the shared batch is split by the number of evaluations
+        elapsed = perf_counter_ns() - start
+        total = sum(len(inds) for inds in invalid.values())
+        for k, inds in invalid.items():
+            if inds:
+                self.algorithms[k].timer.add("evaluation", elapsed * len(inds) // total)
+                if self.algorithms[k].hooks:
+                    self.algorithms[k]._notify_evaluated(inds)
+
+        return {k: len(inds) for k, inds in invalid.items()}
+
+    def _is_running(self, algorithm: AlgorithmBase, population: list[Individual]):
+        if algorithm.current_evals >= algorithm.max_evaluations:
+            algorithm.stop_reason = "max_evaluations"
+            return False
+
+        return not algorithm._should_stop(population)
+
+    def run(self) -> list[tuple[list[Individual], Logbook]]:
+        for algorithm in self.algorithms:
+            algorithm._start_run()
+
+        try:
+            populations: dict[int, list[Individual]] = {}
+            created: dict[int, list[Individual]] = {}
+            for k, algorithm in enumerate(self.algorithms):
+                if algorithm.resume_from is not None:
+                    populations[k] = algorithm._load_checkpoint()
+                else:
+                    created[k] = algorithm._create_initial_population()
+
+            for k, evals in self._evaluate(created).items():
+                self.algorithms[k]._end_initialization(created[k], evals)
+                populations[k] = created[k]
+
+            for k, algorithm in enumerate(self.algorithms):
+                if algorithm.hooks:
+                    algorithm._notify_start(populations[k])
+
+            running = set(range(len(self.algorithms)))
+            while running:
+                offspring: dict[int, list[Individual]] = {}
+                for k in sorted(running):
+                    algorithm = self.algorithms[k]
+                    if not self._is_running(algorithm, populations[k]):
+                        running.discard(k)
+                        continue
+
+                    algorithm.gen += 1
+                    start = perf_counter_ns()
+                    offspring[k] = algorithm._vary(populations[k])
+                    algorithm.timer.stop("variation", start)
+
+                for k, evals in self._evaluate(offspring).items():
+                    algorithm = self.algorithms[k]
+                    start = perf_counter_ns()
+                    populations[k] = algorithm._replace(populations[k], offspring[k])
+                    algorithm.timer.stop("selection", start)
+                    algorithm._end_generation(populations[k], offspring[k], evals)
+
+                    if algorithm.migration is not None:
+                        algorithm.migration.migrate(algorithm, populations[k])
+
+            for k, algorithm in enumerate(self.algorithms):
+                algorithm._finish_run(populations[k])
+        except BaseException:
+            for algorithm in self.algorithms:
+                algorithm._close_run(raise_errors=False)
+            raise
+
+        for algorithm in self.algorithms:
+            algorithm._close_run()
+
+        return [(populations[k], a.logbook) for k, a in enumerate(self.algorithms)]
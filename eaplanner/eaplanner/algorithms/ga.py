@@ -1,5 +1,3 @@
-from deap.algorithms import varOr
-
 from eaplanner.algorithms.base import AlgorithmBase, Individual
 
 
@@ -23,26 +21,42 @@ class MuPlusLambda(AlgorithmBase):
     def _create_population(self):
         return self.create_population(self.mu)
 
-    def _run_evolution_loop(self, population: list[Individual]):
-        gen = 1
-
-        while self.current_evals < self.max_evaluations:
-            offspring = varOr(
-                population, self.toolbox, self.lambda_, self.cxpb, self.mutpb
-            )
-
-            invalid_ind = self._evaluate(offspring)
-            population[:] = self._select(population + offspring, self.mu)
-
-            evals = len(invalid_ind)
-            self.current_evals += evals
-            self._update_logbook(population, gen, evals)
-            self._save_population(gen, population)
-
-            self._update_halloffame(offspring)
-            gen += 1
+    def _vary(self, population: list[Individual]):
+        # deap's varOr with the random draws taken from the run's generator
+        assert self.cxpb + self.mutpb <= 1.0, (
+            "The sum of the crossover and mutation probabilities must be smaller "
+            "or equal to 1.0."
+        )
+
+        offspring = []
+        for op_choice in self.rng.random(self.lambda_):
+            if op_choice < self.cxpb:
+                i, j = self.rng.choice(len(population), 2, replace=False)
+                ind1 = self.toolbox.clone(population[i])  # type: ignore
+                ind2 = self.toolbox.clone(population[j])  # type: ignore
+                ind1, ind2 = self.toolbox.mate(ind1, ind2)  # type: ignore
+                del ind1.fitness.values
+                offspring.append(ind1)
+            elif op_choice < self.cxpb + self.mutpb:
+                i = self.rng.integers(len(population))
+                ind = self.toolbox.clone(population[i])  # type: ignore
+                (ind,) = self.toolbox.mutate(ind)  # type: ignore
+                del ind.fitness.values
+                offspring.append(ind)
+            else:
+                offspring.append(population[self.rng.integers(len(population))])
+
+        return offspring
+
+    def _replace(self, population: list[Individual], offspring: list[Individual]):
+        population[:] = self._select(population + offspring, self.mu)
 
         return population
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}(mu={self.mu}, lambda_={self.lambda_}, cxpb={self.cxpb}, mutpb={self.mutpb}, {self.repr_toolbox()})"
+    def params(self):
+        return {
+            "mu": self.mu,
+            "lambda_": self.lambda_,
+            "cxpb": self.cxpb,
+            "mutpb": self.mutpb,
+        }
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+from typing import Mapping
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Progress:
+    """Read-only snapshot of a run that is passed to hooks.
+
+    `fitness` holds the scores of the individuals the event is about, one row
+    per individual: the population, or the batch that was just evaluated.
+    """
+
+    algorithm: str
+    instance: str | None
+    gen: int
+    evaluations: int
+    max_evaluations: int
+    wall_time: float
+    cpu_time: float
+    score_names: tuple[str, ...]
+    fitness: np.ndarray
+    # seconds per phase since the start of the run
+    phase_times: Mapping[str, float]
+    best: tuple[float, ...] | None = None
+    stop_reason: str | None = None
+
+
+class Hook:
+    """Callbacks on the events of a run, all of them do nothing by default.
+
+    `on_generation` may return True to stop the run, which then ends with
+    `reason` as its stop reason. Hooks run in the process of the algorithm,
+    between generations, so slow hooks slow down the run.
+    """
+
+    reason = "hook"
+
+    def on_start(self, progress: Progress):
+        pass
+
+    def on_generation(self, progress: Progress) -> bool | None:
+        pass
+
+    def on_evaluate_batch(self, progress: Progress):
+        pass
+
+    def on_improvement(self, progress: Progress):
+        pass
+
+    def on_finish(self, progress: Progress):
+        pass
+
+
+class PrometheusTextfile(Hook):
+    """Writes the progress of a run in the Prometheus text format.
+
+    Meant for the textfile collector of the node exporter: the file is replaced
+    atomically at most once every `interval` seconds, and at the end of a run.
+    """
+
+    def __init__(self, path: str | Path, interval: float = 5.0, prefix="eaplanner"):
+        self.path = Path(path)
+        self.interval = interval
+        self.prefix = prefix
+        self._last_write: float | None = None
+
+    def on_start(self, progress):
+        self._write(progress, running=True)
+
+    def on_generation(self, progress):
+        if self._last_write is None or monotonic() - self._last_write >= self.interval:
+            self._write(progress, running=True)
+
+    def on_finish(self, progress):
+        self._write(progress, running=False)
+
+    def _write(self, progress: Progress, running: bool):
+        labels = f'algorithm="{progress.algorithm}",instance="{progress.instance}"'
+        gauges = {
+            "generation": progress.gen,
+            "evaluations": progress.evaluations,
+            "max_evaluations": progress.max_evaluations,
+            "wall_time_seconds": progress.wall_time,
+            "cpu_time_seconds": progress.cpu_time,
+            "running": int(running),
+        }
+
+        lines = []
+        for name, value in gauges.items():
+            lines.append(f"# TYPE {self.prefix}_{name} gauge")
+            lines.append(f"{self.prefix}_{name}{{{labels}}} {value}")
+
+        if progress.best is not None:
+            lines.append(f"# TYPE {self.prefix}_best gauge")
+            for score, value in zip(progress.score_names, progress.best):
+                lines.append(f'{self.prefix}_best{{{labels},score="{score}"}} {value}')
+
+        name = f"{self.prefix}_phase_seconds_total"
+        lines.append(f"# TYPE {name} counter")
+        for phase, seconds in progress.phase_times.items():
+            lines.append(f'{name}{{{labels},phase="{phase}"}} {seconds}')
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.path)
+        self._last_write = monotonic()
+
+
+def run_hooks(metrics_file: str | None = None) -> list[Hook]:
+    hooks: list[Hook] = []
+    if metrics_file is not None:
+        hooks.append(PrometheusTextfile(metrics_file))
+
+    return hooks
@@ -0,0 +1,240 @@
+import multiprocessing as mp
+import queue
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+from deap import creator
+
+from eaplanner.algorithms.base import AlgorithmBase, Individual
+from eaplanner.algorithms.termination import Termination
+from eaplanner.utils import spawn_rng
+
+
+class GlobalBudget(Termination):
+    """Stops an island once all islands together used `max_evaluations`."""
+
+    reason = "global_evaluations"
+
+    def __init__(self, counter, max_evaluations: int):
+        self.counter = counter
+        self.max_evaluations = max_evaluations
+        self.counted = 0
+
+    def should_stop(self, algorithm, population):
+        with self.counter.get_lock():
+            self.counter.value += algorithm.current_evals - self.counted
+            self.counted = algorithm.current_evals
+            return self.counter.value >= self.max_evaluations
+
+
+class Migration:
+    """Sends the best individuals of an island to the inboxes of other islands.
+
+    Migrants travel as a matrix of genes and a matrix of fitness values, so
+    they do not have to be evaluated again. Islands never wait for each other,
+    immigrants that arrive are merged at the next migration of the island.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        inboxes: list,
+        topology: str = "ring",
+        interval: int = 10,
+        migrants: int = 2,
+        rng: np.random.Generator | None = None,
+    ):
+        if topology not in ("ring", "random"):
+            raise ValueError(f"Unknown topology {topology}")
+
+        self.index = index
+        self.inboxes = inboxes
+        self.topology = topology
+        self.interval = interval
+        self.migrants = migrants
+        self.rng = np.random.default_rng(rng)
+
+    def targets(self) -> list[int]:
+        n = len(self.inboxes)
+        if n < 2:
+            return []
+        if self.topology == "ring":
+            return [(self.index + 1) % n]
+
+        others = [i for i in range(n) if i != self.index]
+        return [others[self.rng.integers(len(others))]]
+
+    def migrate(self, algorithm: AlgorithmBase, population: list[Individual]):
+        if algorithm.gen % self.interval != 0:
+            return
+
+        # best first, weighted values are maximised
+        order = sorted(
+            range(len(population)),
+            key=lambda i: tuple(population[i].fitness.wvalues),  # type: ignore
+            reverse=True,
+        )
+
+        elites = [population[i] for i in order[: self.migrants]]
+        genes = np.array(elites)
+        fitness = np.array([ind.fitness.values for ind in elites])  # type: ignore
+        for target in self.targets():
+            self.inboxes[target].put((genes, fitness))
+
+        cls = getattr(creator, type(population[0]).__name__)
+        worst = order[::-1]
+        while worst:
+            try:
+                genes, fitness = self.inboxes[self.index].get_nowait()
+            except queue.Empty:
+                break
+
+            for g, f in zip(genes, fitness):
+                if not worst:
+                    break
+                ind = cls(g)
+                ind.fitness.values = tuple(f.tolist())
+                population[worst.pop(0)] = ind
+
+
+@dataclass
+class IslandResult:
+    index: int
+    genes: np.ndarray
+    fitness: np.ndarray
+    evaluations: int
+    stop_reason: str | None
+    folder: str | None
+
+
+def _run_island(
+    factory: Callable[[int, np.random.Generator], AlgorithmBase],
+    index: int,
+    rng: np.random.Generator,
+    inboxes: list,
+    counter,
+    results,
+    max_evaluations: int,
+    topology: str,
+    interval: int,
+    migrants: int,
+):
+    algorithm = factory(index, rng)
+    # an island is part of one run, its record must count neither as a run of
+    # the task of the algorithm nor as a run from before tasks were recorded
+    island = f"island_{index}"
+    algorithm.task = f"{algorithm.task}/{island}" if algorithm.task else island
+    algorithm.max_evaluations = max_evaluations
+    budget = GlobalBudget(counter, max_evaluations)
+    algorithm.termination.append(budget)
+    algorithm.migration = Migration(
+        index, inboxes, topology, interval, migrants, rng=algorithm.rng
+    )
+
+    try:
+        population, _ = algorithm.run()
+        # count the evaluations of the last generation as well
+        budget.should_stop(algorithm, population)
+    finally:
+        for inbox in inboxes:
+            # do not wait for migrants to islands that already finished
+            inbox.cancel_join_thread()
+
+    best = algorithm.halloffame.items if algorithm.halloffame else population
+    results.put(
+        IslandResult(
+            index=index,
+            genes=np.array(best),
+            fitness=np.array([ind.fitness.values for ind in best]),  # type: ignore
+            evaluations=algorithm.current_evals,
+            stop_reason=algorithm.stop_reason,
+            folder=str(algorithm.folder) if algorithm.folder else None,
+        )
+    )
+
+
+class IslandModel:
+    """Runs populations of one algorithm in separate processes.
+
+    `factory(i, rng)` creates the algorithm of island `i` inside its process,
+    drawing from `rng`, it must be picklable when processes are spawned
+    instead of forked. Every island gets its own generator spawned from
+    `seed`, so a seeded model is reproduced island by island. The evaluation
+    budget is shared, every island stops once `max_evaluations` evaluations
+    are used over all islands together.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[int, np.random.Generator], AlgorithmBase],
+        islands: int,
+        max_evaluations: int,
+        topology: str = "ring",
+        interval: int = 10,
+        migrants: int = 2,
+        seed: int | np.random.SeedSequence | None = None,
+    ):
+        self.factory = factory
+        self.islands = islands
+        self.max_evaluations = max_evaluations
+        self.topology = topology
+        self.interval = interval
+        self.migrants = migrants
+        self.seed = seed
+        self.evaluations = 0
+
+    def run(self) -> list[IslandResult]:
+        ctx = mp.get_context()
+        inboxes = [ctx.Queue() for _ in range(self.islands)]
+        results = ctx.Queue()
+        counter = ctx.Value("q", 0)
+        rngs = spawn_rng(self.seed, self.islands)
+
+        processes = [
+            ctx.Process(
+                target=_run_island,
+                args=(
+                    self.factory,
+                    i,
+                    rngs[i],
+                    inboxes,
+                    counter,
+                    results,
+                    self.max_evaluations,
+                    self.topology,
+                    self.interval,
+                    self.migrants,
+                ),
+            )
+            for i in range(self.islands)
+        ]
+        for p in processes:
+            p.start()
+
+        collected: list[IslandResult] = []
+        while len(collected) < len(processes):
+            try:
+                collected.append(results.get(timeout=1))
+            except queue.Empty:
+                failed = [p for p in processes if p.exitcode not in (None, 0)]
+                if failed:
+                    for p in processes:
+                        p.terminate()
+                    raise RuntimeError(f"{len(failed)} island(s) failed")
+
+        for p in processes:
+            p.join()
+
+        self.evaluations = counter.value
+
+        return sorted(collected, key=lambda r: r.index)
+
+    def best(self, results: list[IslandResult]) -> tuple[np.ndarray, tuple]:
+        # compared lexicographically on the scores, like the hall of fame
+        candidates = [
+            (tuple(f.tolist()), g) for r in results for g, f in zip(r.genes, r.fitness)
+        ]
+        fitness, genes = min(candidates, key=lambda c: c[0])
+
+        return genes, fitness
@@ -1,5 +1,3 @@
-import random
-
 import numpy as np
 
 from eaplanner.algorithms.base import AlgorithmBase, Individual
@@ -24,38 +22,28 @@ class StochasticHillClimb(AlgorithmBase):
     def _create_population(self):
         return self.create_population(self.mu)
 
-    def _run_evolution_loop(self, population: list[Individual]):
-        gen = 1
-        while self.current_evals < self.max_evaluations:
-            offspring = self._create_offspring(population)
-            invalid_ind = self._evaluate(offspring)
-
-            for i, (ind, off) in enumerate(zip(population, offspring)):
-                if is_smaller_or_equal_lexicographic(off.fitness.values, ind.fitness.values):  # type: ignore
-                    population[i] = off
-
-            evals = len(invalid_ind)
-            self.current_evals += evals
-            self._update_logbook(population, gen, evals)
-            self._save_population(gen, population)
+    def _vary(self, population: list[Individual]):
+        return self._create_offspring(population)
 
-            self._update_halloffame(offspring)
-            gen += 1
+    def _replace(self, population: list[Individual], offspring: list[Individual]):
+        for i, (ind, off) in enumerate(zip(population, offspring)):
+            if is_smaller_or_equal_lexicographic(off.fitness.values, ind.fitness.values):  # type: ignore
+                population[i] = off
 
         return population
 
     def _create_offspring(self, population: list[Individual]):
         offspring = self.toolbox.clone(population)  # type: ignore
         for ind in offspring:
-            mask = np.random.uniform(0, 1, size=len(ind)) < self.mut_prob
-            mutation = np.random.uniform(-self.mut_std, self.mut_std, size=len(ind))
+            mask = self.rng.uniform(0, 1, size=len(ind)) < self.mut_prob
+            mutation = self.rng.uniform(-self.mut_std, self.mut_std, size=len(ind))
             ind[:] = np.where(mask, ind[:] + mutation, ind[:])
             del ind.fitness.values
 
         return offspring
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}(mu={self.mu}, mut_prob={self.mut_prob}, mut_std={self.mut_std}, {self.repr_toolbox()})"
+    def params(self):
+        return {"mu": self.mu, "mut_prob": self.mut_prob, "mut_std": self.mut_std}
 
 
 class SimulatedAnnealing(StochasticHillClimb):
@@ -68,36 +56,31 @@ class SimulatedAnnealing(StochasticHillClimb):
     ):
         self.temp = temp
         self.alpha = alpha
+        self.current_temp = temp
 
         super().__init__(*args, **kwargs)
 
-    def _run_evolution_loop(self, population: list[Individual]):
-        temp = self.temp
-        gen = 1
-
-        while self.current_evals < self.max_evaluations:
-            offspring = self._create_offspring(population)
-            invalid_ind = self._evaluate(offspring)
-
-            for i, (ind, off) in enumerate(zip(population, offspring)):
-                if is_smaller_or_equal_lexicographic(off.fitness.values, ind.fitness.values):  # type: ignore
-                    population[i] = off
+    def _get_state(self, population: list[Individual]):
+        state = super()._get_state(population)
+        state["temp"] = self.current_temp
 
-                elif random.uniform(0, 1) < self._transition_probability(
-                    ind.fitness.values, off.fitness.values, temp  # type: ignore
-                ):
-                    population[i] = off
+        return state
 
-            evals = len(invalid_ind)
-            self.current_evals += evals
+    def _set_state(self, state: dict, population: list[Individual]):
+        super()._set_state(state, population)
+        self.current_temp = state["temp"]
 
-            self._update_logbook(population, gen, evals)
-            self._save_population(gen, population)
+    def _replace(self, population: list[Individual], offspring: list[Individual]):
+        for i, (ind, off) in enumerate(zip(population, offspring)):
+            if is_smaller_or_equal_lexicographic(off.fitness.values, ind.fitness.values):  # type: ignore
+                population[i] = off
 
-            self._update_halloffame(offspring)
+            elif self.rng.uniform(0, 1) < self._transition_probability(
+                ind.fitness.values, off.fitness.values, self.current_temp  # type: ignore
+            ):
+                population[i] = off
 
-            temp *= self.alpha
-            gen += 1
+        self.current_temp *= self.alpha
 
         return population
 
@@ -106,5 +89,5 @@ class SimulatedAnnealing(StochasticHillClimb):
 
         return np.exp((-delta_f).sum() / temp)
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}(mu={self.mu}, mut_prob={self.mut_prob}, mut_std={self.mut_std}, temp={self.temp}, alpha={self.alpha}, {self.repr_toolbox()})"
+    def params(self):
+        return {**super().params(), "temp": self.temp, "alpha": self.alpha}
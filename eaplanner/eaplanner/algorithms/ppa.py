@@ -23,23 +23,11 @@ class PlantPropagation(AlgorithmBase):
     def _create_population(self):
         return self.create_population(self.mu)
 
-    def _run_evolution_loop(self, population: list[Individual]):
-        gen = 1
-        while self.current_evals < self.max_evaluations:
-            offspring = self._create_offspring(population)
-            invalid_ind = self._evaluate(offspring)
+    def _vary(self, population: list[Individual]):
+        return self._create_offspring(population)
 
-            population = self.toolbox.select(population + offspring, self.mu)  # type: ignore
-
-            evals = len(invalid_ind)
-            self.current_evals += evals
-            self._update_logbook(population, gen, evals)
-            self._save_population(gen, population)
-
-            self._update_halloffame(offspring)
-            gen += 1
-
-        return population
+    def _replace(self, population: list[Individual], offspring: list[Individual]):
+        return self.toolbox.select(population + offspring, self.mu)  # type: ignore
 
     def _ppa_fitness(self, fitness_values: np.ndarray):
         fitness = np.array(fitness_values)
@@ -50,7 +38,7 @@ class PlantPropagation(AlgorithmBase):
 
     def _determine_n_offspring(self, fitness: np.ndarray) -> list[int]:
         return (
-            np.ceil(self.lambda_ * fitness * np.random.uniform(0, 1, len(fitness)))
+            np.ceil(self.lambda_ * fitness * self.rng.uniform(0, 1, len(fitness)))
             .astype(np.int_)
             .tolist()
         )
@@ -66,11 +54,11 @@ class PlantPropagation(AlgorithmBase):
                 child = self.toolbox.clone(ind)  # type: ignore
                 mutation = (
                     2
-                    * np.random.uniform(-self.mut_std, self.mut_std, len(child))
+                    * self.rng.uniform(-self.mut_std, self.mut_std, len(child))
                     * (1 - ind_fit)
                 )
                 mutation = np.where(
-                    np.random.uniform(0, 1, len(child)) < self.mut_indpb, mutation, 0
+                    self.rng.uniform(0, 1, len(child)) < self.mut_indpb, mutation, 0
                 )
                 child[:] = child + mutation
                 del child.fitness.values
@@ -78,5 +66,10 @@ class PlantPropagation(AlgorithmBase):
 
         return offspring
 
-    def __repr__(self):
-        return f"PlantPropagation(mu={self.mu}, lambda_={self.lambda_}, mut_std={self.mut_std}, mut_indpb={self.mut_indpb}, {self.repr_toolbox()})"
+    def params(self):
+        return {
+            "mu": self.mu,
+            "lambda_": self.lambda_,
+            "mut_std": self.mut_std,
+            "mut_indpb": self.mut_indpb,
+        }
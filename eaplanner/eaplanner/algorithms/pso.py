@@ -25,46 +25,70 @@ class ParticleSwarm(AlgorithmBase):
         self.smin = smin
         self.smax = smax
         self.weight = weight
+        self.best: Individual | None = None
 
         super().__init__(*args, **kwargs)
 
     def _create_population(self):
         return self.create_population(self.mu)
 
-    def _run_evolution_loop(self, population: list[Individual]):
-        best = None
-        gen = 1
+    def _vary(self, population: list[Individual]):
+        for part in population:
+            if part.best is None or is_smaller_or_equal_lexicographic(  # type: ignore
+                part.fitness.values, part.best.fitness.values  # type: ignore
+            ):
+                part.best = creator.Particle(part)  # type: ignore
+                part.best.fitness.values = part.fitness.values  # type: ignore
 
-        while self.current_evals < self.max_evaluations:
-            for part in population:
-                if part.best is None or is_smaller_or_equal_lexicographic(  # type: ignore
-                    part.fitness.values, part.best.fitness.values  # type: ignore
-                ):
-                    part.best = creator.Particle(part)  # type: ignore
-                    part.best.fitness.values = part.fitness.values  # type: ignore
+        self.best = self._sort_lexicographically(
+            population + [self.best] if self.best is not None else population
+        )[0]
 
-            best = self._sort_lexicographically(
-                population + [best] if best is not None else population
-            )[0]
+        for part in population:
+            self.update_particle(part, self.best)  # type: ignore
 
-            for part in population:
-                self.update_particle(part, best)  # type: ignore
-
-            invalid_ind = self._evaluate(population)
-
-            evals = len(invalid_ind)
-            self.current_evals += evals
-            self._update_logbook(population, gen, evals)
-            self._save_population(gen, population)
-
-            self._update_halloffame(population)
-            gen += 1
+        return population
 
+    def _replace(self, population: list[Individual], offspring: list[Individual]):
         return population
 
+    def _get_state(self, population: list[Individual]):
+        state = super()._get_state(population)
+        state["speeds"] = np.array([part.speed for part in population])  # type: ignore
+        state["bests"] = [
+            None if part.best is None else self._individuals_to_state([part.best])  # type: ignore
+            for part in population
+        ]
+
+        # the swarm best is usually one of the particles itself, which keeps
+        # moving after it has been selected, so the reference is preserved
+        best_index = next(
+            (i for i, part in enumerate(population) if part is self.best), None
+        )
+        state["best_index"] = best_index
+        state["best"] = (
+            self._individuals_to_state([self.best])
+            if self.best is not None and best_index is None
+            else None
+        )
+
+        return state
+
+    def _set_state(self, state: dict, population: list[Individual]):
+        super()._set_state(state, population)
+
+        for part, speed, best in zip(population, state["speeds"], state["bests"]):
+            part.speed = speed  # type: ignore
+            part.best = None if best is None else self._individuals_from_state(best)[0]  # type: ignore
+
+        if state["best_index"] is not None:
+            self.best = population[state["best_index"]]
+        elif state["best"] is not None:
+            self.best = self._individuals_from_state(state["best"])[0]
+
     def update_particle(self, part, best):
-        u1 = np.random.uniform(0, self.phi1, len(part))
-        u2 = np.random.uniform(0, self.phi2, len(part))
+        u1 = self.rng.uniform(0, self.phi1, len(part))
+        u2 = self.rng.uniform(0, self.phi2, len(part))
         v_u1 = u1 * (part.best - part)
         v_u2 = u2 * (best - part)
         part.speed = self.weight * part.speed + v_u1 + v_u2
@@ -76,5 +100,12 @@ class ParticleSwarm(AlgorithmBase):
     def _fitness_product(fitness: tuple[float, ...]) -> float:
         return math.prod(max(1, f) for f in fitness)
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}(mu={self.mu}, phi1={self.phi1}, phi2={self.phi2}, smin={self.smin}, smax={self.smax}, weight={self.weight}, {self.repr_toolbox()})"
+    def params(self):
+        return {
+            "mu": self.mu,
+            "phi1": self.phi1,
+            "phi2": self.phi2,
+            "smin": self.smin,
+            "smax": self.smax,
+            "weight": self.weight,
+        }
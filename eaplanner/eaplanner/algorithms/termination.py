@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence
+
+if TYPE_CHECKING:
+    from eaplanner.algorithms.base import AlgorithmBase, Individual
+
+
+class Termination:
+    """Criterion that can stop a run before `max_evaluations` is reached.
+
+    `should_stop` is called once before every generation. Criteria that keep
+    track of earlier generations return that from `get_state`, which is saved
+    in checkpoints so a resumed run continues counting where it stopped.
+    """
+
+    reason = "termination"
+
+    def should_stop(
+        self, algorithm: AlgorithmBase, population: list[Individual]
+    ) -> bool:
+        raise NotImplementedError
+
+    def get_state(self) -> dict[str, Any]:
+        return {}
+
+    def set_state(self, state: dict[str, Any]):
+        vars(self).update(state)
+
+
+def best_wvalues(population: list[Individual]) -> tuple[float, ...]:
+    # weighted values are maximised, compared lexicographically like the scores
+    return max(tuple(ind.fitness.wvalues) for ind in population)  # type: ignore
+
+
+class Patience(Termination):
+    """Stops after `generations` generations without a better individual."""
+
+    reason = "patience"
+
+    def __init__(self, generations: int):
+        self.generations = generations
+        self.best: tuple[float, ...] | None = None
+        self.last_gen: int | None = None
+        self.stalled = 0
+
+    def should_stop(self, algorithm, population):
+        if algorithm.gen == self.last_gen:
+            return self.stalled >= self.generations
+        self.last_gen = algorithm.gen
+
+        best = best_wvalues(population)
+        if self.best is None or best > self.best:
+            self.best = best
+            self.stalled = 0
+        else:
+            self.stalled += 1
+
+        return self.stalled >= self.generations
+
+    def get_state(self):
+        return {"best": self.best, "last_gen": self.last_gen, "stalled": self.stalled}
+
+
+class TargetFitness(Termination):
+    """Stops once an individual is at least as good as `target`.
+
+    The target is given in the same units as the scores, e.g. `(0, 120)` stops
+    when a solution without penalty and a makespan of at most 120 is found.
+    """
+
+    reason = "target_fitness"
+
+    def __init__(self, target: Sequence[float]):
+        self.target = tuple(target)
+
+    def should_stop(self, algorithm, population):
+        weights = population[0].fitness.weights  # type: ignore
+        target = tuple(w * t for w, t in zip(weights, self.target))
+        return best_wvalues(population) >= target
+
+
+class LowerBound(TargetFitness):
+    """Stops once a solution without penalty has the lowest possible makespan.
+
+    `makespan` is a lower bound like `eaplanner.cpm.makespan_lower_bound`, no
+    solution can be better than one that reaches it.
+    """
+
+    reason = "lower_bound"
+
+    def __init__(self, makespan: float):
+        super().__init__((0, makespan))
+
+
+class WallTimeBudget(Termination):
+    """Stops once the run, including time before a resume, took `seconds`."""
+
+    reason = "wall_time"
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def should_stop(self, algorithm, population):
+        return algorithm.wall_time >= self.seconds
+
+
+class CpuTimeBudget(Termination):
+    """Stops once the process spent `seconds` of CPU time on the run."""
+
+    reason = "cpu_time"
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def should_stop(self, algorithm, population):
+        return algorithm.cpu_time >= self.seconds
+
+
+def termination_criteria(
+    patience: int | None = None,
+    target: Sequence[float] | None = None,
+    max_time: float | None = None,
+    max_cpu_time: float | None = None,
+    lower_bound: float | None = None,
+) -> list[Termination]:
+    criteria: list[Termination] = []
+    if patience is not None:
+        criteria.append(Patience(patience))
+    if target is not None:
+        criteria.append(TargetFitness(target))
+    if max_time is not None:
+        criteria.append(WallTimeBudget(max_time))
+    if max_cpu_time is not None:
+        criteria.append(CpuTimeBudget(max_cpu_time))
+    if lower_bound is not None:
+        criteria.append(LowerBound(lower_bound))
+
+    return criteria
@@ -0,0 +1,470 @@
+import json
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterator, Sequence
+
+import numpy as np
+from deap import base, creator, tools
+
+from eaplanner.algorithms.base import AlgorithmBase
+from eaplanner.algorithms.ga import MuPlusLambda
+from eaplanner.algorithms.local import SimulatedAnnealing, StochasticHillClimb
+from eaplanner.algorithms.ppa import PlantPropagation
+from eaplanner.algorithms.pso import ParticleSwarm
+from eaplanner.compiled import BatchEvaluator
+from eaplanner.entities.schedule import Schedule
+from eaplanner.interpreter import AbsoluteScheduleInterpreter
+from eaplanner.utils import (
+    LexHallOfFame,
+    SelNSGA3WithMemory,
+    cx_uniform,
+    mut_gaussian,
+    pareto_rank,
+    rank_lexicographic,
+)
+
+SIZES = (10, 50, 100, 500, 5000)
+POPULATION_SIZES = (50, 200)
+ALGORITHMS = ("ga", "ppa", "pso", "sa", "shc")
+SEED = 2023
+PMIN, PMAX = -50, 50
+# instances of the kernels that are gated against the committed baseline
+KERNEL_SIZES = (10, 100, 500)
+
+
+@dataclass
+class Measurement:
+    name: str
+    n: int
+    # seconds per call, the median and the fastest of the repeats
+    seconds: float
+    best: float
+    loops: int
+    repeats: int
+    # work done per call, e.g. evaluations of an algorithm run
+    items: int = 1
+
+    @property
+    def rate(self) -> float:
+        return self.items / self.seconds
+
+    @property
+    def best_rate(self) -> float:
+        return self.items / self.best
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.n}]"
+
+    @property
+    def noise(self) -> float:
+        # relative spread of the repeats, zero when every repeat was as fast
+        return 1 - self.best / self.seconds
+
+    def to_dict(self):
+        return {**asdict(self), "rate": self.rate}
+
+
+def measure(
+    name: str,
+    n: int,
+    func: Callable[[], object],
+    min_time: float = 0.2,
+    repeat: int = 5,
+    max_time: float = 10.0,
+) -> Measurement:
+    """Times `func` like `timeit`, returning the median time per call.
+
+    The number of loops grows until a repeat takes `min_time`, slow functions
+    are repeated less often so a single measurement stays around `max_time`.
+    `func` may return the number of items it processed as an int, to report a
+    rate.
+    """
+    loops = 1
+    while True:
+        start = perf_counter()
+        for _ in range(loops):
+            items = func()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    repeats = max(1, min(repeat, int(max_time / elapsed)))
+    times = [elapsed / loops]
+    for _ in range(repeats - 1):
+        start = perf_counter()
+        for _ in range(loops):
+            func()
+        times.append((perf_counter() - start) / loops)
+
+    return Measurement(
+        name=name,
+        n=n,
+        seconds=float(np.median(times)),
+        best=min(times),
+        loops=loops,
+        repeats=repeats,
+        items=items if isinstance(items, int) else 1,
+    )
+
+
+def benchmark_instance(
+    n: int, seed: int = SEED, cache: Path | None = None
+) -> Schedule:
+    """The instance with `n` activities of the fixed benchmark set."""
+    from eaplanner.generation import ScheduleGenerator
+
+    path = cache / f"n_{n}_seed_{seed}.pkl" if cache is not None else None
+    if path is not None and path.exists():
+        return Schedule.load(path)
+
+    schedule = ScheduleGenerator.generate_random_schedule(
+        n, seed=np.random.SeedSequence((seed, n))
+    )
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        schedule.save(path)
+
+    return schedule
+
+
+def _create_classes():
+    if not hasattr(creator, "FitnessMin"):
+        creator.create("FitnessMin", base.Fitness, weights=(-1, -1))
+    if not hasattr(creator, "Individual"):
+        creator.create(
+            "Individual", np.ndarray, fitness=creator.FitnessMin  # type: ignore
+        )
+    if not hasattr(creator, "Particle"):
+        creator.create(
+            "Particle",
+            np.ndarray,
+            fitness=creator.FitnessMin,  # type: ignore
+            speed=list,
+            best=None,
+        )
+
+
+def create_algorithm(
+    name: str,
+    schedule: Schedule,
+    max_evaluations: int,
+    repair_pct: float = 0.0,
+    rng: np.random.Generator | int | None = None,
+) -> AlgorithmBase:
+    """An algorithm with the operators of the run scripts and small populations."""
+    _create_classes()
+    rng = np.random.default_rng(rng)
+    interpreter = AbsoluteScheduleInterpreter(schedule)
+    size = 2 * len(schedule)
+
+    def individual():
+        return creator.Individual(rng.integers(PMIN, PMAX, size))  # type: ignore
+
+    def particle():
+        part = creator.Particle(rng.uniform(PMIN, PMAX, size))  # type: ignore
+        part.speed = rng.uniform(-2, 2, size)
+        return part
+
+    toolbox = base.Toolbox()
+    toolbox.register("individual", particle if name == "pso" else individual)
+    toolbox.register("population", tools.initRepeat, list, toolbox.individual)  # type: ignore
+    toolbox.register("evaluate", interpreter.interpret_and_get_scores)
+    toolbox.register("mate", cx_uniform, indpb=0.5, rng=rng)
+    toolbox.register("mutate", mut_gaussian, mu=0, sigma=2, indpb=0.5, rng=rng)
+    ref_points = tools.uniform_reference_points(nobj=2)
+    toolbox.register("select", SelNSGA3WithMemory(ref_points, rng=rng))
+
+    kwargs = dict(
+        max_evaluations=max_evaluations,
+        toolbox=toolbox,
+        interpreter=interpreter,
+        halloffame=LexHallOfFame(1, similar=np.array_equal),  # type: ignore
+        repair_pct=repair_pct,
+        verbose=False,
+        manifest=None,
+        rng=rng,
+    )
+    match name:
+        case "ga":
+            return MuPlusLambda(mu=50, lambda_=50, cxpb=0.5, mutpb=0.5, **kwargs)
+        case "ppa":
+            return PlantPropagation(
+                mu=50, lambda_=5, mut_std=2, mut_indpb=0.5, **kwargs
+            )
+        case "pso":
+            return ParticleSwarm(
+                mu=50, phi1=4, phi2=6, smin=-2, smax=2, weight=1, **kwargs
+            )
+        case "sa":
+            return SimulatedAnnealing(
+                mu=1, mut_prob=0.1, mut_std=1, temp=100, alpha=0.99, **kwargs
+            )
+        case "shc":
+            return StochasticHillClimb(mu=1, mut_prob=0.4, mut_std=1, **kwargs)
+
+    raise ValueError(f"Unknown algorithm {name}")
+
+
+def algorithm_evaluations(n: int) -> int:
+    # roughly the same wall time per algorithm for every instance size
+    return max(200, 20000 // n)
+
+
+def _cycle(rows: np.ndarray) -> Iterator[np.ndarray]:
+    while True:
+        yield from rows
+
+
+def benchmark_schedule(
+    schedule: Schedule,
+    algorithms: Sequence[str] = ALGORITHMS,
+    min_time: float = 0.2,
+    seed: int = SEED,
+) -> list[Measurement]:
+    n = len(schedule)
+    rng = np.random.default_rng(seed)
+    chromosomes = rng.integers(PMIN, PMAX, (64, 2 * n)).astype(np.float64)
+    rows = _cycle(chromosomes)
+    results = []
+
+    interpreter = AbsoluteScheduleInterpreter(schedule, repair_pct=0.0)
+    results.append(
+        measure(
+            "interpret_and_get_scores",
+            n,
+            lambda: interpreter.interpret_and_get_scores(next(rows)),
+            min_time,
+        )
+    )
+
+    repairing = AbsoluteScheduleInterpreter(schedule, repair_pct=1.0, rng=rng)
+    results.append(
+        measure(
+            "interpret_and_get_scores/repair",
+            n,
+            lambda: repairing.interpret_and_get_scores(next(rows)),
+            min_time,
+        )
+    )
+
+    # penalties of an interpreted random chromosome, so that most are violated
+    interpreter.interpret(chromosomes[0])
+    for group, constraints in sorted(schedule.get_constraint_per_group().items()):
+        results.append(
+            measure(
+                f"get_penalty/{group}",
+                n,
+                lambda c=constraints: len([x.get_penalty() for x in c]),
+                min_time,
+            )
+        )
+    results.append(
+        measure("get_total_penalty", n, schedule.get_total_penalty, min_time)
+    )
+
+    # every repair starts from a random chromosome, interpreting it is included
+    def repair():
+        interpreter.interpret(next(rows))
+        schedule.repair_constraints(max_loops=1, rng=rng)
+
+    results.append(measure("repair_constraints", n, repair, min_time))
+
+    evaluator = BatchEvaluator.from_schedules([schedule])
+    instance = np.zeros(len(chromosomes), dtype=np.intp)
+    results.append(
+        measure(
+            "batch_evaluate",
+            n,
+            lambda: len(evaluator.evaluate(instance, chromosomes)[0]),
+            min_time,
+        )
+    )
+
+    ind1, ind2 = chromosomes[0].copy(), chromosomes[1].copy()
+    results.append(
+        measure(
+            "cx_uniform",
+            n,
+            lambda: cx_uniform(ind1, ind2, 0.5, rng),
+            min_time,
+        )
+    )
+    results.append(
+        measure(
+            "mut_gaussian",
+            n,
+            lambda: mut_gaussian(ind1, 0, 2, 0.5, rng),
+            min_time,
+        )
+    )
+
+    for name in algorithms:
+
+        def run(name=name):
+            algorithm = create_algorithm(
+                name, schedule, algorithm_evaluations(n), rng=seed
+            )
+            algorithm.run()
+            return algorithm.current_evals
+
+        results.append(measure(f"algorithm/{name}", n, run, min_time, repeat=3))
+
+    return results
+
+
+def benchmark_ranking(
+    sizes: Sequence[int] = POPULATION_SIZES, min_time: float = 0.2, seed: int = SEED
+) -> list[Measurement]:
+    """Ranking of the fitness of populations of the given sizes."""
+    rng = np.random.default_rng(seed)
+    results = []
+    for size in sizes:
+        fitness = rng.integers(0, 100, (size, 2)).astype(np.float64)
+        results.append(
+            measure(
+                "pareto_rank",
+                size,
+                lambda f=fitness: pareto_rank(f),
+                min_time,
+            )
+        )
+        results.append(
+            measure(
+                "rank_lexicographic",
+                size,
+                lambda f=fitness: rank_lexicographic(f),
+                min_time,
+            )
+        )
+
+    return results
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = SIZES,
+    algorithms: Sequence[str] = ALGORITHMS,
+    min_time: float = 0.2,
+    seed: int = SEED,
+    cache: Path | None = None,
+    progress: Callable[[list[Measurement]], None] | None = None,
+) -> list[Measurement]:
+    """Runs every benchmark, `progress` is called with each group of results."""
+    groups = [lambda: benchmark_ranking(min_time=min_time, seed=seed)]
+    for n in sizes:
+        groups.append(
+            lambda n=n: benchmark_schedule(
+                benchmark_instance(n, seed, cache), algorithms, min_time, seed
+            )
+        )
+
+    results = []
+    for group in groups:
+        measurements = group()
+        if progress is not None:
+            progress(measurements)
+        results += measurements
+
+    return results
+
+
+def append_history(path: Path, record: dict):
+    """Appends a benchmark run to the JSON list of earlier runs in `path`."""
+    history = json.loads(path.read_text()) if path.exists() else []
+    history.append(record)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2, default=float))
+
+
+def format_results(results: list[Measurement]) -> str:
+    lines = [f"{'benchmark':<40} {'n':>6} {'per call':>12} {'per second':>14}"]
+    for m in results:
+        per_call = f"{m.seconds * 1e3:.3f} ms"
+        lines.append(f"{m.name:<40} {m.n:>6} {per_call:>12} {m.rate:>14.1f}")
+
+    return "\n".join(lines)
+
+
+
+def calibrate(min_time: float = 0.2) -> Measurement:
+    """Throughput of a fixed workload of plain Python.
+
+    Kernels are compared relative to it, so that a baseline remains
+    meaningful on a faster or slower machine.
+    """
+    values = list(range(1000))
+
+    def work():
+        totals: defaultdict[int, int] = defaultdict(int)
+        for v in values:
+            totals[v % 7] += v
+        return len(values)
+
+    return measure("calibration", 0, work, min_time)
+
+
+def benchmark_kernels(
+    sizes: Sequence[int] = KERNEL_SIZES,
+    min_time: float = 0.2,
+    seed: int = SEED,
+    cache: Path | None = None,
+) -> list[Measurement]:
+    """The benchmarks of `benchmark_schedule` without algorithm runs."""
+    results = benchmark_ranking(min_time=min_time, seed=seed)
+    for n in sizes:
+        schedule = benchmark_instance(n, seed, cache)
+        results += benchmark_schedule(schedule, (), min_time, seed)
+
+    return results
+
+
+def create_baseline(results: list[Measurement], calibration: Measurement) -> dict:
+    return {
+        "calibration": calibration.to_dict(),
+        "kernels": {
+            m.key: {
+                "relative_rate": m.best_rate / calibration.best_rate,
+                "noise": m.noise,
+            }
+            for m in results
+        },
+    }
+
+
+@dataclass
+class Regression:
+    key: str
+    # times slower than the baseline, and the slowdown that was tolerated
+    slowdown: float
+    allowed: float
+
+
+def find_regressions(
+    results: list[Measurement],
+    calibration: Measurement,
+    baseline: dict,
+    tolerance: float = 0.25,
+    noise_factor: float = 1.0,
+) -> list[Regression]:
+    """Kernels that are slower than in `baseline` by more than the noise allows.
+
+    Rates of the fastest repeats are compared relative to the calibration. A
+    kernel may be `tolerance` slower, plus `noise_factor` times the spread of
+    the noisiest of both measurements. Kernels without a baseline pass.
+    """
+    regressions = []
+    for m in results:
+        reference = baseline["kernels"].get(m.key)
+        if reference is None:
+            continue
+
+        relative_rate = m.best_rate / calibration.best_rate
+        slowdown = reference["relative_rate"] / relative_rate
+        allowed = 1 + tolerance + noise_factor * max(m.noise, reference["noise"])
+        if slowdown > allowed:
+            regressions.append(Regression(m.key, slowdown, allowed))
+
+    return regressions
@@ -0,0 +1,284 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from eaplanner.entities.constraint import (
+    DateConstraint,
+    RelationConstraint,
+    ResourceConstraint,
+)
+from eaplanner.entities.enum import DateType, RelationType
+from eaplanner.entities.schedule import Schedule
+
+# relation penalty is first - second, with (assignment, use end) for both sides
+# where assignment 0 is the predecessor and 1 the successor
+RELATION_TERMS = {
+    RelationType.FINISH_TO_FINISH: ((0, True), (1, True)),
+    RelationType.FINISH_TO_START: ((0, True), (1, False)),
+    RelationType.START_TO_FINISH: ((1, True), (0, False)),
+    RelationType.START_TO_START: ((0, False), (1, False)),
+}
+
+# date penalty is sign * (start or end - day), absolute when sign is 0
+DATE_TERMS = {
+    DateType.AS_SOON_AS_POSSIBLE: (False, 1),
+    DateType.AS_LATE_AS_POSSIBLE: (True, -1),
+    DateType.MUST_START_ON: (False, 0),
+    DateType.MUST_FINISH_ON: (True, 0),
+    DateType.START_NO_EARLIER_THAN: (False, -1),
+    DateType.START_NO_LATER_THAN: (False, 1),
+    DateType.FINISH_NO_EARLIER_THAN: (True, -1),
+    DateType.FINISH_NO_LATER_THAN: (True, 1),
+}
+
+
+@dataclass
+class CompiledSchedule:
+    """Constraints of a schedule as index arrays into its assignments."""
+
+    hours: np.ndarray
+    relation_first: np.ndarray
+    relation_first_end: np.ndarray
+    relation_second: np.ndarray
+    relation_second_end: np.ndarray
+    date_assignment: np.ndarray
+    date_end: np.ndarray
+    date_sign: np.ndarray
+    date_day: np.ndarray
+    resource_assignments: list[np.ndarray]
+    resource_capacity: np.ndarray
+
+    @staticmethod
+    def compile(schedule: Schedule):
+        # constraints refer to assignment objects, ids are not always unique
+        index = {id(a): i for i, a in enumerate(schedule.assignments)}
+
+        relations = []
+        dates = []
+        resources = []
+        for constraint in schedule.constraints:
+            if isinstance(constraint, RelationConstraint):
+                sides = (constraint.predecessor, constraint.successor)
+                (a, a_end), (b, b_end) = RELATION_TERMS[constraint.type]
+                relations.append(
+                    (index[id(sides[a])], a_end, index[id(sides[b])], b_end)
+                )
+            elif isinstance(constraint, DateConstraint):
+                end, sign = DATE_TERMS[constraint.type]
+                assignment = index[id(constraint.assignment)]
+                dates.append((assignment, end, sign, constraint.day))
+            elif isinstance(constraint, ResourceConstraint):
+                resources.append(constraint)
+            else:
+                raise NotImplementedError(type(constraint).__name__)
+
+        relation_columns = list(zip(*relations)) or [()] * 4
+        date_columns = list(zip(*dates)) or [()] * 4
+
+        return CompiledSchedule(
+            hours=np.array([a.hours for a in schedule.assignments], dtype=np.float64),
+            relation_first=np.array(relation_columns[0], dtype=np.intp),
+            relation_first_end=np.array(relation_columns[1], dtype=bool),
+            relation_second=np.array(relation_columns[2], dtype=np.intp),
+            relation_second_end=np.array(relation_columns[3], dtype=bool),
+            date_assignment=np.array(date_columns[0], dtype=np.intp),
+            date_end=np.array(date_columns[1], dtype=bool),
+            date_sign=np.array(date_columns[2], dtype=np.int64),
+            date_day=np.array(date_columns[3], dtype=np.float64),
+            resource_assignments=[
+                np.array([index[id(a)] for a in c.assignments], dtype=np.intp)
+                for c in resources
+            ],
+            resource_capacity=np.array(
+                [c.resource.total_capacity for c in resources], dtype=np.float64
+            ),
+        )
+
+    def __len__(self):
+        return len(self.hours)
+
+
+def _pad(arrays: list[np.ndarray], width: int, dtype) -> np.ndarray:
+    padded = np.zeros((len(arrays), width), dtype=dtype)
+    for i, a in enumerate(arrays):
+        padded[i, : len(a)] = a
+
+    return padded
+
+
+class BatchEvaluator:
+    """Scores chromosomes of several schedules with one set of array operations.
+
+    The compiled schedules are padded to the largest instance, padding is
+    masked out so every row is scored exactly like `AbsoluteScheduleInterpreter`
+    with `repair_pct=0` scores it on its own schedule.
+    """
+
+    def __init__(self, schedules: list[CompiledSchedule]):
+        self.schedules = schedules
+        self.sizes = np.array([len(s) for s in schedules], dtype=np.intp)
+        n = max(self.sizes, default=0)
+
+        self.assignment_mask = np.arange(n) < self.sizes[:, None]
+        self.hours = _pad([s.hours for s in schedules], n, np.float64)
+
+        m = max((len(s.relation_first) for s in schedules), default=0)
+        self.relation_mask = _pad(
+            [np.ones(len(s.relation_first), bool) for s in schedules], m, bool
+        )
+        self.relation_first = _pad([s.relation_first for s in schedules], m, np.intp)
+        self.relation_first_end = _pad(
+            [s.relation_first_end for s in schedules], m, bool
+        )
+        self.relation_second = _pad([s.relation_second for s in schedules], m, np.intp)
+        self.relation_second_end = _pad(
+            [s.relation_second_end for s in schedules], m, bool
+        )
+
+        d = max((len(s.date_assignment) for s in schedules), default=0)
+        self.date_mask = _pad(
+            [np.ones(len(s.date_assignment), bool) for s in schedules], d, bool
+        )
+        self.date_assignment = _pad([s.date_assignment for s in schedules], d, np.intp)
+        self.date_end = _pad([s.date_end for s in schedules], d, bool)
+        self.date_sign = _pad([s.date_sign for s in schedules], d, np.int64)
+        self.date_day = _pad([s.date_day for s in schedules], d, np.float64)
+
+        # every resource constraint becomes a row of member assignments, rows of
+        # all instances are stacked and padded to the largest constraint
+        self.resource_instance = np.concatenate(
+            [np.full(len(s.resource_assignments), k) for k, s in enumerate(schedules)]
+            + [np.zeros(0, np.intp)]
+        ).astype(np.intp)
+        members = [a for s in schedules for a in s.resource_assignments]
+        width = max((len(a) for a in members), default=0)
+        self.resource_members = _pad(members, width, np.intp)
+        self.resource_member_mask = _pad(
+            [np.ones(len(a), bool) for a in members], width, bool
+        )
+        self.resource_capacity = np.concatenate(
+            [s.resource_capacity for s in schedules] + [np.zeros(0)]
+        )
+
+    @staticmethod
+    def from_schedules(schedules: list[Schedule]):
+        return BatchEvaluator([CompiledSchedule.compile(s) for s in schedules])
+
+    def evaluate(
+        self, instance: np.ndarray, genes: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Scores rows of `genes`, row `i` is a chromosome of `instance[i]`.
+
+        `genes` is padded to twice the largest instance, the returned
+        chromosomes are rounded with durations of at least one day.
+        """
+        instance = np.asarray(instance, dtype=np.intp)
+        genes = np.asarray(genes, dtype=np.float64).round()
+        rows = np.arange(len(instance))[:, None]
+
+        start = genes[:, ::2]
+        duration = np.maximum(genes[:, 1::2], 1)
+        end = start + duration
+        hours_per_day = np.ceil(self.hours[instance] / duration)
+
+        # relations
+        first = np.where(
+            self.relation_first_end[instance],
+            end[rows, self.relation_first[instance]],
+            start[rows, self.relation_first[instance]],
+        )
+        second = np.where(
+            self.relation_second_end[instance],
+            end[rows, self.relation_second[instance]],
+            start[rows, self.relation_second[instance]],
+        )
+        relation = np.maximum(first - second, 0) * self.relation_mask[instance]
+
+        # dates
+        assigned = self.date_assignment[instance]
+        day = np.where(
+            self.date_end[instance], end[rows, assigned], start[rows, assigned]
+        )
+        difference = day - self.date_day[instance]
+        sign = self.date_sign[instance]
+        date = np.where(sign == 0, np.abs(difference), sign * difference)
+        date = np.maximum(date, 0) * self.date_mask[instance]
+
+        penalty = relation.sum(axis=1) + date.sum(axis=1)
+        penalty += self._resource_penalty(instance, start, end, hours_per_day)
+
+        mask = self.assignment_mask[instance]
+        makespan = np.where(mask, end, -np.inf).max(axis=1, initial=-np.inf)
+        makespan -= np.where(mask, start, np.inf).min(axis=1, initial=np.inf)
+        makespan[~mask.any(axis=1)] = 0
+
+        chromosomes = np.empty_like(genes)
+        chromosomes[:, ::2] = start
+        chromosomes[:, 1::2] = duration
+
+        return np.column_stack([penalty, makespan]), chromosomes
+
+    def _resource_penalty(
+        self,
+        instance: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray,
+        hours_per_day: np.ndarray,
+    ) -> np.ndarray:
+        penalty = np.zeros(len(instance))
+        if not len(self.resource_capacity):
+            return penalty
+
+        # (row, resource constraint) pairs of the instances being scored
+        rows, constraints = np.nonzero(
+            instance[:, None] == self.resource_instance[None, :]
+        )
+        if not len(rows):
+            return penalty
+
+        members = self.resource_members[constraints]
+        used = self.resource_member_mask[constraints]
+        load = hours_per_day[rows[:, None], members] * used
+
+        # sweep over start and end days, the load between two events is
+        # constant so the overload of all days in between is load * days
+        times = np.concatenate(
+            [start[rows[:, None], members], end[rows[:, None], members]], axis=1
+        )
+        deltas = np.concatenate([load, -load], axis=1)
+        order = np.argsort(times, axis=1, kind="stable")
+        times = np.take_along_axis(times, order, axis=1)
+        current = np.cumsum(np.take_along_axis(deltas, order, axis=1), axis=1)
+
+        capacity = self.resource_capacity[constraints][:, None]
+        overload = np.maximum(current[:, :-1] - capacity, 0) * np.diff(times, axis=1)
+        np.add.at(penalty, rows, overload.sum(axis=1))
+
+        return penalty
+
+    def evaluate_groups(
+        self, groups: list[tuple[int, np.ndarray]]
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Scores a matrix of chromosomes per instance in a single batch."""
+        sizes = [len(g) for _, g in groups]
+        if not sum(sizes):
+            return [(np.zeros((0, 2)), g) for _, g in groups]
+
+        width = 2 * self.assignment_mask.shape[1]
+        instance = np.repeat([k for k, _ in groups], sizes)
+        genes = np.zeros((len(instance), width))
+        offset = 0
+        for (_, g), size in zip(groups, sizes):
+            genes[offset : offset + size, : g.shape[1]] = g
+            offset += size
+
+        scores, chromosomes = self.evaluate(instance, genes)
+
+        results = []
+        offset = 0
+        for (k, _), size in zip(groups, sizes):
+            block = slice(offset, offset + size)
+            results.append((scores[block], chromosomes[block, : 2 * self.sizes[k]]))
+            offset += size
+
+        return results
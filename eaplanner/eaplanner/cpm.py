@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from eaplanner.compiled import CompiledSchedule
+from eaplanner.entities.schedule import Schedule
+from eaplanner.sgs import Network
+
+
+def topological_levels(
+    n: int, first: np.ndarray, second: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Level of every node and the edges that are kept.
+
+    A node is one level above the highest of its predecessors. When the edges
+    form a cycle, the edges between the nodes that are left are dropped, which
+    only loosens the bounds that are derived from them.
+    """
+    kept = first != second
+    order = np.argsort(first, kind="stable")
+    offsets = np.searchsorted(first[order], np.arange(n + 1))
+    indegree = np.bincount(second[kept], minlength=n)
+
+    level = np.full(n, -1, dtype=np.int64)
+    frontier = np.flatnonzero(indegree == 0)
+    depth = 0
+    done = 0
+    while done < n:
+        if frontier.size == 0:
+            rest = level < 0
+            kept &= ~(rest[first] & rest[second])
+            frontier = np.flatnonzero(rest)
+
+        level[frontier] = depth
+        done += frontier.size
+        depth += 1
+
+        # edges leaving the frontier, gathered from their slices of `order`
+        counts = offsets[frontier + 1] - offsets[frontier]
+        steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        edges = order[np.repeat(offsets[frontier], counts) + steps]
+        edges = edges[kept[edges]]
+
+        targets, decrements = np.unique(second[edges], return_counts=True)
+        indegree[targets] -= decrements
+        frontier = targets[(indegree[targets] == 0) & (level[targets] < 0)]
+
+    return level, kept
+
+
+@dataclass
+class CriticalPath:
+    """Earliest and latest days of every assignment, from day zero on.
+
+    Durations are at least `durations` and may be longer, the shortest ones
+    with which assignments fit their resources are `Network.min_duration`. For relations to a
+    finish this means that an assignment can start earlier by taking longer,
+    so the bounds hold for every schedule that meets the relations.
+    """
+
+    durations: np.ndarray
+    earliest_start: np.ndarray
+    earliest_finish: np.ndarray
+    latest_start: np.ndarray
+    latest_finish: np.ndarray
+
+    @property
+    def makespan(self) -> int:
+        return int(self.earliest_finish.max(initial=0))
+
+    @property
+    def slack(self) -> np.ndarray:
+        return self.latest_start - self.earliest_start
+
+    @property
+    def critical(self) -> np.ndarray:
+        return self.slack == 0
+
+    @staticmethod
+    def compute(compiled: CompiledSchedule, durations: np.ndarray):
+        n = len(compiled)
+        first, first_end = compiled.relation_first, compiled.relation_first_end
+        second, second_end = compiled.relation_second, compiled.relation_second_end
+
+        level, kept = topological_levels(n, first, second)
+        depth = int(level.max(initial=-1)) + 1
+        nodes = np.argsort(level, kind="stable")
+        node_offsets = np.searchsorted(level[nodes], np.arange(depth + 1))
+        edges = np.flatnonzero(kept)
+        edges = edges[np.argsort(level[first[edges]], kind="stable")]
+        edge_offsets = np.searchsorted(level[first[edges]], np.arange(depth + 1))
+
+        # forward pass, a level is final once the levels below it pushed their edges
+        start = np.zeros(n, dtype=np.int64)
+        finish = np.zeros(n, dtype=np.int64)
+        for d in range(depth):
+            v = nodes[node_offsets[d] : node_offsets[d + 1]]
+            finish[v] = np.maximum(finish[v], start[v] + durations[v])
+
+            e = edges[edge_offsets[d] : edge_offsets[d + 1]]
+            time = np.where(first_end[e], finish[first[e]], start[first[e]])
+            to_end = second_end[e]
+            np.maximum.at(start, second[e][~to_end], time[~to_end])
+            np.maximum.at(finish, second[e][to_end], time[to_end])
+
+        # backward pass from the makespan, in the reverse order of the levels
+        makespan = finish.max(initial=0)
+        latest_start = np.full(n, makespan, dtype=np.int64)
+        latest_finish = np.full(n, makespan, dtype=np.int64)
+        for d in reversed(range(depth)):
+            e = edges[edge_offsets[d] : edge_offsets[d + 1]]
+            time = np.where(
+                second_end[e], latest_finish[second[e]], latest_start[second[e]]
+            )
+            from_end = first_end[e]
+            np.minimum.at(latest_finish, first[e][from_end], time[from_end])
+            np.minimum.at(latest_start, first[e][~from_end], time[~from_end])
+
+            v = nodes[node_offsets[d] : node_offsets[d + 1]]
+            latest_start[v] = np.minimum(
+                latest_start[v], latest_finish[v] - durations[v]
+            )
+
+        return CriticalPath(durations, start, finish, latest_start, latest_finish)
+
+
+def resource_lower_bound(compiled: CompiledSchedule) -> int:
+    """Days needed by the resource with the most work for its capacity.
+
+    Every assignment uses at least its hours of a resource, spread over days
+    on which the resource has its capacity.
+    """
+    bound = 0
+    for members, capacity in zip(
+        compiled.resource_assignments, compiled.resource_capacity
+    ):
+        if capacity > 0 and len(members):
+            hours = compiled.hours[np.unique(members)].sum()
+            bound = max(bound, int(np.ceil(hours / capacity)))
+
+    return bound
+
+
+def makespan_lower_bound(schedule: Schedule) -> int:
+    """No schedule without penalty has a shorter makespan.
+
+    Date constraints are left out, which only loosens the bound.
+    """
+    compiled = CompiledSchedule.compile(schedule)
+    if len(compiled) == 0:
+        return 0
+
+    durations = np.array(Network.compile(schedule).min_duration, dtype=np.int64)
+
+    return max(
+        CriticalPath.compute(compiled, durations).makespan,
+        resource_lower_bound(compiled),
+    )
@@ -1,15 +1,18 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
 import math
-
-from matplotlib import patches
-from matplotlib.axes import Axes
+from typing import TYPE_CHECKING
 
 from eaplanner.entities.assignment import Assignment
 from eaplanner.entities.enum import DateType, RelationType
 from eaplanner.entities.resource import Resource
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
 
 class BaseConstraint(ABC):
     @abstractmethod
@@ -365,6 +368,8 @@ class ResourceConstraint(BaseConstraint):
         return False
 
     def visualize_gantt(self, ax: Axes):
+        from matplotlib import patches
+
         for assignment in self.assignments:
             ax.add_patch(
                 patches.Rectangle(
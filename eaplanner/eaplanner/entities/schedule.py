@@ -1,24 +1,31 @@
-import seaborn as sns
+from __future__ import annotations
+
 from pathlib import Path
 import pickle
-import random
 from collections import defaultdict
 from dataclasses import dataclass, field
+from math import isnan
+from typing import TYPE_CHECKING
 
-import matplotlib.patches as patches
-import networkx as nx
-from matplotlib import pyplot as plt
-from matplotlib.axes import Axes
+import numpy as np
 
 from eaplanner.entities.assignment import Assignment
 from eaplanner.entities.resource import Resource
 from eaplanner.entities.constraint import (
     BaseConstraint,
+    DateConstraint,
     RelationConstraint,
     ResourceConstraint,
 )
+from eaplanner.entities.enum import DateType, RelationType
 import csv
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+# constraint types in the order of `constraint_kind` in npz files
+CONSTRAINT_KINDS = (RelationConstraint, DateConstraint, ResourceConstraint)
+
 
 @dataclass
 class Schedule:
@@ -66,15 +73,22 @@ class Schedule:
         self.assignments = [a for a in self.assignments if a.id in assignment_ids]
 
     def repair_constraints(
-        self, shuffle: bool = True, pct: float = 1.0, max_loops: int = 2
+        self,
+        shuffle: bool = True,
+        pct: float = 1.0,
+        max_loops: int = 2,
+        *,
+        rng: np.random.Generator,
     ):
         constraints = self.constraints
         for _ in range(max_loops):
             # randomly select constraints
-            constraints = [c for c in self.constraints if random.uniform(0, 1) <= pct]
+            selected = rng.uniform(0, 1, len(self.constraints)) <= pct
+            constraints = [c for c, keep in zip(self.constraints, selected) if keep]
 
             if shuffle:
-                constraints = sorted(constraints, key=lambda _: random.random())
+                order = rng.permutation(len(constraints))
+                constraints = [constraints[i] for i in order]
 
             # list comprehension to run all attempts
             if not any([c.attempt_repair() for c in constraints]):
@@ -127,6 +141,9 @@ class Schedule:
         return G
 
     def visualize_graph(self, ax: Axes | None = None, show_edge_labels: bool = True):
+        import networkx as nx
+        from matplotlib import pyplot as plt
+
         G = self.as_graph()
 
         if ax is None:
@@ -161,6 +178,10 @@ class Schedule:
         show_constraints: bool = True,
         show_legend: bool = False,
     ):
+        import matplotlib.patches as patches
+        import seaborn as sns
+        from matplotlib import pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
 
@@ -214,6 +235,8 @@ class Schedule:
         return ax
 
     def visualize_required_resources(self, ax: Axes | None = None, legend: bool = True):
+        from matplotlib import pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
 
@@ -240,6 +263,8 @@ class Schedule:
         return ax
 
     def visualize_hours_per_day(self, ax: Axes | None = None):
+        from matplotlib import pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
 
@@ -263,40 +288,89 @@ class Schedule:
     def save_csv(self, filepath: Path):
         filepath.mkdir(parents=True, exist_ok=True)
 
-        # write assignments
-        with open(filepath / "activities.csv", "w+") as f:
-            f.write("id,hours,start,duration\n")
-            for assignment in self.assignments:
-                f.write(assignment.to_csv_row() + "\n")
-
-        # write relation constraints
         relation_constraints = [
             constraint
             for constraint in self.constraints
             if isinstance(constraint, RelationConstraint)
         ]
-        with open(filepath / "sequence_constraints.csv", "w+") as f:
-            f.write("predecessor_id,successor_id,type\n")
-            for constraint in relation_constraints:
-                f.write(constraint.to_csv_row() + "\n")
-
-        # write resource constraints
         resource_constraints = [
             constraint
             for constraint in self.constraints
             if isinstance(constraint, ResourceConstraint)
         ]
-        with open(filepath / "resource_constraints.csv", "w+") as f:
-            f.write("resource_name,assignment_ids\n")
-            for constraint in resource_constraints:
-                f.write(constraint.to_csv_row() + "\n")
-
-        # write resources
         resources = [c.resource for c in resource_constraints]
-        with open(filepath / "resources.csv", "w+") as f:
-            f.write("name,total_capacity\n")
-            for resource in resources:
-                f.write(resource.to_csv_row() + "\n")
+
+        # every file is written at once
+        files = {
+            "activities.csv": ("id,hours,start,duration", self.assignments),
+            "sequence_constraints.csv": (
+                "predecessor_id,successor_id,type",
+                relation_constraints,
+            ),
+            "resource_constraints.csv": (
+                "resource_name,assignment_ids",
+                resource_constraints,
+            ),
+            "resources.csv": ("name,total_capacity", resources),
+        }
+        for name, (header, rows) in files.items():
+            lines = [header, *(row.to_csv_row() for row in rows)]
+            (filepath / name).write_text("\n".join(lines) + "\n")
+
+    def save_npz(self, filename: Path):
+        """Saves the schedule as arrays in a single compressed numpy file.
+
+        Constraints refer to assignments by their position in `assignments`,
+        their order is kept because repairs walk the constraints in order.
+        """
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        index = {id(a): i for i, a in enumerate(self.assignments)}
+        kinds = [CONSTRAINT_KINDS.index(type(c)) for c in self.constraints]
+
+        relations = [c for c in self.constraints if isinstance(c, RelationConstraint)]
+        dates = [c for c in self.constraints if isinstance(c, DateConstraint)]
+        resources = [c for c in self.constraints if isinstance(c, ResourceConstraint)]
+        members = [[index[id(a)] for a in c.assignments] for c in resources]
+
+        with open(filename, "wb") as f:
+            np.savez_compressed(
+                f,
+                constraint_kind=np.array(kinds, np.int64),
+                assignment_id=np.array([a.id for a in self.assignments], np.int64),
+                assignment_hours=np.array([a.hours for a in self.assignments]),
+                assignment_start=np.array(
+                    [a.start for a in self.assignments], np.int64
+                ),
+                assignment_duration=np.array(
+                    [a.duration for a in self.assignments], np.int64
+                ),
+                assignment_activity_id=np.array(
+                    [a.activity_id for a in self.assignments], np.int64
+                ),
+                relation_predecessor=np.array(
+                    [index[id(c.predecessor)] for c in relations], np.int64
+                ),
+                relation_successor=np.array(
+                    [index[id(c.successor)] for c in relations], np.int64
+                ),
+                relation_type=np.array([c.type.value for c in relations], np.int64),
+                date_assignment=np.array(
+                    [index[id(c.assignment)] for c in dates], np.int64
+                ),
+                date_type=np.array([c.type.value for c in dates], np.int64),
+                date_day=np.array([c.day for c in dates], np.int64),
+                resource_name=np.array([c.resource.name for c in resources], str),
+                resource_min_capacity=np.array(
+                    [c.resource.min_capacity for c in resources]
+                ),
+                resource_med_capacity=np.array(
+                    [c.resource.med_capacity for c in resources]
+                ),
+                # nan for a resource of all days
+                resource_day=np.array([c.resource.day for c in resources], np.float64),
+                resource_offsets=np.cumsum([0] + [len(m) for m in members]),
+                resource_members=np.array([j for m in members for j in m], np.int64),
+            )
 
     @staticmethod
     def load(filename: Path):
@@ -306,6 +380,9 @@ class Schedule:
         if filename.suffix == ".pkl":
             return Schedule.load_pickle(filename)
 
+        if filename.suffix == ".npz":
+            return Schedule.load_npz(filename)
+
         return Schedule.load_csv(filename)
 
     @staticmethod
@@ -317,6 +394,67 @@ class Schedule:
 
         return loaded
 
+    @staticmethod
+    def load_npz(filename: Path):
+        with np.load(filename) as data:
+            arrays = {name: data[name].tolist() for name in data.files}
+
+        assignments = []
+        for id, hours, start, duration, activity_id in zip(
+            arrays["assignment_id"],
+            arrays["assignment_hours"],
+            arrays["assignment_start"],
+            arrays["assignment_duration"],
+            arrays["assignment_activity_id"],
+        ):
+            assignment = Assignment(
+                hours=hours, id=id, start=start, activity_id=activity_id
+            )
+            assignment.duration = duration
+            assignments.append(assignment)
+
+        relations = [
+            RelationConstraint(RelationType(t), assignments[a], assignments[b])
+            for a, b, t in zip(
+                arrays["relation_predecessor"],
+                arrays["relation_successor"],
+                arrays["relation_type"],
+            )
+        ]
+
+        dates = [
+            DateConstraint(DateType(t), assignments[a], day)
+            for a, t, day in zip(
+                arrays["date_assignment"], arrays["date_type"], arrays["date_day"]
+            )
+        ]
+
+        offsets = arrays["resource_offsets"]
+        members = arrays["resource_members"]
+        resources = [
+            ResourceConstraint(
+                Resource(
+                    name, min_capacity, med_capacity, None if isnan(day) else int(day)
+                ),
+                [assignments[j] for j in members[offsets[i] : offsets[i + 1]]],
+            )
+            for i, (name, min_capacity, med_capacity, day) in enumerate(
+                zip(
+                    arrays["resource_name"],
+                    arrays["resource_min_capacity"],
+                    arrays["resource_med_capacity"],
+                    arrays["resource_day"],
+                )
+            )
+        ]
+
+        per_kind = [iter(relations), iter(dates), iter(resources)]
+        constraints: list[BaseConstraint] = [
+            next(per_kind[k]) for k in arrays["constraint_kind"]
+        ]
+
+        return Schedule(assignments=assignments, constraints=constraints)
+
     @staticmethod
     def load_csv(filename: Path):
         assignments: list[Assignment] = []
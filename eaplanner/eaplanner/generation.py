@@ -1,5 +1,4 @@
 import math
-import random
 from typing import Literal
 
 import networkx as nx
@@ -7,6 +6,7 @@ import numpy as np
 
 from eaplanner.entities.assignment import Assignment
 from eaplanner.entities.constraint import (
+    BaseConstraint,
     DateConstraint,
     RelationConstraint,
     ResourceConstraint,
@@ -28,17 +28,18 @@ class ScheduleGenerator:
         std_hours: float = 150,
         mu_resources: float = 100,
         std_resources: float = 30,
-        seed: int | None = None,
+        seed: int | np.random.SeedSequence | None = None,
+        rng: np.random.Generator | None = None,
     ):
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            rng = np.random.default_rng(seed)
 
-        G = cls.generate_schedule_graph(n_assignments, k, seed)
+        G = cls.generate_schedule_graph(n_assignments, k, rng=rng)
         G = cls.sort_graph_nodes(G)
 
         schedule = Schedule()
-        cls.add_assignments_to_schedule(mu_hours, std_hours, G, schedule)
-        cls.add_relations_to_schedule(G, schedule)
+        cls.add_assignments_to_schedule(mu_hours, std_hours, G, schedule, rng=rng)
+        cls.add_relations_to_schedule(G, schedule, rng=rng)
 
         schedule.assignments.sort(key=lambda assignment: assignment.id)
 
@@ -46,22 +47,185 @@ class ScheduleGenerator:
             if schedule.get_total_penalty() == 0:
                 break
 
-            schedule.repair_constraints(max_loops=100)
+            schedule.repair_constraints(max_loops=100, rng=rng)
             cls.flip_invalid_relations(schedule)
 
         cls.remove_invalid_relations(schedule)
         cls.reset_assignments_starts(schedule)
-        cls.add_dates_to_schedule(schedule, p_date)
+        cls.add_dates_to_schedule(schedule, p_date, rng=rng)
 
         if n_resources == "auto" or n_resources > 0:
             cls.generate_resources_for_schedule(
-                mu_resources, std_resources, schedule, n_resources
+                mu_resources, std_resources, schedule, n_resources, rng=rng
             )
 
         cls.remove_empty_constraints(schedule)
 
         return schedule
 
+    @classmethod
+    def generate_dag_schedule(
+        cls,
+        n_assignments: int,
+        k: int = 2,
+        n_resources: int | Literal["auto"] = "auto",
+        p_date: float = 0.16,
+        mu_hours: float = 50,
+        std_hours: float = 150,
+        mu_resources: float = 100,
+        std_resources: float = 30,
+        p_rel: list[float] = [0.09, 0.73, 0.0, 0.18],
+        date_weights: list[float] = [0.0, 0.89, 0.09, 0.01, 0.0, 0.0, 0.0, 0.0],
+        seed: int | np.random.SeedSequence | None = None,
+        rng: np.random.Generator | None = None,
+    ):
+        """Generates a schedule like `generate_random_schedule`, for large instances.
+
+        Relations only point from a lower to a higher assignment id, so the
+        graph is acyclic by construction and the ids are a topological order.
+        The starts are the earliest starts that satisfy every relation,
+        found in one pass over the relations, instead of repeated repairs.
+        Unlike `generate_random_schedule` the graph is not transitively reduced.
+        """
+        if rng is None:
+            rng = np.random.default_rng(seed)
+
+        first, second = cls.generate_dag_edges(n_assignments, k, rng=rng)
+        types = rng.choice(len(RelationType), size=len(first), p=p_rel)
+
+        hours = rng.chisquare(df=1, size=n_assignments) * std_hours + mu_hours
+        hours = np.maximum(1, hours.astype(np.int64))
+        durations = np.maximum(1, hours // 10)
+        starts = cls.earliest_starts(first, second, types, durations)
+
+        # start to finish relations can not be met by a forward pass, like in
+        # generate_random_schedule they are flipped or removed when violated
+        ends = starts + durations
+        invalid = (types == RelationType.START_TO_FINISH.value) & (
+            ends[second] > starts[first]
+        )
+        first[invalid], second[invalid] = second[invalid], first[invalid]
+        invalid &= ends[second] > starts[first]
+        first, second, types = first[~invalid], second[~invalid], types[~invalid]
+
+        assignments = []
+        for i, (h, start, duration) in enumerate(
+            zip(hours.tolist(), starts.tolist(), durations.tolist())
+        ):
+            assignment = Assignment(hours=h, id=i, start=start)
+            assignment.duration = duration
+            assignments.append(assignment)
+
+        constraints: list[BaseConstraint] = [
+            RelationConstraint(RelationType(t), assignments[a], assignments[b])
+            for a, b, t in zip(first.tolist(), second.tolist(), types.tolist())
+        ]
+
+        # dates are met by the generated starts, like in add_dates_to_schedule
+        dated = np.flatnonzero(rng.random(n_assignments) < p_date)
+        p = np.asarray(date_weights) / np.sum(date_weights)
+        date_types = rng.choice(len(DateType), size=len(dated), p=p)
+        for i, t in zip(dated.tolist(), date_types.tolist()):
+            constraint = DateConstraint(DateType(t), assignments[i], 0)
+            constraint.day = constraint.get_constraint_day()
+            constraints.append(constraint)
+
+        schedule = Schedule(assignments=assignments, constraints=constraints)
+        if n_assignments and (n_resources == "auto" or n_resources > 0):
+            if n_resources == "auto":
+                n_resources = cls.calculate_n_resources(schedule)
+
+            order = rng.permutation(n_assignments)
+            capacities = np.ceil(rng.normal(mu_resources, std_resources, n_resources))
+            capacities = np.maximum(1, capacities).astype(np.int64)
+            for i, (chunk, capacity) in enumerate(
+                zip(np.array_split(order, n_resources), capacities.tolist())
+            ):
+                if len(chunk):
+                    resource = Resource(name=f"Resource {i}", min_capacity=capacity)
+                    schedule.add_constraint(
+                        ResourceConstraint(resource, [assignments[j] for j in chunk])
+                    )
+
+        return schedule
+
+    @staticmethod
+    def generate_dag_edges(
+        n_assignments: int, k: int, rng: np.random.Generator | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Random edges from lower to higher nodes, with on average k per node.
+
+        Every pair of nodes is connected with probability k / (n - 1), like in
+        `generate_schedule_graph`, and isolated nodes get an edge to a random
+        other node.
+        """
+        rng = np.random.default_rng(rng)
+        n = n_assignments
+        if n < 2 or k <= 0:
+            return np.zeros(0, np.int64), np.zeros(0, np.int64)
+
+        pairs = n * (n - 1) // 2
+        n_edges = rng.binomial(pairs, min(1, k / (n - 1)))
+
+        # pairs are drawn with replacement and deduplicated until there are enough
+        keys = np.zeros(0, np.int64)
+        while len(keys) < n_edges:
+            missing = n_edges - len(keys)
+            a = rng.integers(0, n, size=missing + missing // 8 + 16)
+            b = rng.integers(0, n, size=len(a))
+            a, b = np.minimum(a, b)[a != b], np.maximum(a, b)[a != b]
+            keys = np.unique(np.concatenate([keys, a * n + b]))
+        keys = rng.permutation(keys)[:n_edges]
+        first, second = keys // n, keys % n
+
+        degree = np.bincount(first, minlength=n) + np.bincount(second, minlength=n)
+        isolated = np.flatnonzero(degree == 0)
+        other = rng.integers(0, n - 1, size=len(isolated))
+        other += other >= isolated
+        first = np.concatenate([first, np.minimum(isolated, other)])
+        second = np.concatenate([second, np.maximum(isolated, other)])
+
+        # deduplicate edges between two isolated nodes that chose each other
+        keys = np.unique(first * n + second)
+
+        return keys // n, keys % n
+
+    @staticmethod
+    def earliest_starts(
+        first: np.ndarray,
+        second: np.ndarray,
+        types: np.ndarray,
+        durations: np.ndarray,
+    ) -> np.ndarray:
+        """Earliest starts meeting the relations of a graph in topological order.
+
+        Relations are visited by successor, every predecessor has a lower index
+        so its start is final before the relations leaving it are visited.
+        """
+        starts = [0] * len(durations)
+        duration = durations.tolist()
+        finish_to_finish = RelationType.FINISH_TO_FINISH.value
+        finish_to_start = RelationType.FINISH_TO_START.value
+        start_to_start = RelationType.START_TO_START.value
+
+        order = np.argsort(second, kind="stable")
+        for a, b, t in zip(
+            first[order].tolist(), second[order].tolist(), types[order].tolist()
+        ):
+            if t == finish_to_start:
+                bound = starts[a] + duration[a]
+            elif t == start_to_start:
+                bound = starts[a]
+            elif t == finish_to_finish:
+                bound = starts[a] + duration[a] - duration[b]
+            else:
+                continue
+
+            if bound > starts[b]:
+                starts[b] = bound
+
+        return np.array(starts, dtype=np.int64)
+
     @staticmethod
     def sort_graph_nodes(G: nx.DiGraph) -> nx.DiGraph:
         sorted_nodes = list(nx.lexicographical_topological_sort(G))  # type: ignore
@@ -105,11 +269,15 @@ class ScheduleGenerator:
         schedule: Schedule,
         p_date: float = 0.16,
         weights=[0.0, 0.89, 0.09, 0.01, 0.0, 0.0, 0.0, 0.0],
+        rng: np.random.Generator | None = None,
     ):
+        rng = np.random.default_rng(rng)
+        # the default weights do not sum to exactly one
+        p = np.asarray(weights) / np.sum(weights)
         for assignment in schedule.assignments:
-            if random.random() < p_date:
+            if rng.random() < p_date:
                 constraint = DateConstraint(
-                    DateType(np.random.choice(range(len(DateType)), p=weights)),
+                    DateType(rng.choice(len(DateType), p=p)),
                     assignment,
                     0,
                 )
@@ -123,18 +291,20 @@ class ScheduleGenerator:
         std_hours: float,
         schedule: Schedule,
         n_resources: int | Literal["auto"] = "auto",
+        rng: np.random.Generator | None = None,
     ):
+        rng = np.random.default_rng(rng)
         if n_resources == "auto":
             # params obtained from log regression
             n_resources = ScheduleGenerator.calculate_n_resources(schedule)
 
-        random.shuffle(schedule.assignments)
+        rng.shuffle(schedule.assignments)  # type: ignore
         chunks = np.array_split(np.asarray(schedule.assignments), n_resources)
 
         for i, chunk in enumerate(chunks):
             resource = Resource(
                 name=f"Resource {i}",
-                min_capacity=max(1, math.ceil(random.gauss(mu_hours, std_hours))),
+                min_capacity=max(1, math.ceil(rng.normal(mu_hours, std_hours))),
             )
             constraint = ResourceConstraint(
                 resource,
@@ -150,24 +320,34 @@ class ScheduleGenerator:
 
     @staticmethod
     def add_assignments_to_schedule(
-        mu_hours: float, std_hours: float, G: nx.DiGraph, schedule: Schedule
+        mu_hours: float,
+        std_hours: float,
+        G: nx.DiGraph,
+        schedule: Schedule,
+        rng: np.random.Generator | None = None,
     ):
+        rng = np.random.default_rng(rng)
         for node in G.nodes:
-            hours = max(1, int(np.random.chisquare(df=1) * std_hours + mu_hours))
+            hours = max(1, int(rng.chisquare(df=1) * std_hours + mu_hours))
             assignment = Assignment(id=node, hours=hours)
             assignment.duration = hours // 10
             schedule.add_assignment(assignment)
 
     @staticmethod
     def add_relations_to_schedule(
-        G: nx.DiGraph, schedule: Schedule, p_rel: list[float] = [0.09, 0.73, 0.0, 0.18]
+        G: nx.DiGraph,
+        schedule: Schedule,
+        p_rel: list[float] = [0.09, 0.73, 0.0, 0.18],
+        rng: np.random.Generator | None = None,
     ):
+        rng = np.random.default_rng(rng)
+        assignments = {assignment.id: assignment for assignment in schedule.assignments}
         for edge in G.edges:
-            predecessor = schedule.get_assignment_by_id(edge[0])
-            successor = schedule.get_assignment_by_id(edge[1])
+            predecessor = assignments[edge[0]]
+            successor = assignments[edge[1]]
             schedule.add_constraint(
                 RelationConstraint(
-                    RelationType(np.random.choice(range(len(RelationType)), p=p_rel)),
+                    RelationType(rng.choice(len(RelationType), p=p_rel)),
                     predecessor,
                     successor,
                 )
@@ -175,12 +355,19 @@ class ScheduleGenerator:
 
     @classmethod
     def generate_schedule_graph(
-        cls, n_assignments: int, k: int, seed: int | None = None
+        cls,
+        n_assignments: int,
+        k: int,
+        seed: int | None = None,
+        rng: np.random.Generator | None = None,
     ) -> nx.DiGraph:
+        if rng is None:
+            rng = np.random.default_rng(seed)
+
         # on average every assignment will be connected to k other assignments
         p_edge = max(0, k / (n_assignments - 1))
         G = nx.generators.random_graphs.binomial_graph(
-            n=n_assignments, p=p_edge, seed=seed, directed=True
+            n=n_assignments, p=p_edge, seed=rng, directed=True
         )
 
         cls.remove_cycles(G)
@@ -190,7 +377,8 @@ class ScheduleGenerator:
             return G
 
         for isolated_node in nx.isolates(G):  # type: ignore
-            selected_node = random.sample([n for n in G.nodes], 1)[0]
+            nodes = list(G.nodes)
+            selected_node = nodes[rng.integers(len(nodes))]
             if selected_node != isolated_node:
                 G.add_edge(isolated_node, selected_node)
 
@@ -1,12 +1,14 @@
 import pickle
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from time import perf_counter_ns
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from eaplanner.entities.schedule import Schedule
+from eaplanner.sgs import Network, parallel_sgs, serial_sgs
 
 if TYPE_CHECKING:
     from eaplanner.algorithms.base import Individual
@@ -16,6 +18,10 @@ if TYPE_CHECKING:
 class ScheduleInterpreterBase(metaclass=ABCMeta):
     schedule: Schedule
     repair_pct: float = 1.0
+    # draws the repairs, the algorithm replaces it with the generator of its run
+    rng: np.random.Generator = field(default_factory=np.random.default_rng)
+    # time spent repairing, read by the algorithm to separate it from evaluation
+    repair_ns: int = field(default=0, repr=False, compare=False)
 
     @abstractmethod
     def interpret(self, chromosome: "Individual") -> None:
@@ -25,7 +31,11 @@ class ScheduleInterpreterBase(metaclass=ABCMeta):
         self.interpret(chromosome)
 
         if self.repair_pct > 0:
-            self.schedule.repair_constraints(max_loops=1, shuffle=True, pct=self.repair_pct)
+            start = perf_counter_ns()
+            self.schedule.repair_constraints(
+                max_loops=1, shuffle=True, pct=self.repair_pct, rng=self.rng
+            )
+            self.repair_ns += perf_counter_ns() - start
 
         return self.get_scores(), self.to_chromosome()
 
@@ -76,3 +86,46 @@ class AbsoluteScheduleInterpreter(ScheduleInterpreterBase):
         ):
             assignment.start = int(start)
             assignment.duration = int(duration)
+
+
+# base class of the interpreters that decode the chromosome into a schedule that
+# meets the relations and resources, by scheduling the assignments in the order
+# of the genes with a schedule generation scheme
+@dataclass
+class ScheduleGenerationInterpreter(ScheduleInterpreterBase):
+    # the first gene of an assignment is its priority, lower is scheduled earlier
+    # the second gene is its duration, at least the shortest that fits its resources
+    network: Network = field(init=False, repr=False, compare=False)
+    scheme = staticmethod(serial_sgs)
+
+    def __post_init__(self):
+        self.network = Network.compile(self.schedule)
+
+    def interpret(self, chromosome: "Individual"):
+        durations = np.maximum(
+            chromosome[1::2].round(), self.network.min_duration
+        ).astype(np.int64)
+        starts = self.scheme(self.network, chromosome[::2].tolist(), durations.tolist())
+
+        for assignment, start, duration in zip(
+            self.schedule.assignments, starts, durations.tolist()
+        ):
+            assignment.start = start
+            assignment.duration = duration
+
+
+# places one assignment at a time at its earliest feasible day
+class SerialScheduleInterpreter(ScheduleGenerationInterpreter):
+    scheme = staticmethod(serial_sgs)
+
+
+# starts every assignment that fits at each event, in the order of the genes
+class ParallelScheduleInterpreter(ScheduleGenerationInterpreter):
+    scheme = staticmethod(parallel_sgs)
+
+
+INTERPRETERS = {
+    "absolute": AbsoluteScheduleInterpreter,
+    "serial": SerialScheduleInterpreter,
+    "parallel": ParallelScheduleInterpreter,
+}
@@ -0,0 +1,153 @@
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+STATS = ("avg", "min", "max", "std")
+
+
+class Logbook:
+    """Per generation statistics stored in growable numpy columns.
+
+    Every statistic in `stats` has one column per score, named
+    `{stat}_{score}`. Columns in `extra` hold a single float per generation.
+    The columns double in size when full, so recording is amortised O(1).
+    """
+
+    def __init__(
+        self,
+        score_names: Sequence[str],
+        stats: Sequence[str] = STATS,
+        extra: Sequence[str] = ("time",),
+        capacity: int = 1024,
+    ):
+        self.score_names = tuple(score_names)
+        self.stats = tuple(stats)
+        self.extra = tuple(extra)
+
+        self._columns: dict[str, np.ndarray] = {
+            "gen": np.zeros(capacity, dtype=np.int64),
+            "nevals": np.zeros(capacity, dtype=np.int64),
+        }
+        for stat in self.stats:
+            for score in self.score_names:
+                self._columns[f"{stat}_{score}"] = np.zeros(capacity)
+        for name in self.extra:
+            self._columns[name] = np.zeros(capacity)
+
+        self._size = 0
+        self._streamed = 0
+
+    @property
+    def header(self) -> list[str]:
+        return list(self._columns)
+
+    def record(self, gen: int, nevals: int, **values):
+        if self._size == len(self._columns["gen"]):
+            self._grow()
+
+        i = self._size
+        self._columns["gen"][i] = gen
+        self._columns["nevals"][i] = nevals
+
+        for stat in self.stats:
+            for score, value in zip(self.score_names, values[stat]):
+                self._columns[f"{stat}_{score}"][i] = value
+
+        for name in self.extra:
+            self._columns[name][i] = values.get(name, np.nan)
+
+        self._size += 1
+
+    def _grow(self):
+        for name, column in self._columns.items():
+            grown = np.zeros(max(1, 2 * len(column)), dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+    @property
+    def nbytes(self) -> int:
+        # allocated, so including the unused part of the columns
+        return sum(column.nbytes for column in self._columns.values())
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name][: self._size]
+
+    def select(self, *names: str):
+        # statistics return a (generations, scores) matrix, like the deap logbook
+        selected = []
+        for name in names:
+            if name in self.stats:
+                selected.append(
+                    np.column_stack(
+                        [self.column(f"{name}_{s}") for s in self.score_names]
+                    )
+                )
+            else:
+                selected.append(self.column(name))
+
+        return selected[0] if len(selected) == 1 else selected
+
+    @property
+    def stream(self) -> str:
+        lines = []
+        if self._streamed == 0:
+            lines.append("\t".join(self.header))
+
+        for i in range(self._streamed, self._size):
+            lines.append(
+                "\t".join(f"{column[i]:g}" for column in self._columns.values())
+            )
+
+        self._streamed = self._size
+
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, np.ndarray]:
+        return {name: self.column(name) for name in self._columns}
+
+    def to_dataframe(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.to_dict())
+
+    def to_csv(self, path: Path):
+        data = np.column_stack(list(self.to_dict().values()))
+        formats = [
+            "%d" if column.dtype.kind == "i" else "%s"
+            for column in self._columns.values()
+        ]
+        np.savetxt(
+            path,
+            data,
+            fmt=formats,
+            delimiter=",",
+            header=",".join(self.header),
+            comments="",
+        )
+
+    def to_parquet(self, path: Path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(pa.table(self.to_dict()), path)
+
+    def save(self, path: Path):
+        if path.suffix == ".parquet":
+            self.to_parquet(path)
+        else:
+            self.to_csv(path)
+
+    def __len__(self):
+        return self._size
+
+    def __getstate__(self):
+        # only pickle the filled part of the columns
+        state = self.__dict__.copy()
+        state["_columns"] = {
+            name: column[: self._size].copy() for name, column in self._columns.items()
+        }
+        # a resumed run streams to new output, which starts with the header
+        # and the generations before the checkpoint
+        state["_streamed"] = 0
+        return state
@@ -0,0 +1,130 @@
+import json
+import os
+import sqlite3
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# Default location of the manifest, next to the result folders
+MANIFEST_PATH = Path("results") / "manifest.sqlite"
+
+COLUMNS = {
+    "folder": "TEXT PRIMARY KEY",
+    "instance": "TEXT",
+    "instance_hash": "TEXT",
+    "algorithm": "TEXT",
+    "parameters": "TEXT",
+    "task": "TEXT",
+    "assignments": "INTEGER",
+    "constraints": "INTEGER",
+    "relation_constraints": "INTEGER",
+    "resource_constraints": "INTEGER",
+    "date_constraints": "INTEGER",
+    "original_penalty": "REAL",
+    "original_makespan": "REAL",
+    "solution_penalty": "REAL",
+    "solution_makespan": "REAL",
+    "evaluations": "INTEGER",
+    "generations": "INTEGER",
+    "started_at": "TEXT",
+    "finished_at": "TEXT",
+    "stop_reason": "TEXT",
+    "wall_time": "REAL",
+    "cpu_time": "REAL",
+}
+
+
+class RunManifest:
+    """Index of finished runs, one row per result folder.
+
+    Folders are stored relative to the manifest, so the same run is recognised
+    regardless of the working directory it was started from. Appending a run
+    for a folder that is already present replaces the earlier row, which is
+    what happens when a run is resumed.
+    """
+
+    def __init__(self, path: str | Path = MANIFEST_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as con:
+            columns = ", ".join(f"{k} {v}" for k, v in COLUMNS.items())
+            con.execute(f"CREATE TABLE IF NOT EXISTS runs ({columns})")
+
+            # manifests created by older versions miss the newer columns
+            existing = {row[1] for row in con.execute("PRAGMA table_info(runs)")}
+            for k, v in COLUMNS.items():
+                if k not in existing:
+                    con.execute(f"ALTER TABLE runs ADD COLUMN {k} {v}")
+
+            con.execute("CREATE INDEX IF NOT EXISTS runs_task ON runs (task)")
+
+    @contextmanager
+    def _connect(self):
+        # several runs finish at the same time when experiments run in parallel
+        con = sqlite3.connect(self.path, timeout=60)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def relative_folder(self, folder: str | Path) -> str:
+        return Path(
+            os.path.relpath(Path(folder).resolve(), self.path.parent.resolve())
+        ).as_posix()
+
+    def append(self, record: dict[str, Any]):
+        record = {k: v for k, v in record.items() if k in COLUMNS}
+        record["folder"] = self.relative_folder(record["folder"])
+        if not isinstance(record.get("parameters"), (str, type(None))):
+            record["parameters"] = json.dumps(record["parameters"], default=str)
+
+        columns = ", ".join(record)
+        placeholders = ", ".join("?" for _ in record)
+
+        with self._connect() as con:
+            con.execute(
+                f"INSERT OR REPLACE INTO runs ({columns}) VALUES ({placeholders})",
+                list(record.values()),
+            )
+
+    def records(self, where: str | None = None, *args) -> list[dict[str, Any]]:
+        query = "SELECT * FROM runs"
+        if where is not None:
+            query += f" WHERE {where}"
+
+        with self._connect() as con:
+            con.row_factory = sqlite3.Row
+            rows = con.execute(query, args).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def folders(self) -> set[str]:
+        with self._connect() as con:
+            return {row[0] for row in con.execute("SELECT folder FROM runs")}
+
+    def completed_tasks(self) -> Counter[str]:
+        # number of finished runs per task, for deciding which still need repeats
+        with self._connect() as con:
+            rows = con.execute(
+                "SELECT task, COUNT(*) FROM runs WHERE task IS NOT NULL GROUP BY task"
+            )
+            return Counter(dict(rows.fetchall()))
+
+    def to_dataframe(self, expand_parameters: bool = False):
+        import pandas as pd
+
+        with self._connect() as con:
+            df = pd.read_sql_query("SELECT * FROM runs", con)
+
+        if expand_parameters:
+            parameters = pd.json_normalize(df["parameters"].map(json.loads).tolist())
+            df = pd.concat([df.drop(columns="parameters"), parameters], axis=1)
+
+        return df
+
+    def __len__(self):
+        with self._connect() as con:
+            return con.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
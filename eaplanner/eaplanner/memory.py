@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import csv
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from eaplanner.algorithms.base import AlgorithmBase, Individual
+
+STRUCTURES = ("population", "fitness", "halloffame", "logbook")
+
+
+def individual_sizes(individuals: Iterable[Individual]) -> tuple[int, int]:
+    """Bytes of the genes and of the deap fitness objects of `individuals`.
+
+    Genes include the speed and best position of particles.
+    """
+    genes = 0
+    fitness = 0
+    for ind in individuals:
+        genes += sys.getsizeof(ind) + sys.getsizeof(vars(ind))
+        for name in ("speed", "best"):
+            value = getattr(ind, name, None)
+            if value is not None:
+                genes += sys.getsizeof(value)
+
+        fit = ind.fitness  # type: ignore
+        fitness += sys.getsizeof(fit) + sys.getsizeof(fit.wvalues)
+        fitness += sum(sys.getsizeof(v) for v in fit.wvalues)
+
+    return genes, fitness
+
+
+class MemoryProfiler:
+    """Samples the memory of a run every `every` generations.
+
+    Every sample has the resident set size of the process, the memory traced
+    by tracemalloc and the bytes held by the population, the fitness objects,
+    the hall of fame and the logbook. The `top` source lines that allocated
+    most of the traced memory are kept per sample as well.
+
+    Tracing makes every allocation slower, so this is meant for diagnosing
+    runs and not for experiments.
+    """
+
+    def __init__(self, every: int = 10, top: int = 10):
+        self.every = every
+        self.top = top
+        self.rows: list[dict[str, Any]] = []
+        self.sites: list[dict[str, Any]] = []
+        self._started_tracing = False
+        self._process = None
+
+    def start(self):
+        import psutil
+
+        self._process = psutil.Process()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def due(self, gen: int) -> bool:
+        return gen % self.every == 0
+
+    def sample(
+        self, algorithm: AlgorithmBase, population: list[Individual]
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        genes, fitness = individual_sizes(population)
+        hof_genes, hof_fitness = individual_sizes(algorithm.halloffame or [])
+        current, peak = tracemalloc.get_traced_memory()
+
+        row = {
+            "gen": algorithm.gen,
+            "nevals": algorithm.current_evals,
+            "rss": self._process.memory_info().rss if self._process else 0,
+            "traced": current,
+            "traced_peak": peak,
+            "population": genes,
+            "fitness": fitness,
+            "halloffame": hof_genes + hof_fitness,
+            "logbook": algorithm.logbook.nbytes,
+        }
+
+        sites = []
+        if tracemalloc.is_tracing():
+            statistics = tracemalloc.take_snapshot().statistics("lineno")
+            for stat in statistics[: self.top]:
+                frame = stat.traceback[0]
+                sites.append(
+                    {
+                        "gen": algorithm.gen,
+                        "site": f"{frame.filename}:{frame.lineno}",
+                        "size": stat.size,
+                        "count": stat.count,
+                    }
+                )
+
+        self.rows.append(row)
+        self.sites += sites
+
+        return row, sites
+
+    @staticmethod
+    def _append_csv(path: Path, rows: list[dict[str, Any]]):
+        if not rows:
+            return
+
+        # a resumed run continues the timeline of the interrupted run
+        new = not path.exists()
+        with open(path, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            if new:
+                writer.writeheader()
+            writer.writerows(rows)
+
+    @classmethod
+    def write(cls, folder: Path, row: dict[str, Any], sites: list[dict[str, Any]]):
+        # written per sample, so the timeline survives a run that gets killed
+        cls._append_csv(folder / "memory.csv", [row])
+        cls._append_csv(folder / "memory_sites.csv", sites)
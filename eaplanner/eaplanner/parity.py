@@ -0,0 +1,193 @@
+import subprocess
+from copy import deepcopy
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+from eaplanner.benchmark import PMAX, PMIN
+from eaplanner.compiled import BatchEvaluator
+from eaplanner.entities.constraint import DateConstraint
+from eaplanner.entities.schedule import Schedule
+from eaplanner.interpreter import AbsoluteScheduleInterpreter
+
+RUST_DIR = Path(__file__).parent.parent.parent / "eaplanner-rs"
+RUST_BINARY = RUST_DIR / "target" / "release" / "eaplanner-rs"
+ENGINES = ("python", "batch", "rust")
+
+
+@dataclass
+class ParityResult:
+    instance: str
+    n: int
+    evaluations: int
+    # evaluations per second and rows that differ from python, per engine
+    rates: dict[str, float] = field(default_factory=dict)
+    mismatches: dict[str, list[int]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not any(self.mismatches.values())
+
+
+def parity_schedule(schedule: Schedule) -> Schedule:
+    """Copy of `schedule` with only the constraints the Rust port can load.
+
+    The Rust port has no date constraints and cannot read resource constraints
+    without assignments, the latter never have a penalty.
+    """
+    schedule = deepcopy(schedule)
+    schedule.constraints = [
+        c
+        for c in schedule.constraints
+        if not isinstance(c, DateConstraint) and not c.is_empty()
+    ]
+
+    return schedule
+
+
+def random_chromosomes(
+    schedule: Schedule, count: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Chromosomes with integer genes, durations below one day included.
+
+    numpy rounds halves to even and Rust away from zero, so only integer genes
+    are interpreted the same.
+    """
+    n = len(schedule)
+    chromosomes = np.empty((count, 2 * n), dtype=np.int64)
+    chromosomes[:, ::2] = rng.integers(PMIN, PMAX, (count, n))
+    chromosomes[:, 1::2] = rng.integers(-2, PMAX, (count, n))
+
+    return chromosomes
+
+
+def write_chromosomes(path: Path, chromosomes: np.ndarray):
+    np.savetxt(path, chromosomes, fmt="%d", delimiter=",")
+
+
+def python_scores(
+    schedule: Schedule, chromosomes: np.ndarray
+) -> tuple[np.ndarray, float]:
+    interpreter = AbsoluteScheduleInterpreter(schedule, repair_pct=0.0)
+    genes = chromosomes.astype(np.float64)
+
+    start = perf_counter()
+    scores = []
+    for chromosome in genes:
+        interpreter.interpret(chromosome)
+        scores.append(interpreter.get_scores())
+    seconds = perf_counter() - start
+
+    return np.array(scores, dtype=np.float64).reshape(-1, 2), seconds
+
+
+def batch_scores(
+    schedule: Schedule, chromosomes: np.ndarray
+) -> tuple[np.ndarray, float]:
+    evaluator = BatchEvaluator.from_schedules([schedule])
+    instance = np.zeros(len(chromosomes), dtype=np.intp)
+
+    start = perf_counter()
+    scores, _ = evaluator.evaluate(instance, chromosomes)
+    seconds = perf_counter() - start
+
+    return scores, seconds
+
+
+def rust_scores(
+    binary: Path, instance: Path, chromosomes: Path, scores: Path
+) -> tuple[np.ndarray, float]:
+    """Evaluates the chromosomes with the Rust port of a csv instance.
+
+    Only the evaluations are timed by the binary, starting it and loading the
+    instance are not.
+    """
+    output = subprocess.run(
+        [
+            str(binary),
+            "--instance_path",
+            str(instance),
+            "--evaluate",
+            str(chromosomes),
+            "--scores_path",
+            str(scores),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    seconds = next(
+        float(line.split(":")[1])
+        for line in output.splitlines()
+        if line.startswith("Evaluation seconds:")
+    )
+    values = np.loadtxt(scores, delimiter=",", skiprows=1, ndmin=2)
+
+    return values.reshape(-1, 2), seconds
+
+
+def mismatches(expected: np.ndarray, actual: np.ndarray) -> list[int]:
+    """Rows of which the penalty or makespan differs."""
+    if expected.shape != actual.shape:
+        return list(range(max(len(expected), len(actual))))
+
+    return np.flatnonzero((expected != actual).any(axis=1)).tolist()
+
+
+def check_parity(
+    schedule: Schedule,
+    name: str,
+    folder: Path,
+    count: int = 1000,
+    binary: Path | None = None,
+    rng: np.random.Generator | int | None = None,
+) -> ParityResult:
+    """Scores the same chromosomes with every engine and compares to python.
+
+    The instance and chromosomes are written to `folder`, the Rust port is
+    skipped without a `binary`.
+    """
+    rng = np.random.default_rng(rng)
+    schedule = parity_schedule(schedule)
+    chromosomes = random_chromosomes(schedule, count, rng)
+
+    expected, seconds = python_scores(schedule, chromosomes)
+    result = ParityResult(name, len(schedule), count)
+    result.rates["python"] = count / seconds
+
+    scores, seconds = batch_scores(schedule, chromosomes)
+    result.rates["batch"] = count / seconds
+    result.mismatches["batch"] = mismatches(expected, scores)
+
+    if binary is not None:
+        instance = folder / name
+        schedule.save_csv(instance)
+        write_chromosomes(folder / f"{name}_chromosomes.csv", chromosomes)
+        scores, seconds = rust_scores(
+            binary,
+            instance,
+            folder / f"{name}_chromosomes.csv",
+            folder / f"{name}_scores.csv",
+        )
+        result.rates["rust"] = count / seconds
+        result.mismatches["rust"] = mismatches(expected, scores)
+
+    return result
+
+
+def format_parity(results: list[ParityResult]) -> str:
+    header = f"{'instance':<24} {'n':>6}"
+    header += "".join(f" {engine + '/s':>12}" for engine in ENGINES)
+    lines = [f"{header} {'mismatches':>12}"]
+    for r in results:
+        line = f"{r.instance:<24} {r.n:>6}"
+        for engine in ENGINES:
+            rate = r.rates.get(engine)
+            line += f" {rate:>12.1f}" if rate is not None else f" {'-':>12}"
+        different = sum(len(rows) for rows in r.mismatches.values())
+        lines.append(f"{line} {different:>12}")
+
+    return "\n".join(lines)
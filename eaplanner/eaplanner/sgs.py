@@ -0,0 +1,365 @@
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from heapq import heapify, heappop, heappush
+from math import inf
+
+from eaplanner.compiled import DATE_TERMS, RELATION_TERMS
+from eaplanner.entities.constraint import (
+    DateConstraint,
+    RelationConstraint,
+    ResourceConstraint,
+)
+from eaplanner.entities.schedule import Schedule
+
+
+@dataclass
+class Network:
+    """Constraints of a schedule per assignment position, for schedule generation.
+
+    A relation makes the second side of its penalty wait for the first side,
+    see `RELATION_TERMS`, so a start to finish relation points from the
+    successor to the predecessor.
+    """
+
+    hours: list[int]
+    # (assignment, first side is the end, second side is the end) per relation
+    successors: list[list[tuple[int, bool, bool]]]
+    predecessor_count: list[int]
+    # earliest start and end of the dates that can be met by waiting
+    release_start: list[int]
+    release_end: list[int]
+    resources: list[list[int]]
+    capacity: list[int]
+    # shortest duration with which an assignment fits all of its resources
+    min_duration: list[int]
+
+    @staticmethod
+    def compile(schedule: Schedule):
+        # constraints refer to assignment objects, ids are not always unique
+        index = {id(a): i for i, a in enumerate(schedule.assignments)}
+        n = len(schedule.assignments)
+
+        network = Network(
+            hours=[a.hours for a in schedule.assignments],
+            successors=[[] for _ in range(n)],
+            predecessor_count=[0] * n,
+            release_start=[0] * n,
+            release_end=[0] * n,
+            resources=[[] for _ in range(n)],
+            capacity=[],
+            min_duration=[1] * n,
+        )
+
+        for constraint in schedule.constraints:
+            if isinstance(constraint, RelationConstraint):
+                sides = (constraint.predecessor, constraint.successor)
+                (a, a_end), (b, b_end) = RELATION_TERMS[constraint.type]
+                first, second = index[id(sides[a])], index[id(sides[b])]
+                if first != second:
+                    network.successors[first].append((second, a_end, b_end))
+                    network.predecessor_count[second] += 1
+            elif isinstance(constraint, DateConstraint):
+                end, sign = DATE_TERMS[constraint.type]
+                # dates with an upper bound can only be met by chance
+                if sign <= 0:
+                    i = index[id(constraint.assignment)]
+                    release = network.release_end if end else network.release_start
+                    release[i] = max(release[i], int(constraint.day))
+            elif isinstance(constraint, ResourceConstraint):
+                r = len(network.capacity)
+                capacity = int(constraint.resource.total_capacity)
+                network.capacity.append(capacity)
+                for i in {index[id(a)] for a in constraint.assignments}:
+                    network.resources[i].append(r)
+                    if capacity > 0:
+                        duration = -(-network.hours[i] // capacity)
+                        if duration > network.min_duration[i]:
+                            network.min_duration[i] = duration
+            else:
+                raise NotImplementedError(type(constraint).__name__)
+
+        return network
+
+    def __len__(self):
+        return len(self.hours)
+
+
+class ResourceProfile:
+    """Usage of a resource per day as a step function from day zero on.
+
+    The usage changes at `times`, `usage[k]` holds from `times[k]` until the
+    next change. The last step is always empty.
+
+    Finding a day and adding a demand scan the steps they cover, and every
+    assignment adds at most two steps, so a schedule of n assignments takes
+    O(n^2) in the worst case. There are never more steps than days in the
+    schedule and a scan usually covers few of them, which in Python is faster
+    than a segment tree over the days.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.times = [0]
+        self.usage = [0]
+
+    def earliest(self, start: int, duration: int, demand: int) -> int:
+        """First day from `start` on where `demand` fits for `duration` days.
+
+        A demand above the capacity never fits and is placed at `start`.
+        """
+        limit = self.capacity - demand
+        if limit < 0:
+            return start
+
+        times, usage = self.times, self.usage
+        k = bisect_right(times, start) - 1
+        end = start + duration
+        while k < len(times) and times[k] < end:
+            if usage[k] > limit:
+                # restart after the step that is too full
+                start = times[k + 1]
+                end = start + duration
+            k += 1
+
+        return start
+
+    def add(self, start: int, end: int, demand: int):
+        first = self._split(start)
+        last = self._split(end)
+        for k in range(first, last):
+            self.usage[k] += demand
+
+    def _split(self, time: int) -> int:
+        k = bisect_left(self.times, time)
+        if k == len(self.times) or self.times[k] != time:
+            self.times.insert(k, time)
+            self.usage.insert(k, self.usage[k - 1])
+
+        return k
+
+
+class DemandQueue:
+    """Assignments waiting for a resource, per demand in priority order."""
+
+    def __init__(self):
+        self.demands: list[int] = []
+        self.queues: dict[int, list[tuple[float, int]]] = {}
+
+    def push(self, demand: int, priority: float, i: int):
+        queue = self.queues.get(demand)
+        if queue is None:
+            insort(self.demands, demand)
+            queue = self.queues[demand] = []
+        heappush(queue, (priority, i))
+
+    def first(self, limit: float) -> tuple[tuple[float, int], int] | None:
+        """Lowest (priority, assignment) with a demand up to `limit`, and its demand."""
+        k = bisect_right(self.demands, limit)
+        if k == 0:
+            return None
+
+        return min((self.queues[d][0], d) for d in self.demands[:k])
+
+    def pop(self, demand: int) -> tuple[float, int]:
+        queue = self.queues[demand]
+        item = heappop(queue)
+        if not queue:
+            del self.queues[demand]
+            self.demands.remove(demand)
+
+        return item
+
+
+def serial_sgs(
+    network: Network, priorities: list[float], durations: list[int]
+) -> list[int]:
+    """Starts of a serial schedule generation scheme.
+
+    Assignments are scheduled one at a time, the one with the lowest priority
+    among those whose relations are known, at the earliest day that meets its
+    relations, release dates and resources. Relations that form a cycle are
+    broken at the lowest priority.
+    """
+    n = len(network)
+    remaining = network.predecessor_count.copy()
+    earliest = [
+        max(0, start, end - duration)
+        for start, end, duration in zip(
+            network.release_start, network.release_end, durations
+        )
+    ]
+    profiles = [ResourceProfile(c) for c in network.capacity]
+    starts: list[int | None] = [None] * n
+
+    eligible = [(priorities[i], i) for i in range(n) if remaining[i] == 0]
+    heapify(eligible)
+    backlog: list[tuple[float, int]] | None = None
+
+    for _ in range(n):
+        if eligible:
+            _, i = heappop(eligible)
+        else:
+            if backlog is None:
+                backlog = [(p, i) for i, p in enumerate(priorities)]
+                heapify(backlog)
+            _, i = heappop(backlog)
+            while starts[i] is not None:
+                _, i = heappop(backlog)
+
+        duration = durations[i]
+        demand = -(-network.hours[i] // duration)
+        start = earliest[i]
+        members = network.resources[i]
+        # the earliest day that fits one resource may not fit another
+        moved = True
+        while moved:
+            moved = False
+            for r in members:
+                fit = profiles[r].earliest(start, duration, demand)
+                if fit != start:
+                    start = fit
+                    moved = True
+
+        for r in members:
+            profiles[r].add(start, start + duration, demand)
+        starts[i] = start
+
+        end = start + duration
+        for j, first_end, second_end in network.successors[i]:
+            bound = end if first_end else start
+            if second_end:
+                bound -= durations[j]
+            if bound > earliest[j]:
+                earliest[j] = bound
+            remaining[j] -= 1
+            if remaining[j] == 0 and starts[j] is None:
+                heappush(eligible, (priorities[j], j))
+
+    return starts  # type: ignore
+
+
+def parallel_sgs(
+    network: Network, priorities: list[float], durations: list[int]
+) -> list[int]:
+    """Starts of a parallel schedule generation scheme.
+
+    Time jumps from event to event, an assignment finishing or reaching its
+    earliest day. At every event the available assignments are started in
+    priority order as long as their resources have capacity left. An
+    assignment that does not fit waits at a resource that is too full, and is
+    only picked again once that resource frees enough for its demand, instead
+    of being retried at every event. An idle resource takes any demand.
+    Relations that form a cycle are broken at the lowest priority.
+    """
+    n = len(network)
+    remaining = network.predecessor_count.copy()
+    earliest = [
+        max(0, start, end - duration)
+        for start, end, duration in zip(
+            network.release_start, network.release_end, durations
+        )
+    ]
+    demands = [-(-h // d) for h, d in zip(network.hours, durations)]
+    capacity = network.capacity
+    left = capacity.copy()
+    starts: list[int | None] = [None] * n
+    queued = [r == 0 for r in remaining]
+
+    # assignments with known relations waiting for their earliest day
+    waiting = [(earliest[i], i) for i in range(n) if queued[i]]
+    heapify(waiting)
+    eligible: list[tuple[float, int]] = []
+    # available assignments per resource they did not fit
+    blocked = [DemandQueue() for _ in capacity]
+    finishes: list[tuple[int, int]] = []
+    backlog: list[tuple[float, int]] | None = None
+
+    time = 0
+    scheduled = 0
+    while scheduled < n:
+        # only blocked assignments of a resource that freed can fit now
+        freed: set[int] = set()
+        while finishes and finishes[0][0] <= time:
+            _, i = heappop(finishes)
+            for r in network.resources[i]:
+                left[r] += demands[i]
+                freed.add(r)
+        while waiting and waiting[0][0] <= time:
+            _, i = heappop(waiting)
+            heappush(eligible, (priorities[i], i))
+
+        # first fitting blocked assignment per freed resource, redone once the
+        # resource loses capacity or its first one is taken
+        fitting: dict[int, tuple[tuple[float, int], int]] = {}
+        stale = set(freed)
+        while True:
+            for r in stale:
+                found = blocked[r].first(inf if left[r] == capacity[r] else left[r])
+                if found is None:
+                    # capacity is only taken until the next event, nothing fits
+                    fitting.pop(r, None)
+                    freed.discard(r)
+                else:
+                    fitting[r] = found
+            stale.clear()
+
+            best = eligible[0] if eligible else None
+            source = None
+            for r, found in fitting.items():
+                if best is None or found[0] < best:
+                    best, source = found[0], r
+            if best is None:
+                break
+
+            if source is None:
+                priority, i = heappop(eligible)
+            else:
+                priority, i = blocked[source].pop(fitting[source][1])
+                stale.add(source)
+            demand = demands[i]
+            members = network.resources[i]
+            full = next(
+                (r for r in members if demand > left[r] and left[r] != capacity[r]),
+                None,
+            )
+            if full is not None:
+                blocked[full].push(demand, priority, i)
+                continue
+
+            for r in members:
+                left[r] -= demand
+                if r in freed:
+                    stale.add(r)
+            starts[i] = time
+            scheduled += 1
+            end = time + durations[i]
+            heappush(finishes, (end, i))
+
+            for j, first_end, second_end in network.successors[i]:
+                bound = end if first_end else time
+                if second_end:
+                    bound -= durations[j]
+                if bound > earliest[j]:
+                    earliest[j] = bound
+                remaining[j] -= 1
+                if remaining[j] == 0 and not queued[j]:
+                    queued[j] = True
+                    if earliest[j] <= time:
+                        heappush(eligible, (priorities[j], j))
+                    else:
+                        heappush(waiting, (earliest[j], j))
+
+        if finishes or waiting:
+            time = min(heap[0][0] for heap in (finishes, waiting) if heap)
+        elif scheduled < n:
+            # nothing runs, so every resource is idle and nothing is blocked
+            if backlog is None:
+                backlog = [(p, i) for i, p in enumerate(priorities)]
+                heapify(backlog)
+            _, i = heappop(backlog)
+            while queued[i]:
+                _, i = heappop(backlog)
+            queued[i] = True
+            heappush(waiting, (max(time, earliest[i]), i))
+
+    return starts  # type: ignore
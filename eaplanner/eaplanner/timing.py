@@ -0,0 +1,51 @@
+from time import perf_counter_ns
+from typing import Sequence
+
+PHASES = (
+    "variation",
+    "evaluation",
+    "repair",
+    "selection",
+    "halloffame",
+    "stats",
+    "saving",
+)
+
+
+class PhaseTimer:
+    """Nanoseconds spent per phase of a run, in total and since the last lap.
+
+    Phases are timed by passing the `perf_counter_ns` at their start to `stop`,
+    which returns the current time so consecutive phases can be chained
+    without extra clock reads.
+    """
+
+    def __init__(self, phases: Sequence[str] = PHASES):
+        self.phases = tuple(phases)
+        self.total = dict.fromkeys(self.phases, 0)
+        self.current = dict.fromkeys(self.phases, 0)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(f"time_{phase}" for phase in self.phases)
+
+    def add(self, phase: str, ns: int):
+        self.current[phase] += ns
+        self.total[phase] += ns
+
+    def stop(self, phase: str, start: int) -> int:
+        now = perf_counter_ns()
+        self.add(phase, now - start)
+
+        return now
+
+    def lap(self) -> dict[str, float]:
+        """Seconds per phase since the previous lap, keyed by logbook column."""
+        seconds = {f"time_{p}": ns / 1e9 for p, ns in self.current.items()}
+        self.current = dict.fromkeys(self.phases, 0)
+
+        return seconds
+
+    def summary(self) -> dict[str, float]:
+        """Total seconds per phase."""
+        return {phase: ns / 1e9 for phase, ns in self.total.items()}
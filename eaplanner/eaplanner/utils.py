@@ -1,5 +1,11 @@
+import os
+from contextlib import contextmanager
+from itertools import chain
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
-from deap.tools import HallOfFame
+from deap import creator, tools
+from deap.tools import HallOfFame, emo
 
 
 class LexHallOfFame(HallOfFame):
@@ -85,3 +91,145 @@ def pareto_rank(arr):
                 break
 
     return ranks.astype(int)
+
+
+@contextmanager
+def isolated_creator():
+    """Removes the classes made with `creator.create` inside the block.
+
+    Runs sharing a process would otherwise see each other's fitness weights
+    and individual classes.
+    """
+    before = dict(vars(creator))
+    try:
+        yield
+    finally:
+        for name in set(vars(creator)) - set(before):
+            delattr(creator, name)
+        for name, value in before.items():
+            if getattr(creator, name, None) is not value:
+                setattr(creator, name, value)
+
+
+def cx_uniform(ind1, ind2, indpb: float, rng: np.random.Generator):
+    """`tools.cxUniform` drawing from `rng` instead of the `random` module."""
+    size = min(len(ind1), len(ind2))
+    swap = np.flatnonzero(rng.random(size) < indpb)
+    ind1[swap], ind2[swap] = ind2[swap], ind1[swap]
+
+    return ind1, ind2
+
+
+def mut_gaussian(
+    individual, mu: float, sigma: float, indpb: float, rng: np.random.Generator
+):
+    """`tools.mutGaussian` drawing from `rng` instead of the `random` module."""
+    mutate = np.flatnonzero(rng.random(len(individual)) < indpb)
+    # assigning instead of adding in place truncates integer genes like deap does
+    individual[mutate] = individual[mutate] + rng.normal(mu, sigma, len(mutate))
+
+    return (individual,)
+
+
+class SelNSGA3WithMemory(tools.selNSGA3WithMemory):
+    """`tools.selNSGA3WithMemory` drawing from `rng` instead of `numpy.random`."""
+
+    def __init__(self, ref_points, rng: np.random.Generator, nd: str = "log"):
+        super().__init__(ref_points, nd)
+        self.rng = rng
+
+    def __call__(self, individuals, k):
+        # tools.selNSGA3 with the niching below
+        if self.nd == "standard":
+            fronts = tools.sortNondominated(individuals, k)
+        else:
+            fronts = tools.sortLogNondominated(individuals, k)
+
+        fitnesses = np.array([ind.fitness.wvalues for f in fronts for ind in f])
+        fitnesses *= -1
+
+        best_point = np.min(np.concatenate((fitnesses, self.best_point)), axis=0)
+        worst_point = np.max(np.concatenate((fitnesses, self.worst_point)), axis=0)
+        extreme_points = emo.find_extreme_points(
+            fitnesses, best_point, self.extreme_points
+        )
+        front_worst = np.max(fitnesses[: sum(len(f) for f in fronts)], axis=0)
+        intercepts = emo.find_intercepts(
+            extreme_points, best_point, worst_point, front_worst
+        )
+        niches, dist = emo.associate_to_niche(
+            fitnesses, self.ref_points, best_point, intercepts
+        )
+
+        niche_counts = np.zeros(len(self.ref_points), dtype=np.int64)
+        index, counts = np.unique(niches[: -len(fronts[-1])], return_counts=True)
+        niche_counts[index] = counts
+
+        chosen = list(chain(*fronts[:-1]))
+        n = len(chosen)
+        chosen.extend(
+            self._niching(fronts[-1], k - n, niches[n:], dist[n:], niche_counts)
+        )
+
+        self.best_point = best_point.reshape((1, -1))
+        self.worst_point = worst_point.reshape((1, -1))
+        self.extreme_points = extreme_points
+
+        return chosen
+
+    def _niching(self, individuals, k, niches, distances, niche_counts):
+        selected = []
+        available = np.ones(len(individuals), dtype=bool)
+        while len(selected) < k:
+            available_niches = np.zeros(len(niche_counts), dtype=bool)
+            available_niches[np.unique(niches[available])] = True
+            min_count = np.min(niche_counts[available_niches])
+
+            selected_niches = np.flatnonzero(
+                available_niches & (niche_counts == min_count)
+            )
+            self.rng.shuffle(selected_niches)
+
+            for niche in selected_niches[: k - len(selected)]:
+                niche_individuals = np.flatnonzero((niches == niche) & available)
+                self.rng.shuffle(niche_individuals)
+
+                # an empty niche takes the closest to its reference point
+                if niche_counts[niche] == 0:
+                    sel_index = niche_individuals[
+                        np.argmin(distances[niche_individuals])
+                    ]
+                else:
+                    sel_index = niche_individuals[0]
+
+                available[sel_index] = False
+                niche_counts[niche] += 1
+                selected.append(individuals[sel_index])
+
+        return selected
+
+
+def spawn_rng(
+    seed: int | np.random.SeedSequence | None, n: int
+) -> list[np.random.Generator]:
+    """Independent generators for `n` runs, workers or islands of one experiment."""
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    return [np.random.default_rng(s) for s in seed.spawn(n)]
+
+
+_thread_pools: dict[int, ThreadPool] = {}
+
+
+def thread_pool() -> ThreadPool:
+    """Thread pool of the current process, shared by all runs in it.
+
+    Workers run many tasks, a pool per run would leave its threads behind. A
+    forked process gets its own pool, the threads of the parent are not copied.
+    """
+    pid = os.getpid()
+    if pid not in _thread_pools:
+        _thread_pools[pid] = ThreadPool()
+
+    return _thread_pools[pid]
@@ -1,9 +1,11 @@
+from __future__ import annotations
+
 import json
 import pickle
 import subprocess
 from collections import OrderedDict
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -11,17 +13,25 @@ import pandas as pd
 import seaborn as sns
 from matplotlib.axes import Axes
 from mpl_toolkits.axes_grid1 import make_axes_locatable
-from sklearn.decomposition import PCA
-from tqdm import tqdm
 
 from eaplanner.interpreter import ScheduleInterpreterBase
 from eaplanner.utils import rank_lexicographic
 
+if TYPE_CHECKING:
+    from sklearn.decomposition import PCA
+
 DPI = 200
 
 sns.set()
 
 
+def _pca() -> PCA:
+    # scikit-learn is only loaded once a PCA figure is made
+    from sklearn.decomposition import PCA
+
+    return PCA(n_components=2, random_state=42)
+
+
 class ResultVisualization:
     logbook: pd.DataFrame
     solution_individual: list[int]
@@ -39,7 +49,10 @@ class ResultVisualization:
         self.fig_folder = self.folder / "figures"
         self.fig_folder.mkdir(exist_ok=True)
 
-        self.logbook = pd.read_csv(self.folder / "logbook.csv")
+        if (self.folder / "logbook.parquet").exists():
+            self.logbook = pd.read_parquet(self.folder / "logbook.parquet")
+        else:
+            self.logbook = pd.read_csv(self.folder / "logbook.csv")
 
         solution = json.loads((self.folder / "solution.json").read_text())
         self.solution_individual = solution["individual"]
@@ -144,7 +157,7 @@ class ResultVisualization:
         if self.population is None:
             raise ValueError("Population is not available")
         
-        pca = PCA(n_components=2, random_state=42)
+        pca = _pca()
         decomp = pca.fit_transform(
             self.population[self._get_gene_columns(self.population)]
         )
@@ -173,6 +186,8 @@ class ResultVisualization:
         plt.close(fig)
 
     def visualize_generations_pca_video(self, sample_every: int = 1):
+        from tqdm import tqdm
+
         if self.population is None:
             raise ValueError("Population is not available")
         
@@ -182,7 +197,7 @@ class ResultVisualization:
         generations = {i: self.population[self.population["gen"] == i] for i in indexes}
         generations: dict[int, pd.DataFrame] = OrderedDict(sorted(generations.items()))
 
-        pca = PCA(n_components=2, random_state=42)
+        pca = _pca()
         decomp = pca.fit_transform(
             pd.concat(generations.values())[self._get_gene_columns(generations[0])]
         )
@@ -238,6 +253,8 @@ class ResultVisualization:
     def visualize_generations_video(
         self, show_gantt_constraints: bool = True, sample_every: int = 1
     ):
+        from tqdm import tqdm
+
         if self.population is None:
             raise ValueError("Population is not available")
         
@@ -247,7 +264,7 @@ class ResultVisualization:
         generations = {i: self.population[self.population["gen"] == i] for i in indexes}
         generations: dict[int, pd.DataFrame] = OrderedDict(sorted(generations.items()))
 
-        pca = PCA(n_components=2, random_state=42)
+        pca = _pca()
         decomp = pca.fit_transform(
             pd.concat(generations.values())[self._get_gene_columns(generations[0])]
         )
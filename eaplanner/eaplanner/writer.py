@@ -0,0 +1,71 @@
+import queue
+import threading
+from typing import Any, Callable
+
+
+class SynchronousWriter:
+    """Runs every submitted write immediately on the calling thread."""
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs):
+        func(*args, **kwargs)
+
+    def flush(self):
+        pass
+
+    def close(self, raise_errors: bool = True):
+        pass
+
+
+class BackgroundWriter(SynchronousWriter):
+    """Runs submitted writes in order on a single background thread.
+
+    The queue is bounded, so `submit` blocks once `maxsize` writes are pending.
+    This keeps memory bounded when the disk cannot keep up with the algorithm.
+    Callers must only submit snapshots that are not modified afterwards.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self._queue: queue.Queue[tuple[Callable[..., Any], tuple, dict] | None] = (
+            queue.Queue(maxsize=maxsize)
+        )
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._work, name="writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs):
+        self._raise_error()
+        self._queue.put((func, args, kwargs))
+
+    def flush(self):
+        self._queue.join()
+        self._raise_error()
+
+    def close(self, raise_errors: bool = True):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+        if raise_errors:
+            self._raise_error()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+
+            try:
+                if item is None:
+                    return
+
+                # after a failure the remaining writes are dropped, the error
+                # is raised on every later call from the algorithm thread
+                if self._error is None:
+                    func, args, kwargs = item
+                    func(*args, **kwargs)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError("Writing results failed") from self._error
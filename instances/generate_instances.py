@@ -1,60 +1,157 @@
-from functools import partial
-from itertools import product
+import argparse
+import csv
 from multiprocessing import Pool
 from pathlib import Path
-from typing import Literal
-import numpy as np
+from typing import Any
 
-import seaborn as sns
+import numpy as np
+from tqdm import tqdm
 
+from eaplanner.entities.constraint import ResourceConstraint
+from eaplanner.entities.schedule import Schedule
 from eaplanner.generation import ScheduleGenerator
-from tqdm import tqdm
 
-sns.set()
+parser = argparse.ArgumentParser(
+    description="Generate a set of random instances in parallel, the set only "
+    "depends on the seed and not on the number of workers"
+)
+parser.add_argument("--count", type=int, default=1000, help="Number of instances")
+parser.add_argument(
+    "--seed", type=int, default=None, help="Seed of the whole set, random if not given"
+)
+parser.add_argument(
+    "--n_assignments",
+    type=int,
+    nargs=2,
+    default=(10, 500),
+    help="Range of the number of assignments, the upper bound is excluded",
+)
+parser.add_argument(
+    "--n_resources",
+    type=int,
+    nargs=2,
+    default=(1, 20),
+    help="Range of the number of resources, the upper bound is excluded",
+)
+parser.add_argument(
+    "--auto_resources",
+    action="store_true",
+    help="Derive the number of resources from the number of assignments",
+)
+parser.add_argument(
+    "--k",
+    type=int,
+    nargs=2,
+    default=(1, 5),
+    help="Range of the average relations per assignment, the upper bound is excluded",
+)
+parser.add_argument(
+    "--p_date", type=float, default=0.0, help="Probability of a date constraint"
+)
+parser.add_argument(
+    "--generator",
+    choices=["graph", "dag"],
+    default="graph",
+    help="generate_random_schedule, or generate_dag_schedule for large instances",
+)
+parser.add_argument(
+    "--formats",
+    choices=["npz", "pkl", "csv"],
+    nargs="+",
+    default=["npz"],
+    help="Formats to save every instance in",
+)
+parser.add_argument(
+    "--output",
+    type=str,
+    default=str(Path(__file__).parent / "generated"),
+    help="Folder of the instance set",
+)
+parser.add_argument("--prefix", type=str, default="schedule", help="Instance name")
+parser.add_argument("--workers", type=int, default=None, help="Number of processes")
+
+
+def instance_parameters(
+    args: argparse.Namespace, rng: np.random.Generator
+) -> dict[str, Any]:
+    n_resources = "auto"
+    if not args.auto_resources:
+        n_resources = int(rng.integers(*args.n_resources))
+
+    return {
+        "n_assignments": int(rng.integers(*args.n_assignments)),
+        "n_resources": n_resources,
+        "p_date": args.p_date,
+        "k": int(rng.integers(*args.k)),
+    }
+
+
+def describe(schedule: Schedule) -> dict[str, Any]:
+    groups = schedule.get_constraint_per_group()
+    resources: list[ResourceConstraint] = groups["ResourceConstraint"]  # type: ignore
+
+    return {
+        "assignments": len(schedule),
+        "relation_constraints": len(groups["RelationConstraint"]),
+        "date_constraints": len(groups["DateConstraint"]),
+        "resource_constraints": len(resources),
+        "total_hours": sum(a.hours for a in schedule.assignments),
+        "total_capacity": sum(c.resource.total_capacity for c in resources),
+        "makespan": schedule.get_total_makespan(),
+    }
+
+
+def generate_instance(task: tuple[int, np.random.SeedSequence, argparse.Namespace]):
+    i, seed, args = task
+    # the parameters and the instance are drawn from the seed of this instance
+    rng = np.random.default_rng(seed)
+    parameters = instance_parameters(args, rng)
+
+    if args.generator == "dag":
+        schedule = ScheduleGenerator.generate_dag_schedule(**parameters, rng=rng)
+    else:
+        schedule = ScheduleGenerator.generate_random_schedule(**parameters, rng=rng)
+
+    name = f"{args.prefix}_{i}"
+    folder = Path(args.output) / f"n_{parameters['n_assignments']}"
+    for file_format in args.formats:
+        match file_format:
+            case "npz":
+                schedule.save_npz(folder / f"{name}.npz")
+            case "pkl":
+                schedule.save(folder / f"{name}.pkl")
+            case "csv":
+                schedule.save_csv(folder / name)
+
+    return {
+        "name": name,
+        "path": str((folder / name).relative_to(args.output)),
+        "spawn_key": i,
+        **parameters,
+        **describe(schedule),
+    }
+
+
+def main(args: argparse.Namespace):
+    seed = np.random.SeedSequence(args.seed)
+    print(f"Seed of the instance set: {seed.entropy}")
 
+    tasks = [(i, s, args) for i, s in enumerate(seed.spawn(args.count))]
+    with Pool(args.workers) as pool:
+        rows = list(
+            tqdm(pool.imap(generate_instance, tasks, chunksize=8), total=len(tasks))
+        )
 
-def generate_and_save(
-    fname: str,
-    n_assignments: int,
-    n_resources: int | Literal["auto"] = "auto",
-    p_date: float = 0.16,
-    k: int = 1,
-):
-    schedule = ScheduleGenerator.generate_random_schedule(
-        n_assignments=n_assignments, p_date=p_date, k=k, n_resources=n_resources
-    )
+    # features of every instance, in the order of the spawned seeds
+    index = Path(args.output) / "index.csv"
+    index.parent.mkdir(parents=True, exist_ok=True)
+    with open(index, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["entropy", *(rows[0] if rows else [])])
+        writer.writeheader()
+        writer.writerows({"entropy": seed.entropy, **row} for row in rows)
 
-    save_dir = Path(__file__).parent / "generated_param_search" / f"n_{n_assignments}"
-    save_dir.mkdir(parents=True, exist_ok=True)
-    schedule.save(save_dir / f"{fname}.pkl")
-    schedule.save_csv(save_dir / fname)
+    return rows
 
 
 if __name__ == "__main__":
-    tasks = []
-
-    # Used to generate the parameter search instances
-    # N_ASSIGNMENTS = [100]
-    # N_RESOURCES = ["auto"]
-    # P_DATE = [0]
-    # K = [1]
-    # REPEAT = range(5)
-
-    # for i, n_asg, n_res, p_date, k in product(
-    #     REPEAT, N_ASSIGNMENTS, N_RESOURCES, P_DATE, K
-    # ):
-    #     tasks.append(
-    #         (f"schedule_{n_asg}_{n_res}_{p_date}_{k}_{i}", n_asg, n_res, p_date, k)
-    #     )
-
-    N_ASSIGNMENTS = partial(np.random.randint, 10, 500)
-    N_RESOURCES = partial(np.random.randint, 1, 20)
-    P_DATE = lambda: 0.0
-    K = partial(np.random.randint, 1, 5)
-    REPEAT = range(1000)
-
-    for i in REPEAT:
-        tasks.append((f"schedule_{i}", N_ASSIGNMENTS(), N_RESOURCES(), P_DATE(), K()))
-
-    with Pool() as p:
-        p.starmap(generate_and_save, tqdm(tasks))
+    main(parser.parse_args())
@@ -0,0 +1,71 @@
+import argparse
+import importlib
+from datetime import datetime
+from pathlib import Path
+
+from eaplanner.algorithms.batch import BatchRunner
+from eaplanner.utils import spawn_rng
+
+parser = argparse.ArgumentParser(
+    description="Solve many instances in one process, options not listed here are "
+    "passed to the algorithm of every instance"
+)
+parser.add_argument(
+    "--algorithm",
+    choices=["ga", "ppa", "pso", "sa", "shc"],
+    default="ga",
+    help="Algorithm for every instance",
+)
+parser.add_argument(
+    "--instances",
+    type=str,
+    nargs="+",
+    required=True,
+    help="Instances, or folders with pickled or npz instances",
+)
+parser.add_argument(
+    "--batch_seed", type=int, default=None, help="Seed of the runs of all instances"
+)
+
+
+def instance_paths(instances: list[str]) -> list[Path]:
+    paths = []
+    for instance in map(Path, instances):
+        if instance.is_dir():
+            paths += sorted([*instance.glob("*.pkl"), *instance.glob("*.npz")])
+        else:
+            paths.append(instance)
+
+    return paths
+
+
+def create_algorithms(
+    algorithm: str, argv: list[str], instances: list[Path], seed: int | None = None
+):
+    module = importlib.import_module(f"algorithm_{algorithm}")
+    # instances are evaluated together, so repairs and thread pools are disabled
+    argv = [*argv, "--repair_pct", "0", "--disable_multiprocessing"]
+
+    return [
+        module.create_algorithm(
+            module.parser.parse_args([*argv, "--instance", str(p)]), rng=rng
+        )
+        for p, rng in zip(instances, spawn_rng(seed, len(instances)))
+    ]
+
+
+if __name__ == "__main__":
+    args, algorithm_argv = parser.parse_known_args()
+
+    instances = instance_paths(args.instances)
+    runner = BatchRunner(
+        create_algorithms(args.algorithm, algorithm_argv, instances, args.batch_seed)
+    )
+    start_time = datetime.now()
+    runner.run()
+    end_time = datetime.now()
+
+    for ea in runner.algorithms:
+        best = ea.halloffame[0].fitness.values  # type: ignore
+        print(f"{ea.folder}: best scores {best}, stopped by {ea.stop_reason}")
+    print(f"Running time time: {(end_time - start_time).total_seconds()}s")
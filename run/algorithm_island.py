@@ -0,0 +1,55 @@
+import argparse
+import importlib
+from datetime import datetime
+from functools import partial
+
+from params import NEVAL
+
+from eaplanner.algorithms.island import IslandModel
+
+parser = argparse.ArgumentParser(
+    description="Island model, options not listed here are passed to the algorithm"
+)
+parser.add_argument(
+    "--algorithm", choices=["ga", "ppa"], default="ga", help="Algorithm of the islands"
+)
+parser.add_argument("--islands", type=int, default=4, help="Number of islands")
+parser.add_argument(
+    "--topology", choices=["ring", "random"], default="ring", help="Migration topology"
+)
+parser.add_argument(
+    "--interval", type=int, default=10, help="Generations between migrations"
+)
+parser.add_argument("--migrants", type=int, default=2, help="Individuals per migration")
+parser.add_argument(
+    "--neval", type=int, default=NEVAL, help="Evaluations over all islands together"
+)
+parser.add_argument("--island_seed", type=int, default=None, help="Random seed")
+
+
+def create_island(algorithm: str, argv: list[str], index: int, rng):
+    module = importlib.import_module(f"algorithm_{algorithm}")
+    return module.create_algorithm(module.parser.parse_args(argv), rng=rng)
+
+
+if __name__ == "__main__":
+    args, algorithm_argv = parser.parse_known_args()
+
+    model = IslandModel(
+        partial(create_island, args.algorithm, algorithm_argv),
+        islands=args.islands,
+        max_evaluations=args.neval,
+        topology=args.topology,
+        interval=args.interval,
+        migrants=args.migrants,
+        seed=args.island_seed,
+    )
+    start_time = datetime.now()
+    results = model.run()
+    end_time = datetime.now()
+
+    genes, fitness = model.best(results)
+    for r in results:
+        print(f"Island {r.index}: {r.evaluations} evaluations, stopped by {r.stop_reason}")
+    print(f"Best scores: {fitness}, used {model.evaluations} evaluations")
+    print(f"Running time time: {(end_time - start_time).total_seconds()}s")
@@ -1,17 +1,22 @@
 import argparse
 from datetime import datetime
 import sys
-from functools import partial
-from multiprocessing.pool import ThreadPool
 from pathlib import Path
 
 import numpy as np
 from deap import base, creator, tools
 from params import (
+    CHECKPOINT_EVERY,
+    CHECKPOINT_INTERVAL,
     CREATE_FIGURES,
     CREATE_VIDEO,
     DISABLE_MULTIPROCESSING,
     INSTANCE,
+    INTERPRETER,
+    MAX_CPU_TIME,
+    MAX_TIME,
+    MEMORY_EVERY,
+    METRICS_FILE,
     MU,
     NEVAL,
     PATIENCE,
@@ -20,22 +25,53 @@ from params import (
     PMAX,
     PMIN,
     QUIET,
+    RANDOM_SEED,
     REPAIR_PCT,
     SAVE_POPULATION,
     SEED,
     SMAX,
+    TARGET,
     WEIGHT,
     WEIGHTS,
 )
 
 from eaplanner.algorithms.pso import ParticleSwarm
+from eaplanner.algorithms.hooks import run_hooks
+from eaplanner.algorithms.termination import termination_criteria
+from eaplanner.cpm import makespan_lower_bound
 from eaplanner.entities.schedule import Schedule
-from eaplanner.interpreter import AbsoluteScheduleInterpreter
-from eaplanner.utils import LexHallOfFame
-from eaplanner.visualization import ResultVisualization
+from eaplanner.interpreter import INTERPRETERS
+from eaplanner.utils import LexHallOfFame, thread_pool
+
+
+def generate(
+    pmin: float,
+    pmax: float,
+    smin: float,
+    smax: float,
+    seed: np.ndarray | None = None,
+    size: int | None = None,
+    rng: np.random.Generator | None = None,
+):
+    rng = np.random.default_rng(rng)
+    if seed is None:
+        seed = rng.uniform(pmin, pmax, size)
+
+    size = len(seed)
+    part = creator.Particle(seed + rng.integers(pmin, pmax, size))  # type: ignore
+    part.speed = rng.uniform(smin, smax, size)
+    return part
+
 
 parser = argparse.ArgumentParser()
 parser.add_argument("--instance", type=str, default=INSTANCE, help="Path to instance")
+parser.add_argument(
+    "--interpreter",
+    choices=list(INTERPRETERS),
+    default=INTERPRETER,
+    help="Decoding of the genes: absolute starts and durations, or priorities "
+    "and durations of a serial or parallel schedule generation scheme",
+)
 parser.add_argument("--pmin", type=int, default=PMIN, help="Minimum value for a gene")
 parser.add_argument("--pmax", type=int, default=PMAX, help="Maximum value for a gene")
 parser.add_argument("--weights", type=str, default=WEIGHTS, help="Weights for fitness")
@@ -56,14 +92,66 @@ parser.add_argument("--weight", type=float, default=WEIGHT, help="Weight for ine
 parser.add_argument(
     "--patience", type=int, default=PATIENCE, help="Patience for early stopping"
 )
+parser.add_argument(
+    "--target",
+    type=float,
+    nargs="+",
+    default=TARGET,
+    help="Stop once the scores are at least as good as these",
+)
+parser.add_argument(
+    "--max_time", type=float, default=MAX_TIME, help="Wall-clock budget in seconds"
+)
+parser.add_argument(
+    "--max_cpu_time", type=float, default=MAX_CPU_TIME, help="CPU budget in seconds"
+)
+parser.add_argument(
+    "--ignore_lower_bound",
+    action="store_true",
+    help="Keep running after a solution without penalty reaches the lower bound "
+    "of the makespan",
+)
 parser.add_argument("--repair_pct", type=float, default=REPAIR_PCT, help="Repair percentage")
 parser.add_argument("--seed", action="store_true", help="Seed the initial population")
+parser.add_argument(
+    "--random_seed", type=int, default=RANDOM_SEED, help="Seed of the random numbers"
+)
+parser.add_argument(
+    "--metrics_file",
+    type=str,
+    default=METRICS_FILE,
+    help="File to export the progress to in the Prometheus text format",
+)
+parser.add_argument(
+    "--memory_every",
+    type=int,
+    default=MEMORY_EVERY,
+    help="Profile the memory every this many generations, slows down the run",
+)
 parser.add_argument("--create_figures", action="store_true", help="Create figures")
 parser.add_argument("--create_video", action="store_true", help="Create video")
 parser.add_argument(
     "--disable_multiprocessing",
     action="store_true",
-    help="Disable multiprocessing",
+    help="Disable multiprocessing, needed to reproduce a run from its seed",
+)
+parser.add_argument(
+    "--checkpoint_every",
+    type=int,
+    default=CHECKPOINT_EVERY,
+    help="Save a checkpoint every n generations",
+)
+parser.add_argument(
+    "--checkpoint_interval",
+    type=float,
+    default=CHECKPOINT_INTERVAL,
+    help="Save a checkpoint every n seconds",
+)
+parser.add_argument(
+    "--resume_from", type=str, default=None, help="Result folder to resume from"
+)
+parser.add_argument(
+    "--task", type=str, default=None, help="Experiment task key"
 )
 parser.add_argument("--quiet", action="store_true", help="Disable verbose output")
 parser.add_argument("--save_population", action="store_true", help="Save population")
@@ -75,68 +163,55 @@ parser.set_defaults(
     quiet=QUIET,
     save_population=SAVE_POPULATION,
 )
-args = parser.parse_args()
-
-instance_path = Path(args.instance)
-interpreter = AbsoluteScheduleInterpreter(Schedule.load(instance_path))
-instance_name = instance_path.stem
 
 
-def generate(
-    pmin: float,
-    pmax: float,
-    smin: float,
-    smax: float,
-    seed: np.ndarray | None = None,
-    size: int | None = None,
+def create_algorithm(
+    args: argparse.Namespace,
+    schedule: Schedule | None = None,
+    rng: np.random.Generator | None = None,
 ):
-    if seed is None:
-        seed = np.random.uniform(pmin, pmax, size)
-
-    size = len(seed)
-    part = creator.Particle(seed + np.random.randint(pmin, pmax, size))  # type: ignore
-    part.speed = np.random.uniform(smin, smax, size)
-    return part
+    instance_path = Path(args.instance)
+    if schedule is None:
+        schedule = Schedule.load(instance_path)
+    interpreter = INTERPRETERS[args.interpreter](schedule)
+    lower_bound = None
+    if not args.ignore_lower_bound:
+        lower_bound = makespan_lower_bound(schedule)
+    instance_name = instance_path.stem
+    if rng is None:
+        rng = np.random.default_rng(args.random_seed)
 
+    # create and run evolutionary algorithm
+    creator.create("FitnessMin", base.Fitness, weights=args.weights)
+    creator.create("Particle", np.ndarray, fitness=creator.FitnessMin, speed=list, best=None)  # type: ignore
 
-# create and run evolutionary algorithm
-creator.create("FitnessMin", base.Fitness, weights=args.weights)
-creator.create("Particle", np.ndarray, fitness=creator.FitnessMin, speed=list, best=None)  # type: ignore
-
-# initialization of individuals and population
-toolbox = base.Toolbox()
-toolbox.register(
-    "particle",
-    generate,
-    seed=interpreter.to_chromosome() if args.seed else None,
-    pmin=args.pmin,
-    pmax=args.pmax,
-    smin=-args.smax,
-    smax=args.smax,
-    size=2 * len(interpreter.schedule),
-)
-toolbox.register("population", tools.initRepeat, list, toolbox.particle)  # type: ignore
+    # initialization of individuals and population
+    toolbox = base.Toolbox()
+    toolbox.register(
+        "particle",
+        generate,
+        seed=interpreter.to_chromosome() if args.seed else None,
+        pmin=args.pmin,
+        pmax=args.pmax,
+        smin=-args.smax,
+        smax=args.smax,
+        size=2 * len(interpreter.schedule),
+        rng=rng,
+    )
+    toolbox.register("population", tools.initRepeat, list, toolbox.particle)  # type: ignore
 
-# evolutionary operators
-toolbox.register("evaluate", interpreter.interpret_and_get_scores)
+    # evolutionary operators
+    toolbox.register("evaluate", interpreter.interpret_and_get_scores)
 
-if __name__ == "__main__":
     # parallelization if not in debug mode
     if sys.gettrace() is None and not args.disable_multiprocessing:
-        toolbox.register("map", ThreadPool().imap_unordered)
+        toolbox.register("map", thread_pool().map)
         print("Running in parallel mode")
 
-    # statistics
-    stats = tools.Statistics(lambda ind: ind.fitness.wvalues)  # type: ignore
-    stats.register("avg", partial(np.mean, axis=0))
-    stats.register("std", partial(np.std, axis=0))
-    stats.register("min", partial(np.min, axis=0))
-    stats.register("max", partial(np.max, axis=0))
-
     # track best individuals
     hof = LexHallOfFame(1, similar=np.array_equal)  # type: ignore
 
-    # run algorithm
+    # create algorithm
     ea = ParticleSwarm(
         max_evaluations=args.neval,
         mu=args.mu,
@@ -153,7 +228,33 @@ if __name__ == "__main__":
         folder=instance_name,
         save_population=args.save_population,
         repair_pct=args.repair_pct,
+        checkpoint_every=args.checkpoint_every,
+        checkpoint_interval=args.checkpoint_interval,
+        resume_from=args.resume_from,
+        task=args.task,
+        rng=rng,
+        termination=termination_criteria(
+            patience=args.patience,
+            target=args.target,
+            max_time=args.max_time,
+            max_cpu_time=args.max_cpu_time,
+            lower_bound=lower_bound,
+        ),
+        hooks=run_hooks(args.metrics_file),
+        memory_every=args.memory_every,
     )
+
+    return ea
+
+
+def main(
+    args: argparse.Namespace,
+    schedule: Schedule | None = None,
+    rng: np.random.Generator | None = None,
+):
+    ea = create_algorithm(args, schedule, rng)
+
+    # run algorithm
     start_time = datetime.now()
     final_pop, logbook = ea.run()
     end_time = datetime.now()
@@ -161,6 +262,9 @@ if __name__ == "__main__":
         print(f"Running time time: {(end_time - start_time).total_seconds()}s")
 
     if ea.folder and (args.create_figures or args.create_video):
+        # plotting libraries are only loaded when figures are made
+        from eaplanner.visualization import ResultVisualization
+
         visualizer = ResultVisualization(ea.folder)
         if args.create_figures:
             visualizer.visualize_convergence(x_axis="nevals")
@@ -171,3 +275,9 @@ if __name__ == "__main__":
         if args.create_video:
             visualizer.visualize_generations_video(show_gantt_constraints=True)
             visualizer.visualize_generations_pca_video()
+
+    return ea
+
+
+if __name__ == "__main__":
+    main(parser.parse_args())
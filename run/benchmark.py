@@ -0,0 +1,98 @@
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from eaplanner.benchmark import (
+    ALGORITHMS,
+    SEED,
+    SIZES,
+    append_history,
+    format_results,
+    run_benchmarks,
+)
+
+ROOT = Path(__file__).parent.parent
+
+parser = argparse.ArgumentParser(
+    description="Benchmark evaluation and algorithm throughput on a fixed "
+    "instance set, results are appended to a JSON history"
+)
+parser.add_argument(
+    "--sizes", type=int, nargs="+", default=SIZES, help="Number of activities"
+)
+parser.add_argument(
+    "--algorithms",
+    choices=ALGORITHMS,
+    nargs="*",
+    default=ALGORITHMS,
+    help="Algorithms to measure the evaluations per second of",
+)
+parser.add_argument(
+    "--min_time", type=float, default=0.2, help="Minimum seconds per measurement"
+)
+parser.add_argument("--seed", type=int, default=SEED, help="Seed of the instances")
+parser.add_argument(
+    "--output",
+    type=str,
+    default=str(ROOT / "benchmarks" / "history.json"),
+    help="History to append the results to",
+)
+parser.add_argument(
+    "--cache",
+    type=str,
+    default=str(ROOT / "benchmarks" / "instances"),
+    help="Folder for the generated instances",
+)
+parser.add_argument("--label", type=str, default=None, help="Label of this run")
+
+
+def git_commit() -> tuple[str | None, bool]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, check=True
+        ).stdout.decode()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+        ).stdout.decode()
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+    return commit.strip(), bool(status.strip())
+
+
+def main(args):
+    commit, dirty = git_commit()
+    record = {
+        "commit": commit,
+        "dirty": dirty,
+        "label": args.label,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "min_time": args.min_time,
+    }
+
+    results = run_benchmarks(
+        args.sizes,
+        args.algorithms,
+        args.min_time,
+        args.seed,
+        Path(args.cache),
+        progress=lambda measurements: print(format_results(measurements)),
+    )
+    record["results"] = [m.to_dict() for m in results]
+    append_history(Path(args.output), record)
+    print(f"Appended {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main(parser.parse_args())
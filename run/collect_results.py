@@ -1,5 +1,8 @@
+import argparse
 import json
 import os
+from collections import defaultdict
+from multiprocessing import Pool
 from pathlib import Path
 import re
 from typing import Any
@@ -9,7 +12,9 @@ from eaplanner.entities.constraint import (
     ResourceConstraint,
 )
 
+from eaplanner.entities.schedule import Schedule
 from eaplanner.interpreter import ScheduleInterpreterBase
+from eaplanner.manifest import MANIFEST_PATH, RunManifest
 import numpy as np
 import pandas as pd
 
@@ -17,39 +22,75 @@ import pandas as pd
 # e.g. 2021-03-01_15-00-00
 pattern = r"\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}"
 # pattern = r"\d{4}-\d{2}-\d{2}_\d.*"
-subdirs = [
-    Path(x[0]) for x in os.walk("results") if re.match(pattern, os.path.basename(x[0]))
-]
 
-data: list[dict[str, Any]] = []
-for dir in subdirs:
+
+def collect_manifest(manifest: RunManifest) -> pd.DataFrame:
+    return manifest.to_dataframe(expand_parameters=True)
+
+
+def find_legacy_folders(manifest: RunManifest) -> list[Path]:
+    # runs from before the manifest existed still have to be read from disk
+    collected = manifest.folders()
+    subdirs = [
+        Path(x[0])
+        for x in os.walk("results")
+        if re.match(pattern, os.path.basename(x[0]))
+    ]
+
+    return [dir for dir in subdirs if manifest.relative_folder(dir) not in collected]
+
+
+FEATURES = (
+    "assignments",
+    "constraints",
+    "relation_constraints",
+    "resource_constraints",
+    "date_constraints",
+    "original_penalty",
+    "original_makespan",
+)
+
+
+def instance_features(schedule: Schedule) -> dict[str, Any]:
+    features: dict[str, Any] = {}
+    features["assignments"] = len(schedule.assignments)
+    features["constraints"] = len(schedule.constraints)
+    features["relation_constraints"] = len(
+        [c for c in schedule.constraints if isinstance(c, RelationConstraint)]
+    )
+    features["resource_constraints"] = len(
+        [c for c in schedule.constraints if isinstance(c, ResourceConstraint)]
+    )
+    features["date_constraints"] = len(
+        [c for c in schedule.constraints if isinstance(c, DateConstraint)]
+    )
+    features["original_penalty"] = schedule.get_total_penalty()
+    features["original_makespan"] = schedule.get_total_makespan()
+
+    return features
+
+
+def collect_legacy_folder(
+    dir: Path, features: dict[str, Any] | None = None
+) -> dict[str, Any] | None:
     if not os.listdir(dir):
         os.rmdir(dir)
-        continue
+        return None
 
     if not Path(f"{dir}/solution.json").exists():
-        continue
+        return None
 
-    instance_data: dict[str, Any] = {}
+    instance_data: dict[str, Any] = {
+        "folder": Path(os.path.relpath(dir, MANIFEST_PATH.parent)).as_posix()
+    }
 
     if Path(f"{dir}/instance.pkl").exists():
-        # Python instance
+        # Python instance, decoded with the interpreter and settings of this run
         interpreter = ScheduleInterpreterBase.load(dir / "instance.pkl")
         schedule = interpreter.schedule
-
-        instance_data["assignments"] = len(schedule.assignments)
-        instance_data["constraints"] = len(schedule.constraints)
-        instance_data["relation_constraints"] = len(
-            [c for c in schedule.constraints if isinstance(c, RelationConstraint)]
-        )
-        instance_data["resource_constraints"] = len(
-            [c for c in schedule.constraints if isinstance(c, ResourceConstraint)]
-        )
-        instance_data["date_constraints"] = len(
-            [c for c in schedule.constraints if isinstance(c, DateConstraint)]
-        )
-        instance_data["original_penalty"] = schedule.get_total_penalty()
-        instance_data["original_makespan"] = schedule.get_total_makespan()
+        if features is None:
+            features = instance_features(schedule)
+        instance_data.update(features)
 
         solution: list[float] = json.loads(Path(f"{dir}/solution.json").read_text())[
             "individual"
@@ -59,13 +100,12 @@ for dir in subdirs:
         instance_data["solution_penalty"] = schedule.get_total_penalty()
         instance_data["solution_makespan"] = schedule.get_total_makespan()
 
-        parameters: dict[str, float] = {}
         for p in re.findall(r"\((.*?)\)", dir.name)[0].split(", "):
             key, value = p.split("=")
             try:
-                parameters[key] = float(value)
+                instance_data[key] = float(value)
             except ValueError:
-                parameters[key] = value
+                instance_data[key] = value
 
     elif Path(f"{dir}/instance").exists():
         # Rust instance
@@ -97,11 +137,110 @@ for dir in subdirs:
         instance_data["solution_makespan"] = solution_json["scores"]["makespan"]
 
     else:
-        continue
+        return None
 
     algorithm: str = re.findall(f"{pattern}_(.*?)\\(", dir.name)[0]
     instance_data["algorithm"] = algorithm
-    data.append(instance_data)
+    instance_data["instance"] = dir.parent.name
+
+    return instance_data
+
+
+def collect_legacy_instance(dirs: list[Path]) -> list[dict[str, Any]]:
+    # all runs of one instance share its features, so they are only counted
+    # once, every run is still decoded by its own interpreter
+    features = None
+    data = []
+    for dir in dirs:
+        instance_data = collect_legacy_folder(dir, features)
+        if instance_data is not None:
+            data.append(instance_data)
+            if features is None and (dir / "instance.pkl").exists():
+                features = {k: instance_data[k] for k in FEATURES}
+
+    return data
+
+
+def collect_legacy(dirs: list[Path], processes: int | None = None) -> pd.DataFrame:
+    # run folders are stored per instance as results/<instance>/<run>
+    per_instance: dict[Path, list[Path]] = defaultdict(list)
+    for dir in dirs:
+        per_instance[dir.parent].append(dir)
+
+    with Pool(processes) as pool:
+        results = pool.imap_unordered(
+            collect_legacy_instance, per_instance.values(), chunksize=1
+        )
+        data = [row for rows in results for row in rows]
+
+    return pd.DataFrame(data)
+
+
+def read_collected(path: Path) -> pd.DataFrame | None:
+    if not path.exists():
+        return None
+
+    collected = pd.read_csv(path)
+    if "folder" not in collected.columns:
+        # results collected before folders were recorded, start over
+        return None
+
+    return collected
+
+
+def update_results(path: Path, collected: pd.DataFrame | None, new: pd.DataFrame):
+    if len(new) == 0:
+        return
+
+    if collected is None:
+        new.to_csv(path, index=False)
+        return
+
+    # append when the columns line up, otherwise rewrite the file once
+    replaced = collected["folder"].isin(new["folder"])
+    if replaced.any() or not set(new.columns) <= set(collected.columns):
+        df = pd.concat([collected[~replaced], new], ignore_index=True)
+        df.to_csv(path, index=False)
+    else:
+        new.reindex(columns=collected.columns).to_csv(
+            path, mode="a", header=False, index=False
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", type=str, default="results.csv", help="Output file")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Ignore previously collected results"
+    )
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    manifest = RunManifest(MANIFEST_PATH)
+    collected = None if args.rebuild else read_collected(output)
+
+    # runs finished since the last collection, or resumed and finished again
+    new = collect_manifest(manifest)
+    if collected is not None and len(new) > 0:
+        known = collected.set_index("folder").get("finished_at")
+        if known is not None:
+            previous = new["folder"].map(known)
+            new = new[previous.isna() | (previous != new["finished_at"])]
+        else:
+            new = new[~new["folder"].isin(collected["folder"])]
+
+    legacy_dirs = find_legacy_folders(manifest)
+    if collected is not None:
+        done = set(collected["folder"])
+        legacy_dirs = [
+            dir
+            for dir in legacy_dirs
+            if Path(os.path.relpath(dir, MANIFEST_PATH.parent)).as_posix() not in done
+        ]
+
+    legacy_df = collect_legacy(legacy_dirs, args.processes) if legacy_dirs else None
 
-df = pd.DataFrame(data)
-df.to_csv("results.csv", index=False)
+    new = pd.concat([new, legacy_df], ignore_index=True)
+    print(f"Collected {len(new)} new runs")
+    update_results(output, collected, new)
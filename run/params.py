@@ -1,6 +1,8 @@
 from pathlib import Path
 
 
+CHECKPOINT_EVERY = None
+CHECKPOINT_INTERVAL = None
 CX_INDPB = 0.2
 CXPB = 0.2
 REPAIR_PCT = 0.0
@@ -11,7 +13,12 @@ INSTANCE = (
     / "n_50"
     / "schedule_50_auto_0_1_0.pkl"
 )
+INTERPRETER = "absolute"
 LAMBDA_ = 250
+MAX_CPU_TIME = None
+MAX_TIME = None
+MEMORY_EVERY = None
+METRICS_FILE = None
 MU = 200
 MUT_INDPB = 0.1
 MUT_MU = 0
@@ -21,7 +28,9 @@ NEVAL = 100000
 PATIENCE = None
 PMAX = 50
 PMIN = -50
+RANDOM_SEED = None
 SEED = True
+TARGET = None
 WEIGHTS = (-1, -1)
 
 # Debugging
@@ -0,0 +1,83 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from eaplanner.benchmark import SEED, benchmark_instance
+from eaplanner.entities.schedule import Schedule
+from eaplanner.parity import RUST_BINARY, RUST_DIR, check_parity, format_parity
+
+parser = argparse.ArgumentParser(
+    description="Check that the Python and Rust implementations score the same "
+    "chromosomes the same, and compare their evaluations per second"
+)
+parser.add_argument(
+    "--sizes",
+    type=int,
+    nargs="*",
+    default=[10, 50, 100, 500],
+    help="Number of activities of the benchmark instances",
+)
+parser.add_argument(
+    "--instances", type=str, nargs="*", default=[], help="Additional instances"
+)
+parser.add_argument(
+    "--chromosomes", type=int, default=1000, help="Chromosomes per instance"
+)
+parser.add_argument("--seed", type=int, default=SEED, help="Seed of the chromosomes")
+parser.add_argument(
+    "--binary", type=str, default=str(RUST_BINARY), help="Binary of eaplanner-rs"
+)
+parser.add_argument(
+    "--build", action="store_true", help="Build the Rust port in release mode first"
+)
+parser.add_argument(
+    "--skip_rust",
+    action="store_true",
+    help="Only compare the Python engines, e.g. without a Rust toolchain",
+)
+
+
+def main(args):
+    if args.build:
+        subprocess.run(["cargo", "build", "--release"], cwd=RUST_DIR, check=True)
+
+    binary = None if args.skip_rust else Path(args.binary)
+    if binary is not None and not binary.exists():
+        sys.exit(f"{binary} does not exist, build it with --build or use --skip_rust")
+
+    schedules = [
+        (f"n_{n}_seed_{args.seed}", benchmark_instance(n, args.seed))
+        for n in args.sizes
+    ]
+    schedules += [(Path(p).stem, Schedule.load(Path(p))) for p in args.instances]
+
+    results = []
+    with TemporaryDirectory() as folder:
+        for name, schedule in schedules:
+            results.append(
+                check_parity(
+                    schedule,
+                    name,
+                    Path(folder),
+                    count=args.chromosomes,
+                    binary=binary,
+                    rng=args.seed,
+                )
+            )
+            print(format_parity(results[-1:]).splitlines()[-1], flush=True)
+
+    print()
+    print(format_parity(results))
+
+    for r in results:
+        for engine, rows in r.mismatches.items():
+            if rows:
+                print(f"{r.instance}: {engine} differs on chromosomes {rows[:10]}")
+
+    return all(r.ok for r in results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(parser.parse_args()) else 1)
@@ -0,0 +1,112 @@
+import math
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable
+
+from mpire import WorkerPool as Pool
+from scheduling import CostModel
+from tasks import Task, run_task
+
+from eaplanner.manifest import RunManifest
+
+
+@dataclass
+class RaceResult:
+    task: Task
+    folder: Path
+    scores: tuple[float, float]
+    neval: int
+
+
+def budgets(min_neval: float, max_neval: int, eta: int) -> list[int]:
+    # rungs grow by a factor eta and end exactly at max_neval
+    rungs = int(math.log(max_neval / min_neval, eta) + 1e-9)
+    return [round(max_neval * eta ** (i - rungs)) for i in range(rungs + 1)]
+
+
+def scores(manifest: RunManifest, folder: Path) -> tuple[float, float] | None:
+    records = manifest.records("folder = ?", manifest.relative_folder(folder))
+    if not records or records[0]["solution_penalty"] is None:
+        return None
+
+    # runs are compared lexicographically, like in the hall of fame
+    return records[0]["solution_penalty"], records[0]["solution_makespan"]
+
+
+def run_rung(
+    pool: Pool, configs: list[Task], manifest: RunManifest, neval: int
+) -> list[RaceResult]:
+    # the final checkpoint of every run is what the next rung resumes from
+    tasks = [
+        replace(c, flags=[*c.flags, "checkpoint_interval 300", f"neval {neval}"])
+        for c in configs
+    ]
+    # longest first, as in the other experiment runners
+    model = CostModel(manifest)
+    order = sorted(
+        range(len(tasks)), key=lambda i: model.estimate(tasks[i], neval), reverse=True
+    )
+    folders = pool.map(
+        run_task, [tasks[i] for i in order], chunk_size=1, progress_bar=True
+    )
+
+    results = []
+    for i, folder in zip(order, folders):
+        score = scores(manifest, folder) if folder is not None else None
+        if score is not None:
+            results.append(RaceResult(configs[i], folder, score, neval))
+
+    return sorted(results, key=lambda r: r.scores)
+
+
+def successive_halving(
+    pool: Pool,
+    configs: list[Task],
+    manifest: RunManifest,
+    min_neval: float,
+    max_neval: int,
+    eta: int = 3,
+) -> list[RaceResult]:
+    """Races configurations over growing evaluation budgets.
+
+    After every rung only the best `1 / eta` of the configurations continue.
+    They resume from the checkpoint of their previous rung, so a configuration
+    that reaches `max_neval` costs the same as a single full run.
+    """
+    alive = configs
+    results: list[RaceResult] = []
+    for rung, neval in enumerate(budgets(min_neval, max_neval, eta)):
+        if rung > 0:
+            keep = max(1, len(results) // eta)
+            for r in results[keep:]:
+                # eliminated configurations will not be resumed
+                (r.folder / "checkpoint.pkl").unlink(missing_ok=True)
+
+            alive = [replace(r.task, resume_from=r.folder) for r in results[:keep]]
+
+        print(f"Racing {len(alive)} configurations with {neval} evaluations")
+        results = run_rung(pool, alive, manifest, neval)
+
+    return results
+
+
+def hyperband(
+    pool: Pool,
+    sample: Callable[[], Task],
+    manifest: RunManifest,
+    min_neval: int,
+    max_neval: int,
+    eta: int = 3,
+) -> list[RaceResult]:
+    # every bracket trades the number of configurations against their
+    # starting budget, from many short runs to a few full runs
+    s_max = len(budgets(min_neval, max_neval, eta)) - 1
+
+    results = []
+    for s in range(s_max, -1, -1):
+        n = math.ceil((s_max + 1) / (s + 1) * eta**s)
+        configs = [sample() for _ in range(n)]
+        start = max_neval / eta**s
+        results += successive_halving(pool, configs, manifest, start, max_neval, eta)
+
+    return sorted(results, key=lambda r: r.scores)
@@ -1,14 +1,21 @@
 import json
+from collections import Counter, defaultdict
 from os import cpu_count
-import random
-import subprocess
+import re
+from dataclasses import replace
 from datetime import datetime
 from glob import glob
 from itertools import product
 from pathlib import Path
 
+import numpy as np
 from mpire import WorkerPool as Pool
 from mpire.dashboard import start_dashboard
+from params import NEVAL
+from scheduling import CostModel, longest_first
+from tasks import ALGORITHM_NAMES, Task, find_instances, run_task
+
+from eaplanner.manifest import MANIFEST_PATH, RunManifest
 
 if __name__ == "__main__":
     curr_dir = Path(__file__).parent
@@ -55,64 +62,81 @@ if __name__ == "__main__":
             "repair_pct": 1.0,
         },
     }
-    algorithm_names = {
-        "ga": "MuPlusLambda",
-        "ppa": "PlantPropagation",
-        "pso": "ParticleSwarm",
-        "sa": "SimulatedAnnealing",
-        "shc": "StochasticHillClimb",
-    }
     global_flags = [
         "disable_multiprocessing",
         "seed",
         "quiet",
+        "checkpoint_interval 300",
     ]
-    global_str = " ".join([f"--{v}" for v in global_flags])
 
     # number of times each task should be run
     repeats = 3
 
     # find all instances
-    instances = [
-        Path(p)
-        for p in glob(
-            str(curr_dir.parent / "instances" / "generated") + "/**/*.pkl",
-            recursive=True,
-        )
-    ]
+    instances = find_instances(curr_dir.parent / "instances" / "generated")
+
+    # count finished runs per task, runs record their task key in the manifest
+    manifest = RunManifest(curr_dir.parent / MANIFEST_PATH)
+    done_tasks = manifest.completed_tasks()
+
+    # runs from before task keys were recorded only tell the algorithm and
+    # instance through their folder name
+    keyed_folders = {r["folder"] for r in manifest.records("task IS NOT NULL")}
+    done_legacy: Counter[tuple[str, str]] = Counter()
+    for p in glob(f"{str(curr_dir.parent)}/results/**/solution.json", recursive=True):
+        folder = Path(p).parent
+        match = re.search(r"_([A-Za-z]+)\(", folder.name)
+        if match and manifest.relative_folder(folder) not in keyed_folders:
+            done_legacy[(match.group(1), folder.parent.name)] += 1
 
-    # find all tasks that have already been run
-    done_tasks = glob(
-        f"{str(curr_dir.parent)}/results/**/solution.json", recursive=True
-    )
+    # find all tasks that were interrupted and can be resumed from a checkpoint
+    interrupted: defaultdict[tuple[str, str], list[Path]] = defaultdict(list)
+    for p in glob(f"{str(curr_dir.parent)}/results/**/checkpoint.pkl", recursive=True):
+        folder = Path(p).parent
+        match = re.search(r"_([A-Za-z]+)\(", folder.name)
+        if match and not (folder / "solution.json").exists():
+            interrupted[(match.group(1), folder.parent.name)].append(folder)
 
     tasks = []
     for (algorithm, params), instance in product(algorithm_params.items(), instances):
         # check how often task has already been run
-        n_runs = sum(
-            algorithm_names[algorithm] in task and instance.name[:-4] in task
-            for task in done_tasks
-        )
+        key = Task(algorithm, instance, params).key
+        name = ALGORITHM_NAMES[algorithm]
+        n_runs = done_tasks[key] + done_legacy[(name, instance.stem)]
+        resumable = interrupted[(name, instance.stem)]
 
         if n_runs >= repeats:
             continue
 
         # add tasks to list
-        params_str = " ".join([f"--{k} {v}" for k, v in params.items()])
-        alg_file = curr_dir / f"algorithm_{algorithm}.py"
-        task = f"python -O {alg_file} {params_str} {global_str} --instance {instance}"
-        tasks.extend([task] * (repeats - n_runs))
-
-    random.shuffle(tasks)
+        resumable = resumable[: repeats - n_runs]
+        tasks.extend(
+            Task(algorithm, instance, params, global_flags, resume_from=folder)
+            for folder in resumable
+        )
+        tasks.extend(
+            Task(algorithm, instance, params, global_flags)
+            for _ in range(repeats - n_runs - len(resumable))
+        )
 
     print(f"Running {len(tasks)} tasks")
     if not tasks:
         print("No tasks to run")
         exit()
 
-    # run tasks
+    # every run gets its own random numbers, rerunning the same task list
+    # with this entropy reproduces all of them
+    seeds = np.random.SeedSequence()
+    print(f"Seed entropy: {seeds.entropy}")
+    tasks = [replace(t, seed=s) for t, s in zip(tasks, seeds.spawn(len(tasks)))]
+
+    # start the most expensive tasks first, estimated from earlier runs
+    tasks = longest_first(tasks, CostModel(manifest), NEVAL)
+
+    # run tasks, every worker imports eaplanner once and runs its tasks in-process
     with Pool(cpu_count() or 2 - 1, enable_insights=True) as p:
-        for res in p.imap_unordered(subprocess.run, tasks, progress_bar=True):
+        # tasks are handed out one at a time, so idle workers take the next one
+        for res in p.imap_unordered(run_task, tasks, chunk_size=1, progress_bar=True):
             continue
 
         insights = p.get_insights()
@@ -1,93 +1,148 @@
+import argparse
 import json
-import random
-import subprocess
 from datetime import datetime
 from functools import partial
-from glob import glob
 from os import cpu_count
 from pathlib import Path
 from typing import Callable
 
+import numpy as np
 from mpire import WorkerPool as Pool
 from mpire.dashboard import start_dashboard
+from params import NEVAL
+from racing import hyperband, successive_halving
+from scheduling import CostModel, longest_first
+from tasks import Task, find_instances, run_task
+
+from eaplanner.manifest import MANIFEST_PATH, RunManifest
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--racing",
+        choices=["none", "halving", "hyperband"],
+        default="none",
+        help="Race configurations over growing budgets instead of full runs",
+    )
+    parser.add_argument("--eta", type=int, default=3, help="Keep 1/eta per rung")
+    parser.add_argument(
+        "--min_neval", type=int, default=1000, help="Evaluations in the first rung"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Entropy of the sampled configurations"
+    )
+    args = parser.parse_args()
+
     dashboard_details = start_dashboard()
     print(dashboard_details)
 
     tasks_per_algorithm = 1000
     repeats = 1
 
+    # sampling again with this entropy draws the same configurations
+    seeds = np.random.SeedSequence(args.seed)
+    print(f"Seed entropy: {seeds.entropy}")
+    rng = np.random.default_rng(seeds)
+
     curr_dir = Path(__file__).parent
-    instances = [
-        Path(p)
-        for p in glob(
-            str(curr_dir.parent / "instances" / "generated_param_search" / "n_100") + "/**/*.pkl",
-            recursive=True,
-        )
-    ]
+    instances = find_instances(
+        curr_dir.parent / "instances" / "generated_param_search" / "n_100"
+    )
     algorithm_params: dict[str, dict[str, Callable[..., float]]] = {
         "ga": {
-            "mu": partial(random.randint, 10, 300),
-            "lambda_": partial(random.randint, 10, 300),
-            "cxpb": partial(random.uniform, 0, 1),
-            "cx_indpb": partial(random.uniform, 0.01, 1),
-            "mut_indpb": partial(random.uniform, 0.01, 1),
-            "mut_sigma": partial(random.uniform, 0.1, 2),
-            "repair_pct": partial(random.uniform, 0, 1),
+            "mu": partial(rng.integers, 10, 300, endpoint=True),
+            "lambda_": partial(rng.integers, 10, 300, endpoint=True),
+            "cxpb": partial(rng.uniform, 0, 1),
+            "cx_indpb": partial(rng.uniform, 0.01, 1),
+            "mut_indpb": partial(rng.uniform, 0.01, 1),
+            "mut_sigma": partial(rng.uniform, 0.1, 2),
+            "repair_pct": partial(rng.uniform, 0, 1),
         },
         "ppa": {
-            "mu": partial(random.randint, 10, 300),
-            "lambda_": partial(random.randint, 10, 300),
-            "mut_indp": partial(random.uniform, 0.01, 1),
-            "mut_sigma": partial(random.uniform, 0.1, 2),
-            "repair_pct": partial(random.uniform, 0, 1),
+            "mu": partial(rng.integers, 10, 300, endpoint=True),
+            "lambda_": partial(rng.integers, 10, 300, endpoint=True),
+            "mut_indp": partial(rng.uniform, 0.01, 1),
+            "mut_sigma": partial(rng.uniform, 0.1, 2),
+            "repair_pct": partial(rng.uniform, 0, 1),
         },
         "pso": {
-            "mu": partial(random.randint, 10, 300),
-            "smax": partial(random.uniform, 0.1, 2),
-            "phi1": partial(random.uniform, 0.1, 10),
-            "phi2": partial(random.uniform, 0.1, 10),
-            "repair_pct": partial(random.uniform, 0, 1),
-            "weight": partial(random.uniform, 0.1, 1),
+            "mu": partial(rng.integers, 10, 300, endpoint=True),
+            "smax": partial(rng.uniform, 0.1, 2),
+            "phi1": partial(rng.uniform, 0.1, 10),
+            "phi2": partial(rng.uniform, 0.1, 10),
+            "repair_pct": partial(rng.uniform, 0, 1),
+            "weight": partial(rng.uniform, 0.1, 1),
         },
         "sa": {
-            "mu": partial(random.randint, 1, 50),
-            "temp": partial(random.uniform, 1, 200),
-            "alpha": partial(random.uniform, 0.8, 0.99),
-            "mut_indpb": partial(random.uniform, 0.01, 1),
-            "mut_sigma": partial(random.uniform, 0.1, 2),
-            "repair_pct": partial(random.uniform, 0, 1),
+            "mu": partial(rng.integers, 1, 50, endpoint=True),
+            "temp": partial(rng.uniform, 1, 200),
+            "alpha": partial(rng.uniform, 0.8, 0.99),
+            "mut_indpb": partial(rng.uniform, 0.01, 1),
+            "mut_sigma": partial(rng.uniform, 0.1, 2),
+            "repair_pct": partial(rng.uniform, 0, 1),
         },
         "shc": {
-            "mu": partial(random.randint, 1, 50),
-            "mut_indpb": partial(random.uniform, 0.01, 1),
-            "mut_sigma": partial(random.uniform, 0.1, 2),
-            "repair_pct": partial(random.uniform, 0, 1),
+            "mu": partial(rng.integers, 1, 50, endpoint=True),
+            "mut_indpb": partial(rng.uniform, 0.01, 1),
+            "mut_sigma": partial(rng.uniform, 0.1, 2),
+            "repair_pct": partial(rng.uniform, 0, 1),
         },
     }
+    max_neval = 100000
     global_flags = [
         "disable_multiprocessing",
         "seed",
         "quiet",
-        "neval 100000"
+        f"neval {max_neval}",
     ]
-    global_str = " ".join([f"--{v}" for v in global_flags])
 
-    tasks = []
-    for algorithm, params in algorithm_params.items():
-        for _ in range(tasks_per_algorithm):
-            params_str = " ".join([f"--{k} {round(v(), 2)}" for k, v in params.items()])
-            alg_file = curr_dir / f"algorithm_{algorithm}.py"
-            instance = random.choice(instances)
-            tasks.append(f"python {alg_file} {params_str} --instance {instance} {global_str}")
+    def sample(algorithm: str, instance: Path) -> Task:
+        params = algorithm_params[algorithm]
+        sampled = {k: np.round(v(), 2).item() for k, v in params.items()}
+        return Task(algorithm, instance, sampled, global_flags)
 
-    tasks = tasks * repeats
-    random.shuffle(tasks)
+    manifest = RunManifest(curr_dir.parent / MANIFEST_PATH)
 
     with Pool(cpu_count() or 2 - 1, enable_insights=True) as p:
-        for res in p.imap_unordered(subprocess.run, tasks, progress_bar=True):
-            continue
+        if args.racing == "none":
+            tasks = []
+            for algorithm in algorithm_params:
+                for _ in range(tasks_per_algorithm):
+                    instance = instances[rng.integers(len(instances))]
+                    tasks.append(sample(algorithm, instance))
+
+            tasks = tasks * repeats
+
+            # start the most expensive tasks first, estimated from earlier runs
+            tasks = longest_first(tasks, CostModel(manifest), NEVAL)
+
+            for res in p.imap_unordered(run_task, tasks, chunk_size=1, progress_bar=True):
+                continue
+        else:
+            for algorithm in algorithm_params:
+                # configurations are only comparable when run on the same instance
+                instance = instances[rng.integers(len(instances))]
+                if args.racing == "halving":
+                    configs = [
+                        sample(algorithm, instance) for _ in range(tasks_per_algorithm)
+                    ]
+                    results = successive_halving(
+                        p, configs, manifest, args.min_neval, max_neval, args.eta
+                    )
+                else:
+                    results = hyperband(
+                        p,
+                        partial(sample, algorithm, instance),
+                        manifest,
+                        args.min_neval,
+                        max_neval,
+                        args.eta,
+                    )
+
+                if results:
+                    best = results[0]
+                    print(f"Best {algorithm} on {instance.stem}: {best.task.params}")
+                    print(f"Scores: {best.scores}, folder: {best.folder}")
 
         insights = p.get_insights()
 
@@ -0,0 +1,80 @@
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+from tasks import ALGORITHM_NAMES, Task, load_schedule
+
+from eaplanner.manifest import RunManifest
+
+
+def instance_features(path: Path) -> tuple[int, int]:
+    schedule = load_schedule(path)
+    return len(schedule.assignments), len(schedule.constraints)
+
+
+class CostModel:
+    """Estimates the wall time of a task from earlier runs in the manifest.
+
+    The time per evaluation is fitted per algorithm as a linear function of the
+    number of assignments and constraints, and multiplied by the number of
+    evaluations of the task. Algorithms with too few finished runs share a fit
+    over all runs, and without any history the size of the instance is used.
+    """
+
+    def __init__(self, manifest: RunManifest, min_runs: int = 5):
+        self.min_runs = min_runs
+        self.weights: dict[str | None, np.ndarray] = {}
+        self._features: dict[str, tuple[int, int]] = {}
+
+        runs = [
+            r
+            for r in manifest.records("wall_time IS NOT NULL AND evaluations > 0")
+            if r["assignments"] is not None and r["constraints"] is not None
+        ]
+        per_algorithm = defaultdict(list)
+        for r in runs:
+            per_algorithm[r["algorithm"]].append(r)
+            self._features[r["instance"]] = (r["assignments"], r["constraints"])
+
+        for algorithm, records in [(None, runs), *per_algorithm.items()]:
+            if len(records) >= self.min_runs:
+                self.weights[algorithm] = self._fit(records)
+
+    @staticmethod
+    def _design(assignments, constraints) -> np.ndarray:
+        return np.column_stack(
+            [np.ones_like(assignments), assignments, constraints]
+        ).astype(float)
+
+    def _fit(self, records: list[dict]) -> np.ndarray:
+        X = self._design(
+            np.array([r["assignments"] for r in records]),
+            np.array([r["constraints"] for r in records]),
+        )
+        y = np.array([r["wall_time"] / r["evaluations"] for r in records])
+        weights, *_ = np.linalg.lstsq(X, y, rcond=None)
+        return weights
+
+    def features(self, instance: Path) -> tuple[int, int]:
+        if instance.stem not in self._features:
+            self._features[instance.stem] = instance_features(instance)
+        return self._features[instance.stem]
+
+    def estimate(self, task: Task, neval: int) -> float:
+        assignments, constraints = self.features(Path(task.instance))
+        algorithm = ALGORITHM_NAMES.get(task.algorithm)
+        weights = self.weights.get(algorithm, self.weights.get(None))
+        if weights is None:
+            return float(neval * (assignments + constraints))
+
+        per_eval = self._design(np.array([assignments]), np.array([constraints])) @ weights
+        # a linear fit can go negative for instances far outside the history
+        return float(neval * max(per_eval[0], np.finfo(float).eps))
+
+
+def longest_first(tasks: list[Task], model: CostModel, default_neval: int) -> list[Task]:
+    # workers take the next task as soon as they are idle, so starting the
+    # longest tasks first keeps a few large runs from finishing the batch alone
+    costs = [model.estimate(t, int(t.option("neval", default_neval))) for t in tasks]
+    order = np.argsort(costs, kind="stable")[::-1]
+    return [tasks[i] for i in order]
@@ -0,0 +1,109 @@
+import hashlib
+import importlib
+import json
+import pickle
+import traceback
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from eaplanner.entities.schedule import Schedule
+from eaplanner.utils import isolated_creator
+
+ALGORITHM_NAMES = {
+    "ga": "MuPlusLambda",
+    "ppa": "PlantPropagation",
+    "pso": "ParticleSwarm",
+    "sa": "SimulatedAnnealing",
+    "shc": "StochasticHillClimb",
+}
+
+
+@dataclass
+class Task:
+    """One run of `algorithm_{algorithm}.py`, with its command line options."""
+
+    algorithm: str
+    instance: Path
+    params: dict[str, Any] = field(default_factory=dict)
+    flags: list[str] = field(default_factory=list)
+    resume_from: Path | None = None
+    # the random numbers of the run, not part of the key
+    seed: np.random.SeedSequence | None = None
+
+    @property
+    def key(self) -> str:
+        # repeats of the same configuration share a key, used to count finished runs
+        params = json.dumps(self.params, sort_keys=True, default=str)
+        digest = hashlib.sha1(params.encode()).hexdigest()[:12]
+        return f"{self.algorithm}/{Path(self.instance).stem}/{digest}"
+
+    def option(self, name: str, default: Any = None) -> Any:
+        if name in self.params:
+            return self.params[name]
+        # later flags override earlier ones, like on the command line
+        for flag in reversed(self.flags):
+            flag_name, *value = flag.split()
+            if flag_name == name:
+                return value[0] if value else True
+
+        return default
+
+    def to_args(self) -> list[str]:
+        args = ["--instance", str(self.instance), "--task", self.key]
+        for key, value in self.params.items():
+            args += [f"--{key}", str(value)]
+        for flag in self.flags:
+            name, *value = flag.split()
+            args += [f"--{name}", *value]
+        if self.resume_from is not None:
+            args += ["--resume_from", str(self.resume_from)]
+
+        return args
+
+    def __str__(self):
+        return f"algorithm_{self.algorithm}.py {' '.join(self.to_args())}"
+
+
+def find_instances(folder: Path) -> list[Path]:
+    """Instances below `folder`, the npz file of an instance saved in both formats."""
+    instances: dict[Path, Path] = {}
+    for path in sorted([*folder.rglob("*.pkl"), *folder.rglob("*.npz")]):
+        key = path.with_suffix("")
+        if key not in instances or path.suffix == ".npz":
+            instances[key] = path
+
+    return list(instances.values())
+
+
+@lru_cache(maxsize=16)
+def _load_instance(path: Path) -> bytes:
+    return pickle.dumps(Schedule.load(path))
+
+
+def load_schedule(path: str | Path) -> Schedule:
+    # the instance is read once per worker, but every run gets its own copy
+    # because interpreting a chromosome modifies the schedule
+    return pickle.loads(_load_instance(Path(path)))
+
+
+def run_task(task: Task) -> Path | None:
+    module = importlib.import_module(f"algorithm_{task.algorithm}")
+    args = module.parser.parse_args(task.to_args())
+
+    # without a seed every run draws fresh entropy, also in forked workers
+    rng = np.random.default_rng(task.seed)
+
+    try:
+        with isolated_creator():
+            ea = module.main(args, schedule=load_schedule(task.instance), rng=rng)
+    except Exception:
+        # a failing configuration should not stop the remaining tasks
+        print(f"Task failed: {task}")
+        traceback.print_exc()
+        return None
+
+    return ea.folder
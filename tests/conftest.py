@@ -0,0 +1,37 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance regression gate")
+    group.addoption(
+        "--perf",
+        action="store_true",
+        help="Compare the throughput of the core kernels to the committed baseline",
+    )
+    group.addoption(
+        "--perf-update",
+        action="store_true",
+        help="Write the measured throughput as the new baseline",
+    )
+    group.addoption(
+        "--perf-tolerance",
+        type=float,
+        default=0.25,
+        help="Slowdown that is tolerated on top of the measured noise",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "perf: performance test, only runs with --perf or --perf-update"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--perf") or config.getoption("--perf-update"):
+        return
+
+    skip = pytest.mark.skip(reason="performance tests run with --perf")
+    for item in items:
+        if item.get_closest_marker("perf") is not None:
+            item.add_marker(skip)
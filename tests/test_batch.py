@@ -0,0 +1,33 @@
+import pytest
+
+from eaplanner.algorithms.batch import BatchRunner
+from tests.test_checkpoint import create_algorithm
+
+
+def test_batch_runner_runs_every_algorithm(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    algorithms = [
+        create_algorithm("ga", 100, repair_pct=0, save=True),
+        create_algorithm("sa", 40, repair_pct=0, save=True),
+    ]
+    runner = BatchRunner(algorithms)
+
+    # act
+    results = runner.run()
+
+    # assert
+    assert [a.current_evals >= a.max_evaluations for a in algorithms] == [True, True]
+    assert [a.stop_reason for a in algorithms] == ["max_evaluations"] * 2
+    for algorithm, (population, logbook) in zip(algorithms, results):
+        assert len(logbook) == algorithm.gen + 1
+        assert (algorithm.folder / "solution.json").exists()
+
+
+def test_batch_runner_requires_evaluation_without_repair():
+    # arrange
+    algorithms = [create_algorithm("ga", 100, repair_pct=0.5)]
+
+    # act / assert
+    with pytest.raises(ValueError):
+        BatchRunner(algorithms)
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from eaplanner.benchmark import (
+    Measurement,
+    append_history,
+    benchmark_instance,
+    create_baseline,
+    find_regressions,
+    run_benchmarks,
+)
+
+
+def test_benchmark_instance_is_cached(tmp_path):
+    # arrange
+    schedule = benchmark_instance(10, cache=tmp_path)
+
+    # act
+    cached = benchmark_instance(10, cache=tmp_path)
+
+    # assert
+    assert len(cached) == len(schedule) == 10
+    assert [a.hours for a in cached.assignments] == [
+        a.hours for a in schedule.assignments
+    ]
+
+
+def test_run_benchmarks_appends_to_history(tmp_path):
+    # arrange
+    path = tmp_path / "history.json"
+    results = run_benchmarks(sizes=[10], algorithms=["shc"], min_time=0.001)
+
+    # act
+    append_history(path, {"results": [m.to_dict() for m in results]})
+    append_history(path, {"results": []})
+
+    # assert
+    history = json.loads(path.read_text())
+    assert len(history) == 2
+    names = {r["name"] for r in history[0]["results"]}
+    assert {"interpret_and_get_scores", "pareto_rank", "algorithm/shc"} <= names
+    assert all(r["rate"] > 0 for r in history[0]["results"])
+
+
+def test_find_regressions_tolerates_noise():
+    # arrange
+    calibration = Measurement(
+        "calibration", 0, seconds=1.0, best=1.0, loops=1, repeats=1
+    )
+    baseline = create_baseline(
+        [
+            Measurement("quiet", 10, seconds=1.0, best=1.0, loops=1, repeats=5),
+            Measurement("noisy", 10, seconds=1.0, best=1.0, loops=1, repeats=5),
+        ],
+        calibration,
+    )
+    # twice as slow on a machine that is twice as fast
+    faster = Measurement("calibration", 0, seconds=0.5, best=0.5, loops=1, repeats=1)
+    results = [
+        Measurement("quiet", 10, seconds=1.0, best=1.0, loops=1, repeats=5),
+        Measurement("noisy", 10, seconds=1.6, best=0.8, loops=1, repeats=5),
+        Measurement("new", 10, seconds=9.0, best=9.0, loops=1, repeats=5),
+    ]
+
+    # act
+    regressions = find_regressions(results, faster, baseline, tolerance=0.25)
+
+    # assert
+    assert [r.key for r in regressions] == ["quiet[10]"]
+    assert regressions[0].slowdown == pytest.approx(2.0)
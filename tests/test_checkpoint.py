@@ -0,0 +1,250 @@
+import random
+from multiprocessing.pool import ThreadPool
+from time import sleep
+
+import numpy as np
+import pytest
+from deap import base, creator, tools
+
+import eaplanner.algorithms.base as algorithm_base
+from eaplanner.algorithms.ga import MuPlusLambda
+from eaplanner.algorithms.local import SimulatedAnnealing
+from eaplanner.algorithms.pso import ParticleSwarm
+from eaplanner.entities.assignment import Assignment
+from eaplanner.entities.constraint import RelationConstraint
+from eaplanner.entities.enum import RelationType
+from eaplanner.entities.schedule import Schedule
+from eaplanner.interpreter import AbsoluteScheduleInterpreter
+from eaplanner.utils import (
+    LexHallOfFame,
+    SelNSGA3WithMemory,
+    cx_uniform,
+    mut_gaussian,
+)
+from eaplanner.writer import BackgroundWriter
+
+creator.create("FitnessMin", base.Fitness, weights=(-1, -1))
+creator.create("Individual", np.ndarray, fitness=creator.FitnessMin)  # type: ignore
+creator.create("Particle", np.ndarray, fitness=creator.FitnessMin, speed=list, best=None)  # type: ignore
+
+
+def create_interpreter():
+    assignments = [Assignment(hours=10, id=i).set(start=0, duration=2) for i in range(4)]
+    constraints = [
+        RelationConstraint(RelationType.FINISH_TO_START, assignments[0], assignments[1]),
+        RelationConstraint(RelationType.START_TO_START, assignments[1], assignments[2]),
+        RelationConstraint(RelationType.FINISH_TO_FINISH, assignments[2], assignments[3]),
+    ]
+
+    return AbsoluteScheduleInterpreter(Schedule(assignments, constraints))
+
+
+def create_toolbox(interpreter, particles: bool = False, rng=None):
+    rng = np.random.default_rng(rng)
+
+    def generate():
+        genes = rng.integers(-5, 5, size=2 * len(interpreter.schedule))
+        if not particles:
+            return creator.Individual(genes)  # type: ignore
+
+        part = creator.Particle(genes.astype(np.float64))  # type: ignore
+        part.speed = rng.uniform(-1, 1, len(part))
+        return part
+
+    toolbox = base.Toolbox()
+    toolbox.register("individual", generate)
+    toolbox.register("population", tools.initRepeat, list, toolbox.individual)  # type: ignore
+    toolbox.register("evaluate", interpreter.interpret_and_get_scores)
+    toolbox.register("mate", cx_uniform, indpb=0.5, rng=rng)
+    toolbox.register("mutate", mut_gaussian, mu=0, sigma=1, indpb=0.5, rng=rng)
+    ref_points = tools.uniform_reference_points(nobj=2)
+    toolbox.register("select", SelNSGA3WithMemory(ref_points, rng=rng))
+
+    return toolbox
+
+
+def create_algorithm(name: str, max_evaluations: int, **kwargs):
+    interpreter = create_interpreter()
+    rng = np.random.default_rng(kwargs.pop("rng", None))
+    kwargs.update(
+        max_evaluations=max_evaluations,
+        interpreter=interpreter,
+        toolbox=create_toolbox(interpreter, particles=name == "pso", rng=rng),
+        rng=rng,
+        halloffame=LexHallOfFame(1, similar=np.array_equal),
+        verbose=False,
+    )
+
+    match name:
+        case "ga":
+            return MuPlusLambda(mu=8, lambda_=8, cxpb=0.5, mutpb=0.5, **kwargs)
+        case "sa":
+            return SimulatedAnnealing(
+                mu=2, mut_prob=0.5, mut_std=2, temp=10, alpha=0.9, **kwargs
+            )
+        case "pso":
+            return ParticleSwarm(
+                mu=8, phi1=2, phi2=2, smin=-1, smax=1, weight=0.5, **kwargs
+            )
+
+    raise ValueError(name)
+
+
+@pytest.mark.parametrize("name", ["ga", "sa", "pso"])
+def test_resume_is_identical(name, tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+
+    full = create_algorithm(name, 80, rng=0)
+    full_population, full_logbook = full.run()
+
+    interrupted = create_algorithm(name, 40, rng=0, save=True, checkpoint_every=1)
+    interrupted.run()
+
+    # act
+    resumed = create_algorithm(name, 80, resume_from=interrupted.folder)
+    resumed_population, resumed_logbook = resumed.run()
+
+    # assert
+    assert resumed.gen == full.gen
+    assert resumed.current_evals == full.current_evals
+    np.testing.assert_array_equal(np.array(resumed_population), np.array(full_population))
+    assert [ind.fitness.values for ind in resumed_population] == [
+        ind.fitness.values for ind in full_population
+    ]
+    np.testing.assert_array_equal(
+        np.array(resumed_logbook.select("min")), np.array(full_logbook.select("min"))
+    )
+    np.testing.assert_array_equal(resumed.halloffame[0], full.halloffame[0])
+
+
+@pytest.mark.parametrize("name", ["ga", "sa", "pso"])
+def test_same_seed_is_reproduced(name):
+    # arrange
+    first = create_algorithm(name, 40, rng=7)
+    second = create_algorithm(name, 40, rng=7)
+
+    # act
+    first_population, _ = first.run()
+    second_population, _ = second.run()
+
+    # assert
+    np.testing.assert_array_equal(
+        np.array(first_population), np.array(second_population)
+    )
+
+
+def test_run_leaves_the_global_generators_alone():
+    # arrange
+    algorithm = create_algorithm("ga", 40, rng=7)
+    random_state = random.getstate()
+    numpy_state = np.random.get_state()[1].copy()
+
+    # act
+    algorithm.run()
+
+    # assert
+    assert random.getstate() == random_state
+    np.testing.assert_array_equal(np.random.get_state()[1], numpy_state)
+
+
+def test_resumed_run_streams_the_whole_logbook(tmp_path, monkeypatch, capsys):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    interrupted = create_algorithm("ga", 40, rng=0, save=True, checkpoint_every=1)
+    interrupted.verbose = True
+    interrupted.run()
+    resumed = create_algorithm("ga", 80, resume_from=interrupted.folder)
+    resumed.verbose = True
+    capsys.readouterr()
+
+    # act
+    resumed.run()
+    path = tmp_path / "stream.tsv"
+    path.write_text(capsys.readouterr().out)
+    streamed = np.genfromtxt(path, delimiter="\t", names=True)
+
+    # assert
+    assert list(streamed.dtype.names) == resumed.logbook.header
+    np.testing.assert_array_equal(streamed["gen"], resumed.logbook.column("gen"))
+
+
+def test_resume_with_other_parameters_fails(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    interrupted = create_algorithm("sa", 10, save=True, checkpoint_every=1)
+    interrupted.run()
+
+    interpreter = create_interpreter()
+    resumed = SimulatedAnnealing(
+        mu=2,
+        mut_prob=0.1,
+        mut_std=2,
+        temp=10,
+        alpha=0.9,
+        max_evaluations=20,
+        interpreter=interpreter,
+        toolbox=create_toolbox(interpreter),
+        resume_from=interrupted.folder,
+    )
+
+    # act & assert
+    with pytest.raises(ValueError):
+        resumed.run()
+
+
+def test_generator_is_not_a_parameter():
+    # arrange
+    algorithm = create_algorithm("ga", 10, rng=0)
+
+    # act
+    params = algorithm.toolbox_params()
+
+    # assert
+    assert "mate_rng" not in params and "mutate_rng" not in params
+    assert "Generator" not in repr(algorithm)
+
+
+def test_run_error_is_not_replaced_by_write_error(monkeypatch):
+    # arrange
+    class FailingWriter(BackgroundWriter):
+        def __init__(self):
+            super().__init__()
+            self.submit(self.fail)
+
+        @staticmethod
+        def fail():
+            raise OSError("disk full")
+
+    def evaluate(individual):
+        raise ZeroDivisionError
+
+    monkeypatch.setattr(algorithm_base, "BackgroundWriter", FailingWriter)
+    algorithm = create_algorithm("ga", 10, rng=0)
+    algorithm.toolbox.register("evaluate", evaluate)
+
+    # act & assert
+    with pytest.raises(ZeroDivisionError):
+        algorithm.run()
+
+
+def test_threaded_map_keeps_fitness_with_its_individual():
+    # arrange
+    algorithm = create_algorithm("ga", 10, rng=0)
+
+    def evaluate(individual):
+        # later individuals finish first when the results are not kept in order
+        sleep(0.002 * (individual[0] % 3))
+        return (float(individual.sum()), 0.0), individual.copy()
+
+    algorithm.toolbox.register("evaluate", evaluate)
+    population = algorithm.create_population(32)
+    sums = [float(ind.sum()) for ind in population]
+
+    # act
+    with ThreadPool(4) as pool:
+        algorithm.toolbox.register("map", pool.map)
+        algorithm._evaluate(population)
+
+    # assert
+    assert [ind.fitness.values[0] for ind in population] == sums
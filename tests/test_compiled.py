@@ -0,0 +1,56 @@
+import numpy as np
+
+from eaplanner.compiled import BatchEvaluator
+from eaplanner.entities.assignment import Assignment
+from eaplanner.entities.constraint import (
+    DateConstraint,
+    RelationConstraint,
+    ResourceConstraint,
+)
+from eaplanner.entities.enum import DateType, RelationType
+from eaplanner.entities.resource import Resource
+from eaplanner.entities.schedule import Schedule
+from eaplanner.interpreter import AbsoluteScheduleInterpreter
+
+
+def create_schedule(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    assignments = [Assignment(hours=int(rng.integers(1, 40)), id=i) for i in range(n)]
+    constraints = []
+    for i in range(1, n):
+        constraints.append(
+            RelationConstraint(
+                RelationType(int(rng.integers(4))),
+                assignments[int(rng.integers(i))],
+                assignments[i],
+            )
+        )
+    for date_type in DateType:
+        assignment = assignments[int(rng.integers(n))]
+        constraints.append(DateConstraint(date_type, assignment, int(rng.integers(10))))
+    constraints.append(
+        ResourceConstraint(Resource("resource", min_capacity=8), assignments[: n // 2])
+    )
+
+    return Schedule(assignments, constraints)
+
+
+def test_batch_evaluator_matches_interpreter():
+    # arrange
+    schedules = [create_schedule(5, 0), create_schedule(9, 1), create_schedule(3, 2)]
+    evaluator = BatchEvaluator.from_schedules(schedules)
+    rng = np.random.default_rng(0)
+    groups = [
+        (k, rng.uniform(-5, 15, (20, 2 * len(s)))) for k, s in enumerate(schedules)
+    ]
+
+    # act
+    results = evaluator.evaluate_groups(groups)
+
+    # assert
+    for (k, genes), (scores, chromosomes) in zip(groups, results):
+        interpreter = AbsoluteScheduleInterpreter(schedules[k], repair_pct=0)
+        for row, score, chromosome in zip(genes, scores, chromosomes):
+            expected, expected_chromosome = interpreter.interpret_and_get_scores(row)
+            assert tuple(score) == expected
+            assert np.array_equal(chromosome, expected_chromosome)
@@ -0,0 +1,62 @@
+import numpy as np
+
+from eaplanner.compiled import CompiledSchedule
+from eaplanner.cpm import CriticalPath, makespan_lower_bound
+from eaplanner.entities.assignment import Assignment
+from eaplanner.entities.constraint import RelationConstraint, ResourceConstraint
+from eaplanner.entities.enum import RelationType
+from eaplanner.entities.resource import Resource
+from eaplanner.entities.schedule import Schedule
+from eaplanner.sgs import Network
+
+
+def test_critical_path_of_every_relation_type():
+    # arrange
+    a = [Assignment(hours=20, id=0)] + [Assignment(hours=10, id=i) for i in range(1, 5)]
+    schedule = Schedule(
+        a,
+        [
+            RelationConstraint(RelationType.FINISH_TO_START, a[0], a[1]),
+            RelationConstraint(RelationType.START_TO_START, a[0], a[2]),
+            RelationConstraint(RelationType.FINISH_TO_FINISH, a[1], a[3]),
+            # the successor has to finish before the predecessor starts
+            RelationConstraint(RelationType.START_TO_FINISH, a[4], a[2]),
+            ResourceConstraint(Resource(name="resource", min_capacity=10), [a[0]]),
+        ],
+    )
+
+    durations = np.array(Network.compile(schedule).min_duration)
+
+    # act
+    path = CriticalPath.compute(CompiledSchedule.compile(schedule), durations)
+
+    # assert
+    np.testing.assert_array_equal(path.durations, [2, 1, 1, 1, 1])
+    np.testing.assert_array_equal(path.earliest_start, [0, 2, 0, 0, 1])
+    np.testing.assert_array_equal(path.latest_start, [0, 2, 1, 2, 2])
+    np.testing.assert_array_equal(path.slack, [0, 0, 1, 2, 1])
+    assert path.makespan == 3
+    assert makespan_lower_bound(schedule) == 3
+
+
+def test_lower_bound_of_cycles_and_resources():
+    # arrange
+    a = [Assignment(hours=10, id=i) for i in range(3)]
+    schedule = Schedule(
+        a,
+        [
+            RelationConstraint(RelationType.FINISH_TO_START, a[i], a[j])
+            for i, j in [(0, 1), (1, 2), (2, 0)]
+        ]
+        + [ResourceConstraint(Resource(name="resource", min_capacity=10), a)],
+    )
+
+    durations = np.array(Network.compile(schedule).min_duration)
+
+    # act
+    path = CriticalPath.compute(CompiledSchedule.compile(schedule), durations)
+
+    # assert
+    np.testing.assert_array_equal(path.earliest_start, [0, 0, 0])
+    assert makespan_lower_bound(schedule) == 3
+    assert makespan_lower_bound(Schedule()) == 0
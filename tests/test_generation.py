@@ -0,0 +1,57 @@
+from eaplanner.entities.constraint import RelationConstraint
+from eaplanner.generation import ScheduleGenerator
+
+
+def describe(schedule):
+    return (
+        [(a.id, a.hours, a.start, a.duration) for a in schedule.assignments],
+        [
+            (c.type, c.predecessor.id, c.successor.id)
+            for c in schedule.constraints
+            if isinstance(c, RelationConstraint)
+        ],
+    )
+
+
+def test_same_seed_generates_same_schedule():
+    # arrange
+    kwargs = dict(n_assignments=30, k=2, p_date=0.2, seed=3)
+
+    # act
+    first = ScheduleGenerator.generate_random_schedule(**kwargs)
+    second = ScheduleGenerator.generate_random_schedule(**kwargs)
+
+    # assert
+    assert describe(first) == describe(second)
+    assert len(first.constraints) == len(second.constraints)
+
+
+def test_dag_schedule_is_valid():
+    # arrange
+    kwargs = dict(n_assignments=300, k=3, p_date=0.3, seed=5)
+
+    # act
+    schedule = ScheduleGenerator.generate_dag_schedule(**kwargs)
+
+    # assert
+    assert [a.id for a in schedule.assignments] == list(range(300))
+    groups = schedule.get_constraint_per_group()
+    relations = groups["RelationConstraint"]
+    assert all(c.predecessor.id < c.successor.id for c in relations)
+    assert len({(c.predecessor.id, c.successor.id) for c in relations}) == len(relations)
+    assert sum(c.get_penalty() for c in relations + groups["DateConstraint"]) == 0
+    members = [a.id for c in groups["ResourceConstraint"] for a in c.assignments]
+    assert sorted(members) == list(range(300))
+    assert describe(schedule) == describe(
+        ScheduleGenerator.generate_dag_schedule(**kwargs)
+    )
+
+
+def test_dag_schedule_of_tiny_instances():
+    # act
+    empty = ScheduleGenerator.generate_dag_schedule(0, seed=1)
+    single = ScheduleGenerator.generate_dag_schedule(1, seed=1)
+
+    # assert
+    assert len(empty) == 0 and not empty.constraints
+    assert len(single) == 1
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from eaplanner.algorithms.hooks import Hook, PrometheusTextfile
+from tests.test_checkpoint import create_algorithm
+
+
+class Recorder(Hook):
+    def __init__(self, stop_at: int | None = None):
+        self.events = []
+        self.stop_at = stop_at
+
+    def on_start(self, progress):
+        self.events.append(("start", progress.gen))
+
+    def on_generation(self, progress):
+        self.events.append(("generation", progress.gen))
+        return progress.gen == self.stop_at
+
+    def on_evaluate_batch(self, progress):
+        self.events.append(("evaluate", len(progress.fitness)))
+
+    def on_improvement(self, progress):
+        self.events.append(("improvement", progress.gen))
+
+    def on_finish(self, progress):
+        self.events.append(("finish", progress.stop_reason))
+
+
+@pytest.mark.parametrize("name", ["ga", "sa"])
+def test_hooks_receive_every_event(name):
+    # arrange
+    hook = Recorder()
+    algorithm = create_algorithm(name, 60, hooks=[hook])
+
+    # act
+    algorithm.run()
+
+    # assert
+    kinds = [kind for kind, _ in hook.events]
+    assert kinds[0] == "evaluate" and kinds[1] == "start"
+    assert kinds.count("generation") == algorithm.gen
+    assert hook.events[-1] == ("finish", "max_evaluations")
+    evaluated = sum(n for kind, n in hook.events if kind == "evaluate")
+    assert evaluated == algorithm.current_evals
+
+
+def test_hook_can_stop_run():
+    # arrange
+    hook = Recorder(stop_at=3)
+    hook.reason = "recorder"
+    algorithm = create_algorithm("ga", 1000, hooks=[hook])
+
+    # act
+    algorithm.run()
+
+    # assert
+    assert algorithm.gen == 3
+    assert algorithm.stop_reason == "recorder"
+
+
+def test_progress_is_read_only():
+    # arrange
+    class Writer(Hook):
+        def on_generation(self, progress):
+            progress.fitness[0, 0] = -1
+
+    algorithm = create_algorithm("ga", 40, hooks=[Writer()])
+
+    # act / assert
+    with pytest.raises(ValueError):
+        algorithm.run()
+
+
+def test_prometheus_textfile(tmp_path):
+    # arrange
+    path = tmp_path / "metrics.prom"
+    algorithm = create_algorithm("ga", 40, hooks=[PrometheusTextfile(path)])
+
+    # act
+    algorithm.run()
+
+    # assert
+    lines = path.read_text().splitlines()
+    values = {
+        line.split("{")[0]: float(line.split()[-1])
+        for line in lines
+        if not line.startswith("#")
+    }
+    assert values["eaplanner_evaluations"] == algorithm.current_evals
+    assert values["eaplanner_running"] == 0
+    assert np.isfinite(values["eaplanner_phase_seconds_total"])
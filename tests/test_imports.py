@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+PLOTTING_MODULES = ["matplotlib", "seaborn", "networkx", "sklearn", "tqdm", "pandas"]
+
+
+def imported_modules(*modules: str) -> set[str]:
+    code = (
+        "import sys\n"
+        + "".join(f"import {m}\n" for m in modules)
+        + "print(' '.join(sys.modules))"
+    )
+    # a fresh interpreter, the test session itself has imported everything
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "eaplanner.entities",
+        "eaplanner.interpreter",
+        "eaplanner.compiled",
+        "eaplanner.cpm",
+        "eaplanner.algorithms.ga",
+        "eaplanner.algorithms.ppa",
+        "eaplanner.algorithms.pso",
+        "eaplanner.algorithms.local",
+        "eaplanner.algorithms.batch",
+        "eaplanner.algorithms.island",
+    ],
+)
+def test_core_does_not_import_plotting_libraries(module):
+    # act
+    modules = imported_modules(module)
+
+    # assert
+    assert module.split(".")[0] in modules
+    assert modules.isdisjoint(PLOTTING_MODULES)
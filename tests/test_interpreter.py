@@ -1,8 +1,10 @@
-from eaplanner.interpreter import AbsoluteScheduleInterpreter
+from eaplanner.generation import ScheduleGenerator
+from eaplanner.interpreter import INTERPRETERS, AbsoluteScheduleInterpreter
 
 from eaplanner.entities.schedule import Schedule
 from eaplanner.entities.assignment import Assignment
 import numpy as np
+import pytest
 
 
 def test_absolute_interpret():
@@ -28,3 +30,40 @@ def test_absolute_interpret():
     assert assignments[2].duration == 1
     assert schedule.get_total_makespan() == 10
     assert schedule.get_total_penalty() == 0
+
+
+@pytest.mark.parametrize("name", ["serial", "parallel"])
+def test_schedule_generation_interpret_without_penalty(name):
+    # arrange
+    schedule = ScheduleGenerator.generate_dag_schedule(100, k=3, p_date=0, seed=2)
+    interpreter = INTERPRETERS[name](schedule, repair_pct=0)
+    chromosome = np.random.default_rng(2).integers(-50, 50, 200).astype(np.float64)
+
+    # act
+    (penalty, makespan), decoded = interpreter.interpret_and_get_scores(chromosome)
+
+    # assert
+    assert penalty == 0
+    assert min(a.start for a in schedule.assignments) == 0
+    assert all(decoded[1::2] >= np.maximum(chromosome[1::2], 1))
+    # decoding the starts as priorities gives the same schedule
+    assert interpreter.interpret_and_get_scores(decoded)[0] == (penalty, makespan)
+
+
+def test_repair_draws_from_interpreter_rng():
+    # arrange
+    chromosome = np.random.default_rng(3).integers(-50, 50, 200).astype(np.float64)
+    interpreters = [
+        AbsoluteScheduleInterpreter(
+            ScheduleGenerator.generate_dag_schedule(100, k=3, p_date=0, seed=3),
+            rng=np.random.default_rng(7),
+        )
+        for _ in range(2)
+    ]
+
+    # act
+    results = [i.interpret_and_get_scores(chromosome) for i in interpreters]
+
+    # assert
+    assert results[0][0] == results[1][0]
+    assert np.array_equal(results[0][1], results[1][1])
@@ -0,0 +1,62 @@
+import queue
+from functools import partial
+from types import SimpleNamespace
+
+from eaplanner.algorithms.island import IslandModel, Migration
+from eaplanner.manifest import RunManifest
+from tests.test_checkpoint import create_algorithm
+from tests.test_termination import create_population
+
+
+def create_island(index: int, rng, **kwargs):
+    return create_algorithm("ga", 0, rng=rng, **kwargs)
+
+
+def test_migration_replaces_worst_individuals():
+    # arrange
+    inboxes = [queue.Queue(), queue.Queue()]
+    source = Migration(0, inboxes, interval=1, migrants=1)
+    target = Migration(1, inboxes, interval=1, migrants=1)
+    algorithm = SimpleNamespace(gen=1)
+    population_0 = create_population((0, 10), (5, 10))
+    population_1 = create_population((3, 10), (9, 10))
+
+    # act
+    source.migrate(algorithm, population_0)
+    target.migrate(algorithm, population_1)
+
+    # assert
+    assert [ind.fitness.values for ind in population_1] == [(3, 10), (0, 10)]
+    assert inboxes[0].qsize() == 1
+
+
+def test_island_model_shares_the_evaluation_budget(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    model = IslandModel(create_island, islands=2, max_evaluations=200, interval=1, seed=0)
+
+    # act
+    results = model.run()
+    genes, fitness = model.best(results)
+
+    # assert
+    assert len(results) == 2
+    assert 200 <= model.evaluations <= 200 + 2 * 8
+    assert model.evaluations == sum(r.evaluations for r in results)
+    assert all(r.stop_reason == "global_evaluations" for r in results)
+    assert len(genes) == 8
+
+
+def test_island_records_are_not_runs_of_the_task(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    manifest = tmp_path / "manifest.sqlite"
+    factory = partial(create_island, save=True, manifest=manifest, task="ga/a/b")
+    model = IslandModel(factory, islands=2, max_evaluations=100, seed=0)
+
+    # act
+    model.run()
+
+    # assert
+    tasks = RunManifest(manifest).completed_tasks()
+    assert tasks == {"ga/a/b/island_0": 1, "ga/a/b/island_1": 1}
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from eaplanner.logbook import Logbook
+
+
+def record_generations(logbook: Logbook, n: int):
+    for gen in range(n):
+        logbook.record(
+            gen=gen,
+            nevals=10,
+            time=gen / 10,
+            avg=[gen + 0.5, 1.0],
+            min=[gen, 0.0],
+            max=[gen + 1, 2.0],
+            std=[0.1, 0.2],
+        )
+
+
+def test_logbook_grows_beyond_capacity():
+    # arrange
+    logbook = Logbook(["penalty", "makespan"], capacity=2)
+
+    # act
+    record_generations(logbook, 5)
+
+    # assert
+    assert len(logbook) == 5
+    assert logbook.column("gen").tolist() == [0, 1, 2, 3, 4]
+    assert logbook.select("min").tolist() == [[i, 0.0] for i in range(5)]
+
+
+def test_logbook_csv_round_trip(tmp_path):
+    # arrange
+    logbook = Logbook(["penalty", "makespan"])
+    record_generations(logbook, 3)
+
+    # act
+    logbook.save(tmp_path / "logbook.csv")
+    df = pd.read_csv(tmp_path / "logbook.csv")
+
+    # assert
+    assert list(df.columns) == logbook.header
+    assert logbook.header[:4] == ["gen", "nevals", "avg_penalty", "avg_makespan"]
+    assert np.array_equal(df["avg_penalty"], logbook.column("avg_penalty"))
+    assert np.array_equal(df["time"], logbook.column("time"))
+
+
+def test_logbook_streams_new_rows_only():
+    # arrange
+    logbook = Logbook(["penalty"])
+    record_generations(logbook, 2)
+
+    # act
+    first = logbook.stream
+    record_generations(logbook, 1)
+    second = logbook.stream
+
+    # assert
+    assert first.splitlines()[0].startswith("gen\tnevals")
+    assert len(first.splitlines()) == 3
+    assert len(second.splitlines()) == 1
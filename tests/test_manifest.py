@@ -0,0 +1,73 @@
+import sqlite3
+
+from eaplanner.manifest import RunManifest
+
+
+def test_manifest_append_and_replace(tmp_path):
+    # arrange
+    manifest = RunManifest(tmp_path / "results" / "manifest.sqlite")
+    record = {
+        "folder": tmp_path / "results" / "schedule_1" / "run",
+        "instance": "schedule_1",
+        "algorithm": "MuPlusLambda",
+        "parameters": {"mu": 10, "repair_pct": 1.0},
+        "solution_penalty": 3,
+        "unknown_column": "ignored",
+    }
+
+    # act
+    manifest.append(record)
+    manifest.append({**record, "solution_penalty": 0})
+
+    # assert
+    records = manifest.records()
+    assert len(manifest) == 1
+    assert records[0]["folder"] == "schedule_1/run"
+    assert records[0]["solution_penalty"] == 0
+    assert manifest.folders() == {"schedule_1/run"}
+
+
+def test_manifest_to_dataframe(tmp_path):
+    # arrange
+    manifest = RunManifest(tmp_path / "manifest.sqlite")
+    manifest.append({"folder": tmp_path / "a", "parameters": {"mu": 10}})
+    manifest.append({"folder": tmp_path / "b", "parameters": {"mu": 20}})
+
+    # act
+    df = manifest.to_dataframe(expand_parameters=True)
+
+    # assert
+    assert sorted(df["mu"].tolist()) == [10, 20]
+    assert "parameters" not in df.columns
+
+
+def test_manifest_completed_tasks(tmp_path):
+    # arrange
+    manifest = RunManifest(tmp_path / "manifest.sqlite")
+    manifest.append({"folder": tmp_path / "a", "task": "ga/schedule_1/abc"})
+    manifest.append({"folder": tmp_path / "b", "task": "ga/schedule_1/abc"})
+    manifest.append({"folder": tmp_path / "c", "task": "ga/schedule_10/abc"})
+    manifest.append({"folder": tmp_path / "d"})
+
+    # act
+    completed = manifest.completed_tasks()
+
+    # assert
+    assert completed["ga/schedule_1/abc"] == 2
+    assert completed["ga/schedule_10/abc"] == 1
+    assert completed["ga/schedule_100/abc"] == 0
+
+
+def test_manifest_adds_missing_columns(tmp_path):
+    # arrange
+    path = tmp_path / "manifest.sqlite"
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE runs (folder TEXT PRIMARY KEY, instance TEXT)")
+    con.close()
+
+    # act
+    manifest = RunManifest(path)
+    manifest.append({"folder": tmp_path / "a", "task": "ga/schedule_1/abc"})
+
+    # assert
+    assert manifest.records()[0]["task"] == "ga/schedule_1/abc"
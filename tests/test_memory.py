@@ -0,0 +1,32 @@
+import csv
+import tracemalloc
+
+from tests.test_checkpoint import create_algorithm
+
+
+def test_memory_timeline_is_written(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    algorithm = create_algorithm("ga", 80, save=True, memory_every=2)
+
+    # act
+    algorithm.run()
+
+    # assert
+    with open(algorithm.folder / "memory.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [int(r["gen"]) for r in rows] == list(range(0, algorithm.gen + 1, 2))
+    assert all(int(r["rss"]) > 0 and int(r["population"]) > 0 for r in rows)
+    assert (algorithm.folder / "memory_sites.csv").exists()
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_is_not_profiled_by_default():
+    # arrange
+    algorithm = create_algorithm("ga", 40)
+
+    # act
+    algorithm.run()
+
+    # assert
+    assert algorithm.memory is None
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from eaplanner.entities.constraint import DateConstraint
+from eaplanner.generation import ScheduleGenerator
+from eaplanner.parity import RUST_BINARY, check_parity, parity_schedule
+
+
+def test_python_engines_agree(tmp_path):
+    # arrange
+    schedule = ScheduleGenerator.generate_random_schedule(30, p_date=0.5, seed=4)
+
+    # act
+    result = check_parity(schedule, "n_30", tmp_path, count=50, rng=4)
+
+    # assert
+    assert result.ok
+    assert set(result.rates) == {"python", "batch"}
+    assert any(isinstance(c, DateConstraint) for c in schedule.constraints)
+    assert not any(
+        isinstance(c, DateConstraint) for c in parity_schedule(schedule).constraints
+    )
+
+
+@pytest.mark.skipif(not RUST_BINARY.exists(), reason="eaplanner-rs is not built")
+def test_rust_agrees_with_python(tmp_path):
+    # arrange
+    schedule = ScheduleGenerator.generate_random_schedule(30, seed=4)
+
+    # act
+    result = check_parity(
+        schedule, "n_30", tmp_path, count=50, binary=RUST_BINARY, rng=4
+    )
+
+    # assert
+    assert result.mismatches["rust"] == []
+    assert np.isfinite(result.rates["rust"])
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from eaplanner.benchmark import (
+    benchmark_kernels,
+    calibrate,
+    create_baseline,
+    find_regressions,
+)
+
+BASELINE = Path(__file__).parent.parent / "benchmarks" / "baseline.json"
+CACHE = Path(__file__).parent.parent / "benchmarks" / "instances"
+
+
+@pytest.mark.perf
+def test_kernels_do_not_regress(request):
+    # arrange
+    calibration = calibrate()
+    results = benchmark_kernels(cache=CACHE)
+
+    if request.config.getoption("--perf-update"):
+        BASELINE.parent.mkdir(parents=True, exist_ok=True)
+        baseline = create_baseline(results, calibration)
+        BASELINE.write_text(json.dumps(baseline, indent=2) + "\n")
+        pytest.skip(f"baseline written to {BASELINE}")
+
+    baseline = json.loads(BASELINE.read_text())
+    tolerance = request.config.getoption("--perf-tolerance")
+
+    # act
+    regressions = find_regressions(results, calibration, baseline, tolerance)
+    if regressions:
+        # measure the suspects once more, a busy machine slows down single kernels
+        suspects = {r.key for r in regressions}
+        calibration = calibrate()
+        results = [m for m in benchmark_kernels(cache=CACHE) if m.key in suspects]
+        regressions = find_regressions(results, calibration, baseline, tolerance)
+
+    # assert
+    assert not regressions, "\n".join(
+        f"{r.key} is {r.slowdown:.2f}x slower than the baseline, "
+        f"{r.allowed:.2f}x is allowed"
+        for r in regressions
+    )
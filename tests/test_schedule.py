@@ -1,6 +1,10 @@
+import numpy as np
+
 from eaplanner.entities.enum import RelationType
+from eaplanner.entities.resource import Resource
 from eaplanner.entities.schedule import Assignment, Schedule
-from eaplanner.entities.constraint import RelationConstraint
+from eaplanner.entities.constraint import RelationConstraint, ResourceConstraint
+from eaplanner.generation import ScheduleGenerator
 
 
 def test_schedule_total_duration():
@@ -108,3 +112,69 @@ def test_schedule_total_penalty_empty():
     # assert
     assert schedule.get_total_makespan() == 10
     assert schedule.get_total_penalty() == 0
+
+
+def test_schedule_npz_round_trip(tmp_path):
+    # arrange
+    schedule = ScheduleGenerator.generate_dag_schedule(50, p_date=0.5, seed=1)
+    path = tmp_path / "schedule.npz"
+
+    # act
+    schedule.save_npz(path)
+    loaded = Schedule.load(path)
+
+    # assert
+    def rows(s):
+        return [c.to_csv_row() for c in s.assignments + s.constraints]
+
+    assert rows(loaded) == rows(schedule)
+    assert loaded.get_total_penalty() == schedule.get_total_penalty()
+    assert [c.resource.total_capacity for c in loaded.constraints[-3:]] == [
+        c.resource.total_capacity for c in schedule.constraints[-3:]
+    ]
+
+
+def test_schedule_npz_keeps_constraint_order(tmp_path):
+    # arrange
+    schedule = ScheduleGenerator.generate_dag_schedule(50, p_date=0.5, seed=1)
+    rng = np.random.default_rng(1)
+    schedule.constraints = [
+        schedule.constraints[i] for i in rng.permutation(len(schedule.constraints))
+    ]
+    for a in schedule.assignments:
+        a.start = int(rng.integers(0, 20))
+    path = tmp_path / "schedule.npz"
+
+    # act
+    schedule.save_npz(path)
+    loaded = Schedule.load(path)
+    schedule.repair_constraints(rng=np.random.default_rng(2))
+    loaded.repair_constraints(rng=np.random.default_rng(2))
+
+    # assert
+    assert [type(c) for c in loaded.constraints] == [
+        type(c) for c in schedule.constraints
+    ]
+    assert [a.start for a in loaded.assignments] == [
+        a.start for a in schedule.assignments
+    ]
+
+
+def test_schedule_npz_keeps_the_day_of_resources(tmp_path):
+    # arrange
+    assignments = [Assignment(hours=10, id=0)]
+    schedule = Schedule(
+        assignments,
+        [
+            ResourceConstraint(Resource("all days", 5), assignments),
+            ResourceConstraint(Resource("one day", 5, day=3), assignments),
+        ],
+    )
+    path = tmp_path / "schedule.npz"
+
+    # act
+    schedule.save_npz(path)
+    loaded = Schedule.load(path)
+
+    # assert
+    assert [c.resource.day for c in loaded.constraints] == [None, 3]
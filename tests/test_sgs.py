@@ -0,0 +1,154 @@
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from eaplanner.entities.assignment import Assignment
+from eaplanner.entities.constraint import (
+    DateConstraint,
+    RelationConstraint,
+    ResourceConstraint,
+)
+from eaplanner.entities.enum import DateType, RelationType
+from eaplanner.entities.resource import Resource
+from eaplanner.entities.schedule import Schedule
+from eaplanner.generation import ScheduleGenerator
+from eaplanner.sgs import (
+    DemandQueue,
+    Network,
+    ResourceProfile,
+    parallel_sgs,
+    serial_sgs,
+)
+
+
+def test_resource_profile_finds_the_first_gap():
+    # arrange
+    profile = ResourceProfile(10)
+    profile.add(0, 2, 6)
+    profile.add(3, 5, 8)
+
+    # act
+    fits = [profile.earliest(0, 1, 4), profile.earliest(0, 2, 4)]
+    fits += [profile.earliest(1, 2, 5), profile.earliest(0, 1, 11)]
+
+    # assert
+    assert fits == [0, 0, 5, 0]
+    assert profile.times == [0, 2, 3, 5]
+    assert profile.usage == [6, 0, 8, 0]
+
+
+def test_demand_queue_gives_the_first_that_fits():
+    # arrange
+    queue = DemandQueue()
+    queue.push(5, 0.0, 0)
+    queue.push(2, 3.0, 1)
+    queue.push(2, 1.0, 2)
+
+    # act
+    fits = [queue.first(1), queue.first(4), queue.first(5)]
+    queue.pop(5)
+
+    # assert
+    assert fits == [None, ((1.0, 2), 2), ((0.0, 0), 5)]
+    assert queue.demands == [2]
+
+
+@pytest.mark.parametrize(
+    "scheme, expected", [(serial_sgs, [0, 2, 5, 3]), (parallel_sgs, [0, 3, 3, 1])]
+)
+def test_sgs_meets_relations_resources_and_dates(scheme, expected):
+    # arrange
+    assignments = [Assignment(hours=10, id=i) for i in range(4)]
+    resource = Resource(name="resource", min_capacity=10)
+    schedule = Schedule(
+        assignments,
+        [
+            RelationConstraint(
+                RelationType.FINISH_TO_START, assignments[0], assignments[1]
+            ),
+            # the successor has to finish before the predecessor starts
+            RelationConstraint(
+                RelationType.START_TO_FINISH, assignments[2], assignments[3]
+            ),
+            ResourceConstraint(resource, [assignments[1], assignments[3]]),
+            DateConstraint(DateType.START_NO_EARLIER_THAN, assignments[3], 1),
+        ],
+    )
+    network = Network.compile(schedule)
+
+    # act
+    starts = scheme(network, [0, 0, 0, 0], [2, 1, 1, 2])
+
+    # assert
+    assert starts == expected
+    for assignment, start, duration in zip(assignments, starts, [2, 1, 1, 2]):
+        assignment.set(start, duration)
+    assert schedule.get_total_penalty() == 0
+
+
+@pytest.mark.parametrize("scheme", [serial_sgs, parallel_sgs])
+def test_sgs_breaks_cycles_at_the_lowest_priority(scheme):
+    # arrange
+    assignments = [Assignment(hours=1, id=i) for i in range(3)]
+    schedule = Schedule(
+        assignments,
+        [
+            RelationConstraint(
+                RelationType.FINISH_TO_START, assignments[i], assignments[j]
+            )
+            for i, j in [(0, 1), (1, 2), (2, 0)]
+        ],
+    )
+
+    # act
+    starts = scheme(Network.compile(schedule), [3, 1, 2], [1, 1, 1])
+
+    # assert
+    assert starts == [2, 0, 1]
+
+
+def test_parallel_sgs_starts_what_fits_at_each_event():
+    # arrange
+    assignments = [Assignment(hours=10, id=0), Assignment(hours=20, id=1)]
+    resource = Resource(name="resource", min_capacity=10)
+    schedule = Schedule(
+        assignments,
+        [
+            ResourceConstraint(resource, assignments),
+            DateConstraint(DateType.START_NO_EARLIER_THAN, assignments[0], 1),
+        ],
+    )
+    network = Network.compile(schedule)
+
+    # act
+    serial = serial_sgs(network, [0, 1], [1, 2])
+    parallel = parallel_sgs(network, [0, 1], [1, 2])
+
+    # assert
+    assert serial == [1, 2]
+    assert parallel == [2, 0]
+
+
+def test_parallel_sgs_does_not_retry_blocked_assignments_at_every_event():
+    # arrange
+    def decode_seconds(n):
+        schedule = ScheduleGenerator.generate_dag_schedule(n, k=3, p_date=0, seed=1)
+        network = Network.compile(schedule)
+        rng = np.random.default_rng(0)
+        priorities = rng.uniform(-50, 50, n).tolist()
+        durations = np.maximum(rng.integers(1, 10, n), network.min_duration)
+
+        seconds = []
+        for _ in range(3):
+            start = perf_counter()
+            parallel_sgs(network, priorities, durations.tolist())
+            seconds.append(perf_counter() - start)
+        return min(seconds)
+
+    # act
+    small, large = decode_seconds(2000), decode_seconds(16000)
+
+    # assert, eight times the assignments would take 64 times as long if the
+    # blocked assignments were retried at every event
+    assert large / small < 32
@@ -0,0 +1,81 @@
+import json
+import random
+from types import SimpleNamespace
+
+import numpy as np
+from deap import creator
+
+from eaplanner.algorithms.termination import LowerBound, Patience, TargetFitness
+from tests.test_checkpoint import create_algorithm
+
+
+def create_population(*values):
+    population = []
+    for v in values:
+        ind = creator.Individual(np.zeros(2))  # type: ignore
+        ind.fitness.values = v
+        population.append(ind)
+    return population
+
+
+def test_patience_counts_generations_without_improvement():
+    # arrange
+    patience = Patience(2)
+    algorithm = SimpleNamespace(gen=0)
+    populations = [
+        create_population((5, 10)),
+        create_population((4, 10)),
+        create_population((4, 10)),
+        create_population((4, 11)),
+    ]
+
+    # act
+    stops = []
+    for gen, population in enumerate(populations):
+        algorithm.gen = gen
+        stops.append(patience.should_stop(algorithm, population))
+    repeated = patience.should_stop(algorithm, populations[-1])
+
+    # assert
+    assert stops == [False, False, False, True]
+    assert repeated
+
+
+def test_target_fitness_is_lexicographic():
+    # arrange
+    target = TargetFitness((0, 100))
+    algorithm = SimpleNamespace(gen=0)
+
+    # act & assert
+    assert not target.should_stop(algorithm, create_population((1, 50)))
+    assert not target.should_stop(algorithm, create_population((0, 101)))
+    assert target.should_stop(algorithm, create_population((1, 50), (0, 100)))
+
+
+def test_lower_bound_needs_a_solution_without_penalty():
+    # arrange
+    bound = LowerBound(12)
+    algorithm = SimpleNamespace(gen=0)
+
+    # act & assert
+    assert not bound.should_stop(algorithm, create_population((1, 12), (0, 13)))
+    assert bound.should_stop(algorithm, create_population((0, 12)))
+    assert bound.reason == "lower_bound"
+
+
+def test_stop_reason_is_saved(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    random.seed(0)
+    np.random.seed(0)
+    algorithm = create_algorithm(
+        "ga", 100000, save=True, termination=[Patience(3)]
+    )
+
+    # act
+    algorithm.run()
+
+    # assert
+    solution = json.loads((algorithm.folder / "solution.json").read_text())
+    assert algorithm.current_evals < 100000
+    assert solution["stop_reason"] == "patience"
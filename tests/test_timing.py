@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from eaplanner.timing import PHASES, PhaseTimer
+from tests.test_checkpoint import create_algorithm
+
+
+def test_phase_timer_laps():
+    # arrange
+    timer = PhaseTimer(("a", "b"))
+    timer.add("a", 2_000_000_000)
+
+    # act
+    first = timer.lap()
+    timer.add("b", 500_000_000)
+    second = timer.lap()
+
+    # assert
+    assert first == {"time_a": 2.0, "time_b": 0.0}
+    assert second == {"time_a": 0.0, "time_b": 0.5}
+    assert timer.summary() == {"a": 2.0, "b": 0.5}
+
+
+@pytest.mark.parametrize("name", ["ga", "sa", "pso"])
+def test_phase_times_are_recorded(tmp_path, monkeypatch, name):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    algorithm = create_algorithm(name, 100, save=True, repair_pct=1.0)
+
+    # act
+    _, logbook = algorithm.run()
+
+    # assert
+    for phase in ("variation", "evaluation", "repair", "selection", "stats"):
+        assert logbook.column(f"time_{phase}")[1:].sum() > 0
+    solution = json.loads((algorithm.folder / "solution.json").read_text())
+    assert set(solution["phase_times"]) == set(PHASES)
+    assert solution["phase_times"]["evaluation"] == pytest.approx(
+        logbook.column("time_evaluation").sum(), abs=1e-6
+    )
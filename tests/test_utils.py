@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from deap import base, creator
+
+from eaplanner.utils import isolated_creator, spawn_rng, thread_pool
+
+
+def test_isolated_creator_restores_classes():
+    # arrange
+    creator.create("IsolatedFitness", base.Fitness, weights=(-1,))
+    original = creator.IsolatedFitness  # type: ignore
+
+    # act
+    with isolated_creator():
+        with pytest.warns(RuntimeWarning):
+            creator.create("IsolatedFitness", base.Fitness, weights=(1,))
+        creator.create("IsolatedIndividual", list, fitness=creator.IsolatedFitness)  # type: ignore
+        inside = creator.IsolatedFitness.weights  # type: ignore
+
+    # assert
+    assert inside == (1,)
+    assert creator.IsolatedFitness is original  # type: ignore
+    assert not hasattr(creator, "IsolatedIndividual")
+    del creator.IsolatedFitness  # type: ignore
+
+
+def test_spawn_rng_is_reproducible_and_independent():
+    # arrange
+    first = spawn_rng(42, 3)
+    second = spawn_rng(42, 3)
+
+    # act
+    draws = [rng.integers(1000000, size=4) for rng in first]
+    repeated = [rng.integers(1000000, size=4) for rng in second]
+
+    # assert
+    np.testing.assert_array_equal(draws, repeated)
+    assert len({tuple(d) for d in draws}) == 3
+
+
+def test_thread_pool_is_shared_by_runs():
+    # arrange
+    pool = thread_pool()
+
+    # act
+    squares = thread_pool().map(lambda x: x * x, range(4))
+
+    # assert
+    assert thread_pool() is pool
+    assert squares == [0, 1, 4, 9]
@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from eaplanner.writer import BackgroundWriter
+
+
+def test_background_writer_keeps_order():
+    # arrange
+    writer = BackgroundWriter(maxsize=2)
+    written = []
+
+    # act
+    for i in range(100):
+        writer.submit(written.append, i)
+    writer.close()
+
+    # assert
+    assert written == list(range(100))
+
+
+def test_background_writer_blocks_when_full():
+    # arrange
+    writer = BackgroundWriter(maxsize=1)
+    release = threading.Event()
+    writer.submit(release.wait)
+    writer.submit(lambda: None)
+
+    # act
+    submitter = threading.Thread(target=writer.submit, args=(lambda: None,))
+    submitter.start()
+    submitter.join(timeout=0.1)
+    blocked = submitter.is_alive()
+    release.set()
+    submitter.join()
+    writer.close()
+
+    # assert
+    assert blocked
+
+
+def test_background_writer_raises_errors():
+    # arrange
+    writer = BackgroundWriter()
+
+    def fail():
+        raise OSError("disk full")
+
+    # act
+    writer.submit(fail)
+
+    # assert
+    with pytest.raises(RuntimeError):
+        writer.flush()
+
+
+def test_background_writer_drops_writes_after_error():
+    # arrange
+    writer = BackgroundWriter()
+    release = threading.Event()
+    written = []
+
+    def fail():
+        raise OSError("disk full")
+
+    # act
+    writer.submit(release.wait)
+    writer.submit(fail)
+    writer.submit(written.append, 1)
+    release.set()
+
+    # assert
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    with pytest.raises(RuntimeError):
+        writer.submit(written.append, 2)
+    writer.close(raise_errors=False)
+    assert written == []